@@ -1,104 +1,349 @@
-from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
-from typing import List, Optional
-from datetime import date
+from fastapi import APIRouter, HTTPException, Depends, Header, Query, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from typing import List, Literal, Optional, Union
+from datetime import date, datetime
 from decimal import Decimal
+from uuid import UUID
 from pydantic import BaseModel
-from ..db.database import get_db
+from ..core.config import settings
+from ..core.conditional import if_match_fails, is_not_modified, version_etag, version_headers
+from ..core.fast_json import rows_response
+from ..core.fieldsets import InvalidFieldsError, parse_fields, select_columns, selectable_fields, sparse_response
+from ..core.pagination import InvalidCursorError, NEXT_CURSOR_HEADER, apply_page, next_cursor
+from ..db.database import get_async_db
+from ..db.loading import register_profiles, with_profile
+from ..db.versions import count_and_latest
+from ..db.writes import commit_and_load_async, delete_by_id, update_by_id
+from ..models.client import Client as ClientModel
 from ..models.contract import Contract as ContractModel
+from ..models.document import Document as DocumentModel
+from ..models.expense import Expense as ExpenseModel
+from ..models.labor_cost import LaborCost as LaborCostModel
+from ..models.revenue import Revenue as RevenueModel
+from ..models.user import User as UserModel
+from ..services.bulk import BulkRequest, BulkResult, apply_bulk
 
 router = APIRouter()
 
 class ContractBase(BaseModel):
+    contract_number: str
+    client_id: UUID
     project_name: str
     contract_amount: Decimal
-    contract_date: date
-    vendor_id: str
-    status: str = "진행중"
-    start_date: Optional[date] = None
+    start_date: date
     end_date: Optional[date] = None
-    documents: Optional[dict] = None
-    checklist: Optional[dict] = None
+    status: str = "진행중"
+    contract_type: str
+    created_by: UUID
 
 class ContractCreate(ContractBase):
     pass
 
+class ContractUpdate(BaseModel):
+    contract_number: Optional[str] = None
+    client_id: Optional[UUID] = None
+    project_name: Optional[str] = None
+    contract_amount: Optional[Decimal] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    status: Optional[str] = None
+    contract_type: Optional[str] = None
+
 class Contract(ContractBase):
-    id: str
-    created_at: date
-    updated_at: date
+    id: UUID
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class ClientSummary(BaseModel):
+    id: UUID
+    company_name: str
+
+    class Config:
+        from_attributes = True
+
+class ClientDetail(ClientSummary):
+    business_number: Optional[str] = None
+    representative_name: Optional[str] = None
+    contact_person: Optional[str] = None
+    phone: Optional[str] = None
+
+class UserSummary(BaseModel):
+    id: UUID
+    full_name: str
+    email: str
 
     class Config:
         from_attributes = True
 
+class DocumentSummary(BaseModel):
+    id: UUID
+    document_type: str
+    file_name: str
+    file_size: int
+    mime_type: str
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class LaborCostEntry(BaseModel):
+    id: UUID
+    worker_id: UUID
+    work_date: date
+    total_amount: Decimal
+    payment_status: str
+
+    class Config:
+        from_attributes = True
+
+class RevenueEntry(BaseModel):
+    id: UUID
+    payment_date: date
+    amount: Decimal
+    payment_type: str
+    status: str
+
+    class Config:
+        from_attributes = True
+
+class ExpenseEntry(BaseModel):
+    id: UUID
+    expense_date: date
+    category: str
+    amount: Decimal
+    payment_status: str
+
+    class Config:
+        from_attributes = True
+
+class ContractListItem(Contract):
+    client: ClientSummary
+
+class ContractDetail(Contract):
+    client: ClientDetail
+    creator: UserSummary
+    documents: List[DocumentSummary]
+
+class ContractFinancial(Contract):
+    labor_costs: List[LaborCostEntry]
+    revenues: List[RevenueEntry]
+    expenses: List[ExpenseEntry]
+
+# 응답 스키마별 관계 로딩 (단건 관계는 JOIN, 목록 관계는 계약 id 묶음으로 한 번에 SELECT ... IN)
+register_profiles(
+    ContractModel,
+    list=(
+        joinedload(ContractModel.client).load_only(ClientModel.company_name, raiseload=True),
+    ),
+    detail=(
+        joinedload(ContractModel.client).load_only(
+            ClientModel.company_name, ClientModel.business_number, ClientModel.representative_name,
+            ClientModel.contact_person, ClientModel.phone, raiseload=True),
+        joinedload(ContractModel.creator).load_only(UserModel.full_name, UserModel.email, raiseload=True),
+        selectinload(ContractModel.documents).load_only(
+            DocumentModel.document_type, DocumentModel.file_name, DocumentModel.file_size,
+            DocumentModel.mime_type, DocumentModel.created_at, raiseload=True),
+    ),
+    financial=(
+        selectinload(ContractModel.labor_costs).load_only(
+            LaborCostModel.worker_id, LaborCostModel.work_date, LaborCostModel.total_amount,
+            LaborCostModel.payment_status, raiseload=True),
+        selectinload(ContractModel.revenues).load_only(
+            RevenueModel.payment_date, RevenueModel.amount, RevenueModel.payment_type, RevenueModel.status,
+            raiseload=True),
+        selectinload(ContractModel.expenses).load_only(
+            ExpenseModel.expense_date, ExpenseModel.category, ExpenseModel.amount, ExpenseModel.payment_status,
+            raiseload=True),
+    ),
+)
+CONTRACT_DETAIL_SCHEMAS = {"detail": ContractDetail, "financial": ContractFinancial}
+
+# FAST_JSON_RESPONSES: 목록을 열 튜플로 읽어 검증 없이 직렬화 (발주처는 JOIN 한 열을 중첩 키로)
+CONTRACT_LIST_KEYS = selectable_fields(ContractListItem, ContractModel) + ("client.id", "client.company_name")
+CONTRACT_LIST_COLUMNS = (
+    *(getattr(ContractModel, name) for name in selectable_fields(ContractListItem, ContractModel)),
+    ClientModel.id.label("client_id_"),
+    ClientModel.company_name,
+)
+
+async def _get_contract_version(db: AsyncSession, contract_id: UUID):
+    """
+    계약 상세의 버전 값 (모든 프로필의 관계 포함, 계약이 없으면 None)
+    프로필마다 ETag가 같으므로 어느 프로필로 받은 ETag든 If-Match에 쓸 수 있습니다.
+    """
+    stmt = (
+        select(
+            ContractModel.updated_at, ClientModel.updated_at, UserModel.updated_at,
+            *count_and_latest(DocumentModel, DocumentModel.contract_id == ContractModel.id),
+            *count_and_latest(LaborCostModel, LaborCostModel.contract_id == ContractModel.id),
+            *count_and_latest(RevenueModel, RevenueModel.contract_id == ContractModel.id),
+            *count_and_latest(ExpenseModel, ExpenseModel.contract_id == ContractModel.id),
+        )
+        .join(ContractModel.client)
+        .outerjoin(ContractModel.creator)
+        .where(ContractModel.id == contract_id)
+    )
+    return (await db.execute(stmt)).first()
+
+async def _get_contract_or_404(db: AsyncSession, contract_id: UUID, profile: str) -> ContractModel:
+    stmt = with_profile(select(ContractModel).where(ContractModel.id == contract_id), ContractModel, profile)
+    contract = (await db.execute(stmt)).scalar_one_or_none()
+    if not contract:
+        raise HTTPException(status_code=404, detail="계약을 찾을 수 없습니다.")
+    return contract
+
 @router.post("/", response_model=Contract)
-async def create_contract(contract: ContractCreate, db: Session = Depends(get_db)):
+async def create_contract(contract: ContractCreate, db: AsyncSession = Depends(get_async_db)):
     """새 계약을 생성합니다."""
     try:
         db_contract = ContractModel(**contract.dict())
         db.add(db_contract)
-        db.commit()
-        db.refresh(db_contract)
-        return db_contract
+        return await commit_and_load_async(db, db_contract)
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=400, detail=f"계약 생성 실패: {str(e)}")
 
-@router.get("/", response_model=List[Contract])
-async def get_contracts(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """계약 목록을 조회합니다."""
+@router.post("/bulk", response_model=BulkResult)
+async def bulk_contracts(
+    request: BulkRequest,
+    chunk_size: Optional[int] = Query(None, ge=1),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    계약을 일괄 생성/수정/삭제합니다.
+    하나의 트랜잭션에서 청크 단위 다중 행 문장으로 처리하며, 실패한 항목은 errors로 반환됩니다.
+    """
+    if request.size > settings.BULK_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"한 번에 최대 {settings.BULK_MAX_ITEMS}건까지 처리할 수 있습니다.")
     try:
-        contracts = db.query(ContractModel).offset(skip).limit(limit).all()
+        return await db.run_sync(apply_bulk, ContractModel, ContractCreate, ContractUpdate,
+                                 request, chunk_size or settings.BULK_CHUNK_SIZE)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"계약 일괄 처리 실패: {str(e)}")
+
+@router.get("/", response_model=List[ContractListItem])
+async def get_contracts(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = Query(None, description="쉼표로 구분한 응답 필드 (예: id,contract_number,status)"),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    계약 목록을 발주처 이름과 함께 조회합니다. (한 번의 쿼리)
+    cursor가 주어지면 키셋 방식으로 조회하며, 다음 커서는 X-Next-Cursor 헤더로 전달됩니다.
+    fields가 주어지면 해당 열만 조회하고 응답에도 그 필드(+id)만 담습니다. (발주처 제외)
+    목록 버전(계약 수·최근 수정 시각, 발주처 수정 시각)이 If-None-Match와 같으면 조회 없이 304를 반환합니다.
+    """
+    try:
+        selected = parse_fields(fields, ContractListItem, ContractModel)
+        version = (await db.execute(select(*count_and_latest(ContractModel), count_and_latest(ClientModel)[1]))).one()
+        headers = version_headers(version, last_modified=False)
+        if is_not_modified(headers, if_none_match):
+            return Response(status_code=304, headers=headers)
+        fast = settings.FAST_JSON_RESPONSES
+        if selected:
+            stmt = select(*select_columns(ContractModel, selected))
+        elif fast:
+            stmt = select(*CONTRACT_LIST_COLUMNS).join(ContractModel.client)
+        else:
+            stmt = with_profile(select(ContractModel), ContractModel, "list")
+        stmt = apply_page(stmt, ContractModel.created_at, ContractModel.id, cursor=cursor, skip=skip, limit=limit)
+        result = await db.execute(stmt)
+        contracts = result.all() if selected or fast else result.scalars().all()
+        cursor_value = next_cursor(contracts, limit)
+        if cursor_value:
+            headers[NEXT_CURSOR_HEADER] = cursor_value
+        if selected:
+            return sparse_response(contracts, ContractListItem, selected, headers, validate=not fast)
+        if fast:
+            return rows_response(contracts, CONTRACT_LIST_KEYS, headers)
+        response.headers.update(headers)
         return contracts
+    except (InvalidCursorError, InvalidFieldsError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"계약 목록 조회 실패: {str(e)}")
 
-@router.get("/{contract_id}", response_model=Contract)
-async def get_contract(contract_id: str, db: Session = Depends(get_db)):
-    """특정 계약의 상세 정보를 조회합니다."""
+@router.get("/{contract_id}", response_model=Union[ContractDetail, ContractFinancial])
+async def get_contract(
+    contract_id: UUID,
+    response: Response,
+    profile: Literal["detail", "financial"] = "detail",
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    특정 계약의 상세 정보를 조회합니다.
+    profile=detail은 발주처·작성자·문서 목록, profile=financial은 노무비·수입·지출 내역을 포함합니다.
+    (프로필마다 관계 수와 관계없이 고정된 수의 쿼리)
+    ETag가 If-None-Match와 같으면 관계를 읽지 않고 304를 반환합니다.
+    하위 행 삭제는 최근 수정 시각을 바꾸지 않으므로 Last-Modified/If-Modified-Since는 쓰지 않습니다.
+    """
     try:
-        contract = db.query(ContractModel).filter(ContractModel.id == contract_id).first()
-        if not contract:
+        version = await _get_contract_version(db, contract_id)
+        if version is None:
             raise HTTPException(status_code=404, detail="계약을 찾을 수 없습니다.")
-        return contract
+        headers = version_headers(version, last_modified=False)
+        if is_not_modified(headers, if_none_match):
+            return Response(status_code=304, headers=headers)
+        contract = await _get_contract_or_404(db, contract_id, profile)
+        response.headers.update(headers)
+        return CONTRACT_DETAIL_SCHEMAS[profile].model_validate(contract)
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"계약 조회 실패: {str(e)}")
 
 @router.put("/{contract_id}", response_model=Contract)
-async def update_contract(contract_id: str, contract: ContractCreate, db: Session = Depends(get_db)):
-    """계약 정보를 수정합니다."""
+async def update_contract(
+    contract_id: UUID,
+    contract: ContractCreate,
+    if_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    계약 정보를 수정합니다.
+    If-Match가 주어지면 조회 때 받은 ETag와 현재 버전이 같을 때만 수정하고, 다르면 412를 반환합니다.
+    """
     try:
-        db_contract = db.query(ContractModel).filter(ContractModel.id == contract_id).first()
+        criteria = ()
+        if if_match is not None:
+            version = await _get_contract_version(db, contract_id)
+            if version is None:
+                raise HTTPException(status_code=404, detail="계약을 찾을 수 없습니다.")
+            if if_match_fails(if_match, version_etag(*version)):
+                raise HTTPException(status_code=412, detail="다른 사용자가 먼저 계약을 수정했습니다.")
+            # 확인과 수정 사이에 다른 요청이 수정한 경우도 UPDATE 조건으로 막음
+            criteria = (ContractModel.updated_at == version[0],)
+        db_contract = await db.run_sync(update_by_id, ContractModel, contract_id, contract.dict(), *criteria)
         if not db_contract:
+            if criteria:
+                raise HTTPException(status_code=412, detail="다른 사용자가 먼저 계약을 수정했습니다.")
             raise HTTPException(status_code=404, detail="계약을 찾을 수 없습니다.")
-        
-        for key, value in contract.dict().items():
-            setattr(db_contract, key, value)
-        
-        db.commit()
-        db.refresh(db_contract)
         return db_contract
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=400, detail=f"계약 수정 실패: {str(e)}")
 
 @router.delete("/{contract_id}")
-async def delete_contract(contract_id: str, db: Session = Depends(get_db)):
+async def delete_contract(contract_id: UUID, db: AsyncSession = Depends(get_async_db)):
     """계약을 삭제합니다."""
     try:
-        db_contract = db.query(ContractModel).filter(ContractModel.id == contract_id).first()
-        if not db_contract:
+        if not await db.run_sync(delete_by_id, ContractModel, contract_id):
             raise HTTPException(status_code=404, detail="계약을 찾을 수 없습니다.")
-        
-        db.delete(db_contract)
-        db.commit()
         return {"message": "계약이 성공적으로 삭제되었습니다."}
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
-        raise HTTPException(status_code=400, detail=f"계약 삭제 실패: {str(e)}") 
\ No newline at end of file
+        await db.rollback()
+        raise HTTPException(status_code=400, detail=f"계약 삭제 실패: {str(e)}")
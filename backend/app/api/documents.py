@@ -0,0 +1,135 @@
+import os
+from fastapi import APIRouter, HTTPException, Depends, Header, Query, Response
+from fastapi.responses import FileResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from datetime import datetime
+from uuid import UUID
+from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+from ..core.conditional import etag_matches
+from ..core.pagination import InvalidCursorError, NEXT_CURSOR_HEADER, apply_page, next_cursor
+from ..db.database import get_async_db
+from ..models.document import Document as DocumentModel
+from ..services.previews import PREVIEW_MIME
+
+router = APIRouter()
+
+# 매번 ETag로 다시 확인 (내용이 같으면 304)
+DOWNLOAD_CACHE_CONTROL = "private, no-cache"
+
+class Document(BaseModel):
+    id: UUID
+    contract_id: UUID
+    document_type: str
+    file_name: str
+    file_size: int
+    mime_type: str
+    uploaded_by: UUID
+    created_at: datetime
+    download_url: str
+    preview_status: Optional[str] = None  # pending, ready, unsupported, failed
+    preview_url: Optional[str] = None  # 미리보기가 준비된 경우에만
+
+def _to_document(document: DocumentModel) -> Document:
+    url = f"/api/documents/{document.id}"
+    return Document(
+        id=document.id, contract_id=document.contract_id, document_type=document.document_type,
+        file_name=document.file_name, file_size=document.file_size, mime_type=document.mime_type,
+        uploaded_by=document.uploaded_by, created_at=document.created_at, download_url=f"{url}/download",
+        preview_status=document.preview_status,
+        preview_url=f"{url}/preview" if document.preview_status == "ready" else None,
+    )
+
+def document_etag(document: DocumentModel, stat: os.stat_result) -> str:
+    """저장소 파일은 내용 해시, 해시가 없는 기존 파일은 수정 시각·크기로 ETag를 만듭니다."""
+    if document.sha256:
+        return f'"{document.sha256}"'
+    return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+async def _get_document_or_404(db: AsyncSession, document_id: UUID) -> DocumentModel:
+    document = await db.get(DocumentModel, document_id)
+    if not document:
+        raise HTTPException(status_code=404, detail="문서를 찾을 수 없습니다.")
+    return document
+
+async def _stat_or_404(path: Optional[str], detail: str) -> os.stat_result:
+    try:
+        return await run_in_threadpool(os.stat, path)
+    except (FileNotFoundError, TypeError):
+        raise HTTPException(status_code=404, detail=detail)
+
+@router.get("/", response_model=List[Document])
+async def get_documents(
+    response: Response,
+    contract_id: Optional[UUID] = None,
+    document_type: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    문서 목록을 미리보기/다운로드 URL과 함께 조회합니다. (한 번의 쿼리)
+    다음 커서는 X-Next-Cursor 헤더로 전달됩니다.
+    """
+    stmt = select(DocumentModel)
+    if contract_id is not None:
+        stmt = stmt.where(DocumentModel.contract_id == contract_id)
+    if document_type is not None:
+        stmt = stmt.where(DocumentModel.document_type == document_type)
+    try:
+        stmt = apply_page(stmt, DocumentModel.created_at, DocumentModel.id, cursor=cursor, limit=limit)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    documents = (await db.execute(stmt)).scalars().all()
+    cursor_value = next_cursor(documents, limit)
+    if cursor_value:
+        response.headers[NEXT_CURSOR_HEADER] = cursor_value
+    return [_to_document(document) for document in documents]
+
+@router.api_route("/{document_id}/download", methods=["GET", "HEAD"])
+async def download_document(
+    document_id: UUID,
+    attachment: bool = False,
+    if_none_match: Optional[str] = Header(default=None),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    문서 파일을 내려받습니다.
+
+    파일은 메모리에 올리지 않고 FileResponse로 전송하며(서버가 지원하면 pathsend),
+    Range/If-Range 요청에는 206 부분 응답을, If-None-Match가 ETag와 같으면 304를 반환합니다.
+    기본은 뷰어에서 바로 여는 inline이고, attachment=true이면 저장용으로 내려받습니다.
+    """
+    document = await _get_document_or_404(db, document_id)
+    stat = await _stat_or_404(document.file_path, "문서 파일을 찾을 수 없습니다.")
+
+    headers = {"ETag": document_etag(document, stat), "Cache-Control": DOWNLOAD_CACHE_CONTROL}
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(
+        document.file_path,
+        stat_result=stat,
+        media_type=document.mime_type,
+        filename=document.file_name,
+        content_disposition_type="attachment" if attachment else "inline",
+        headers=headers,
+    )
+
+@router.get("/{document_id}/preview")
+async def get_document_preview(
+    document_id: UUID,
+    if_none_match: Optional[str] = Header(default=None),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """미리보기 이미지(JPEG)를 반환합니다. 준비되지 않았으면 404"""
+    document = await _get_document_or_404(db, document_id)
+    if document.preview_status != "ready":
+        raise HTTPException(status_code=404, detail=f"미리보기가 없습니다. (상태: {document.preview_status})")
+    stat = await _stat_or_404(document.preview_path, "미리보기 파일을 찾을 수 없습니다.")
+
+    headers = {"ETag": f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"', "Cache-Control": DOWNLOAD_CACHE_CONTROL}
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(document.preview_path, stat_result=stat, media_type=PREVIEW_MIME, headers=headers)
@@ -0,0 +1,37 @@
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from datetime import date
+from uuid import UUID
+from ..core.config import settings
+from ..db.database import get_async_db
+from ..services.export import EXPORTS, MEDIA_TYPES, export_stmt, iter_csv, iter_xlsx
+
+router = APIRouter()
+
+@router.get("/{resource}")
+async def export_ledger(
+    resource: str,
+    format: str = Query("csv", pattern="^(csv|xlsx)$"),
+    contract_id: Optional[UUID] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    계약/수입/지출/노무비 장부를 CSV 또는 XLSX로 내보냅니다.
+    resource: contracts, revenues, expenses, labor-costs
+
+    전체 목록을 메모리에 만들지 않고 서버 측 커서로 읽은 행을 바로 응답으로 스트리밍합니다.
+    """
+    spec = EXPORTS.get(resource)
+    if spec is None:
+        raise HTTPException(status_code=404, detail=f"내보낼 수 없는 항목입니다: {resource}")
+    stmt = export_stmt(spec, contract_id, date_from, date_to)
+    iterator = iter_csv if format == "csv" else iter_xlsx
+    return StreamingResponse(
+        iterator(db, spec, stmt, settings.EXPORT_BATCH_SIZE),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{resource}.{format}"'},
+    )
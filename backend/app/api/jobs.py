@@ -0,0 +1,107 @@
+from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi.responses import FileResponse
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from datetime import datetime
+from pathlib import Path
+from uuid import UUID
+from pydantic import BaseModel
+from ..core.config import settings
+from ..db.database import get_async_db
+from ..db.writes import commit_and_load_async
+from ..models.contract import Contract as ContractModel
+from ..models.job import Job as JobModel
+from ..services.jobs import notify_job_queued
+
+router = APIRouter()
+
+class ContractDocumentRequest(BaseModel):
+    contract_id: UUID
+    format: str = "docx"  # docx, xlsx
+
+class LaborStatementRequest(BaseModel):
+    contract_id: UUID
+
+class Job(BaseModel):
+    id: UUID
+    kind: str
+    status: str  # queued, running, succeeded, failed
+    attempts: int
+    max_attempts: int
+    error: Optional[str] = None
+    result_name: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+async def _get_job_or_404(db: AsyncSession, job_id: UUID) -> JobModel:
+    job = await db.get(JobModel, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return job
+
+async def _enqueue_job(db: AsyncSession, contract_id: UUID, kind: str, params: dict) -> JobModel:
+    if not await db.get(ContractModel, contract_id):
+        raise HTTPException(status_code=404, detail="계약을 찾을 수 없습니다.")
+    try:
+        job = JobModel(kind=kind, max_attempts=settings.JOB_MAX_ATTEMPTS,
+                       params={"contract_id": str(contract_id), **params})
+        db.add(job)
+        job = await commit_and_load_async(db, job)
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail=f"작업 등록 실패: {str(e)}")
+    notify_job_queued()
+    return job
+
+@router.post("/contract-documents", response_model=Job, status_code=status.HTTP_202_ACCEPTED)
+async def create_contract_document_job(request: ContractDocumentRequest, db: AsyncSession = Depends(get_async_db)):
+    """
+    계약서 생성 작업을 등록합니다.
+    문서는 워커 프로세스에서 생성되며, GET /api/jobs/{job_id}로 상태를 확인한 뒤 내려받습니다.
+    """
+    if request.format not in ("docx", "xlsx"):
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 문서 형식입니다: {request.format}")
+    return await _enqueue_job(db, request.contract_id, "contract_document", {"format": request.format})
+
+@router.post("/labor-statements", response_model=Job, status_code=status.HTTP_202_ACCEPTED)
+async def create_labor_statement_job(request: LaborStatementRequest, db: AsyncSession = Depends(get_async_db)):
+    """계약의 월별 노무비 명세서(DOCX, zip으로 묶음) 생성 작업을 등록합니다."""
+    return await _enqueue_job(db, request.contract_id, "labor_statements", {})
+
+@router.get("/{job_id}", response_model=Job)
+async def get_job(job_id: UUID, db: AsyncSession = Depends(get_async_db)):
+    """작업 상태를 조회합니다."""
+    return await _get_job_or_404(db, job_id)
+
+@router.get("/{job_id}/download")
+async def download_job_result(job_id: UUID, db: AsyncSession = Depends(get_async_db)):
+    """완료된 작업의 결과 파일을 내려받습니다."""
+    job = await _get_job_or_404(db, job_id)
+    if job.status != "succeeded":
+        raise HTTPException(status_code=409, detail=f"작업이 완료되지 않았습니다. (상태: {job.status})")
+    if not job.result_path or not Path(job.result_path).is_file():
+        raise HTTPException(status_code=404, detail="결과 파일을 찾을 수 없습니다.")
+    return FileResponse(job.result_path, media_type=job.mime_type, filename=job.result_name)
+
+@router.post("/{job_id}/retry", response_model=Job)
+async def retry_job(job_id: UUID, db: AsyncSession = Depends(get_async_db)):
+    """실패한 작업을 다시 대기열에 넣습니다. (실행 횟수 초기화)"""
+    await _get_job_or_404(db, job_id)
+    result = await db.execute(
+        update(JobModel).where(JobModel.id == job_id, JobModel.status == "failed")
+        .values(status="queued", attempts=0, error=None, finished_at=None, run_after=datetime.utcnow())
+        .returning(JobModel)
+        .execution_options(populate_existing=True)
+    )
+    job = result.scalars().one_or_none()
+    if job is None:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="실패한 작업만 다시 실행할 수 있습니다.")
+    await db.commit()
+    notify_job_queued()
+    return job
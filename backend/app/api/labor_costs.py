@@ -0,0 +1,53 @@
+from fastapi import APIRouter, HTTPException, Depends, File, Query, UploadFile
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from typing import Optional
+from datetime import date
+from uuid import UUID
+from ..core.config import settings
+from ..db.database import get_async_db, get_db
+from ..services.labor_aggregation import LaborAggregation, aggregate_labor
+from ..services.labor_import import read_rows, resolve_columns, run_labor_import
+
+router = APIRouter()
+
+@router.get("/aggregate", response_model=LaborAggregation)
+async def get_labor_aggregation(
+    period: str = Query("week", pattern="^(week|month)$"),
+    contract_id: Optional[UUID] = None,
+    worker_id: Optional[UUID] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    노무비를 작업자·계약·주간/월간 단위로 집계합니다.
+    저장된 총액이 작업시간 × 시급과 다른 행은 mismatches로 함께 반환됩니다.
+    """
+    try:
+        return await db.run_sync(aggregate_labor, period, contract_id, worker_id, date_from, date_to)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"노무비 집계 실패: {str(e)}")
+
+@router.post("/import")
+def import_labor_costs(
+    file: UploadFile = File(...),
+    chunk_size: Optional[int] = Query(None, ge=1),
+    db: Session = Depends(get_db)
+):
+    """
+    작업일지(.xlsx/.csv)를 노무비로 가져옵니다.
+
+    필수 컬럼: 작업일, 작업자(주민번호 또는 성명), 계약번호, 작업시간 / 선택: 시급
+    파일을 한 행씩 읽어 청크 단위로 저장하며, 진행 상황을 청크마다 한 줄씩(NDJSON) 전송합니다.
+    마지막 줄은 done=true와 행별 오류 목록입니다.
+    """
+    rows = read_rows(file.file, file.filename)
+    try:
+        columns = resolve_columns(next(rows, None))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"작업일지 파일을 읽을 수 없습니다: {str(e)}")
+
+    progress = run_labor_import(db, rows, columns, chunk_size or settings.IMPORT_CHUNK_SIZE)
+    return StreamingResponse((p.model_dump_json() + "\n" for p in progress), media_type="application/x-ndjson")
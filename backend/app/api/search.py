@@ -0,0 +1,26 @@
+from fastapi import APIRouter, HTTPException, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from ..db.database import get_async_db
+from ..services.search import SEARCH_TYPES, SearchHit, search
+
+router = APIRouter()
+
+@router.get("/", response_model=List[SearchHit])
+async def search_all(
+    q: str = Query(..., min_length=1, max_length=100),
+    types: Optional[str] = Query(None, description="쉼표로 구분한 검색 대상 (contract,client,document)"),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    계약(공사명·계약번호), 발주처(회사명·사업자번호·대표자), 문서(파일명)를 통합 검색합니다.
+    두 글자 단어도 검색되며 결과는 관련도 순입니다.
+    """
+    selected = SEARCH_TYPES
+    if types:
+        selected = tuple(t.strip() for t in types.split(",") if t.strip())
+        unknown = set(selected) - set(SEARCH_TYPES)
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"지원하지 않는 검색 대상입니다: {', '.join(sorted(unknown))}")
+    return await search(db, q, selected, limit)
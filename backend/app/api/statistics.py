@@ -0,0 +1,79 @@
+from fastapi import APIRouter, HTTPException, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from datetime import date
+from decimal import Decimal
+from uuid import UUID
+from pydantic import BaseModel
+from ..db.database import get_async_db
+from ..services.statistics import contract_totals_stmt, financial_summary_stmt, profit_loss_stmt
+
+router = APIRouter()
+
+class FinancialStat(BaseModel):
+    contract_id: UUID
+    period: str
+    kind: str  # revenue, expense, labor
+    category: str
+    total: Decimal
+    count: int
+
+class ContractProfitLoss(BaseModel):
+    contract_id: UUID
+    contract_number: str
+    project_name: str
+    contract_amount: Decimal
+    revenue: Decimal
+    expense: Decimal
+    labor_cost: Decimal
+    profit: Decimal
+
+class ContractTotals(BaseModel):
+    contract_id: UUID
+    revenue: Decimal
+    expense: Decimal
+    labor_cost: Decimal
+    profit: Decimal
+
+@router.get("/financial", response_model=List[FinancialStat])
+async def get_financial_statistics(
+    period: str = Query("month", pattern="^(month|quarter|year)$"),
+    contract_id: Optional[UUID] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """계약·구분·분류·기간(월/분기/연)별 수입/지출 합계를 조회합니다."""
+    try:
+        stmt = financial_summary_stmt(period, contract_id, date_from, date_to)
+        return (await db.execute(stmt)).mappings().all()
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"통계 조회 실패: {str(e)}")
+
+@router.get("/profit-loss", response_model=List[ContractProfitLoss])
+async def get_profit_loss(
+    contract_id: Optional[UUID] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """계약별 손익(수입 - 지출 - 노무비)을 조회합니다."""
+    try:
+        stmt = profit_loss_stmt(contract_id, date_from, date_to)
+        return (await db.execute(stmt)).mappings().all()
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"손익 조회 실패: {str(e)}")
+
+@router.get("/contract-totals", response_model=List[ContractTotals])
+async def get_contract_totals(
+    contract_id: Optional[UUID] = None,
+    month_from: Optional[str] = Query(None, pattern=r"^\d{4}-\d{2}$"),
+    month_to: Optional[str] = Query(None, pattern=r"^\d{4}-\d{2}$"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """대시보드용 계약별 합계를 계약·월별 집계 테이블에서 조회합니다. (월: YYYY-MM)"""
+    try:
+        stmt = contract_totals_stmt(contract_id, month_from, month_to)
+        return (await db.execute(stmt)).mappings().all()
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"계약 합계 조회 실패: {str(e)}")
@@ -0,0 +1,134 @@
+from fastapi import APIRouter, HTTPException, Depends, Header, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from datetime import datetime
+from pathlib import Path
+from uuid import UUID
+from pydantic import BaseModel, Field
+from starlette.requests import ClientDisconnect
+from ..core.config import settings
+from ..db.database import get_async_db
+from ..db.writes import commit_and_load_async
+from ..models.contract import Contract as ContractModel
+from ..models.upload_session import UploadSession as UploadSessionModel
+from ..services.uploads import (
+    UploadChecksumMismatch, UploadOffsetMismatch, UploadTooLarge, append_chunks, complete_from_store,
+    discard_upload, guess_mime_type, upload_lock,
+)
+
+router = APIRouter()
+
+UPLOAD_OFFSET_HEADER = "Upload-Offset"
+
+class UploadSessionCreate(BaseModel):
+    contract_id: UUID
+    document_type: str
+    file_name: str
+    total_size: int = Field(gt=0)
+    mime_type: Optional[str] = None
+    sha256: Optional[str] = Field(default=None, pattern="^[0-9a-fA-F]{64}$")  # 완료 시 검증
+    uploaded_by: UUID
+
+class UploadSession(BaseModel):
+    id: UUID
+    contract_id: UUID
+    document_type: str
+    file_name: str
+    mime_type: str
+    total_size: int
+    received_size: int
+    sha256: Optional[str] = None
+    status: str  # uploading, completed, failed
+    document_id: Optional[UUID] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+async def _get_upload_or_404(db: AsyncSession, upload_id: UUID) -> UploadSessionModel:
+    upload = await db.get(UploadSessionModel, upload_id)
+    if not upload:
+        raise HTTPException(status_code=404, detail="업로드 세션을 찾을 수 없습니다.")
+    return upload
+
+@router.post("/", response_model=UploadSession, status_code=status.HTTP_201_CREATED)
+async def create_upload(request: UploadSessionCreate, response: Response, db: AsyncSession = Depends(get_async_db)):
+    """
+    업로드 세션을 생성합니다.
+    파일 내용은 PATCH /api/uploads/{upload_id}로 Upload-Offset 헤더와 함께 나누어 보냅니다.
+    sha256을 함께 보냈고 같은 파일이 이미 저장되어 있으면 본문 없이 바로 완료(status=completed)됩니다.
+    """
+    suffix = Path(request.file_name).suffix.lower()
+    if suffix not in settings.ALLOWED_FILE_EXTENSIONS:
+        raise HTTPException(status_code=400, detail=f"허용되지 않는 파일 형식입니다: {suffix or request.file_name}")
+    if request.total_size > settings.MAX_FILE_SIZE:
+        raise HTTPException(status_code=413, detail=f"파일 크기는 {settings.MAX_FILE_SIZE} bytes를 넘을 수 없습니다.")
+    if not await db.get(ContractModel, request.contract_id):
+        raise HTTPException(status_code=404, detail="계약을 찾을 수 없습니다.")
+    try:
+        upload = UploadSessionModel(**request.dict(exclude={"mime_type", "sha256"}),
+                                    mime_type=request.mime_type or guess_mime_type(request.file_name),
+                                    sha256=request.sha256.lower() if request.sha256 else None)
+        db.add(upload)
+        upload = await commit_and_load_async(db, upload)
+        await complete_from_store(db, upload, settings.upload_path)
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail=f"업로드 세션 생성 실패: {str(e)}")
+    response.headers[UPLOAD_OFFSET_HEADER] = str(upload.received_size)
+    return upload
+
+@router.get("/{upload_id}", response_model=UploadSession)
+async def get_upload(upload_id: UUID, response: Response, db: AsyncSession = Depends(get_async_db)):
+    """업로드 상태와 이어서 보낼 위치(received_size, Upload-Offset 헤더)를 조회합니다."""
+    upload = await _get_upload_or_404(db, upload_id)
+    response.headers[UPLOAD_OFFSET_HEADER] = str(upload.received_size)
+    return upload
+
+@router.patch("/{upload_id}", response_model=UploadSession)
+async def upload_chunk(
+    upload_id: UUID,
+    request: Request,
+    response: Response,
+    upload_offset: int = Header(alias=UPLOAD_OFFSET_HEADER, ge=0),
+    content_length: Optional[int] = Header(default=None),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    요청 본문(파일 조각)을 Upload-Offset 위치부터 이어 씁니다.
+    본문은 설정의 UPLOAD_CHUNK_SIZE 단위로 디스크에 바로 기록되며, 마지막 조각을 받으면
+    Document가 생성되고 document_id가 채워집니다.
+    """
+    async with upload_lock(upload_id):
+        upload = await _get_upload_or_404(db, upload_id)
+        if upload.status != "uploading":
+            raise HTTPException(status_code=409, detail=f"진행 중인 업로드가 아닙니다. (상태: {upload.status})")
+        # 본문을 읽기 전에 Content-Length로 먼저 검사 (없거나 틀려도 쓰는 동안 다시 검사)
+        if content_length is not None and upload_offset + content_length > upload.total_size:
+            raise HTTPException(status_code=413, detail="파일 크기가 선언한 크기를 넘습니다.")
+        try:
+            upload = await append_chunks(db, upload, upload_offset, request.stream(), settings.upload_path,
+                                         settings.UPLOAD_CHUNK_SIZE)
+        except UploadOffsetMismatch as e:
+            raise HTTPException(status_code=409, detail=str(e),
+                                headers={UPLOAD_OFFSET_HEADER: str(upload.received_size)})
+        except UploadTooLarge as e:
+            raise HTTPException(status_code=413, detail=str(e),
+                                headers={UPLOAD_OFFSET_HEADER: str(upload.received_size)})
+        except UploadChecksumMismatch as e:
+            raise HTTPException(status_code=422, detail=str(e))
+        except ClientDisconnect:
+            # 받은 위치까지는 저장되었으므로 클라이언트가 GET으로 위치를 확인한 뒤 이어서 보냄
+            raise HTTPException(status_code=400, detail="업로드 중 연결이 끊어졌습니다.")
+    response.headers[UPLOAD_OFFSET_HEADER] = str(upload.received_size)
+    return upload
+
+@router.delete("/{upload_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def cancel_upload(upload_id: UUID, db: AsyncSession = Depends(get_async_db)):
+    """진행 중인 업로드를 취소하고 받은 부분을 삭제합니다."""
+    async with upload_lock(upload_id):
+        upload = await _get_upload_or_404(db, upload_id)
+        if upload.status == "completed":
+            raise HTTPException(status_code=409, detail="완료된 업로드는 취소할 수 없습니다.")
+        await discard_upload(db, upload, settings.upload_path)
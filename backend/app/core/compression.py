@@ -0,0 +1,294 @@
+"""
+응답 압축 미들웨어 (gzip, 패키지가 설치된 경우 br·zstd)
+
+Accept-Encoding의 q 값과 서버 선호 순서(COMPRESSION_ENCODINGS)로 인코딩을 고릅니다.
+최소 크기 미만·206·Accept-Ranges 파일 응답·이미 인코딩된 응답·제외 MIME은 그대로 보내고,
+스트리밍 응답은 청크마다 flush 하여 내보내기도 끊김 없이 전송합니다.
+
+압축한 응답은 표현이 다르므로 ETag에 인코딩 접미사를 붙입니다. ("abc" → "abc-gzip")
+조건부 요청에서는 app.core.conditional이 접미사를 떼고 비교합니다.
+"""
+import abc
+import zlib
+from typing import Dict, Optional, Sequence
+
+import anyio.to_thread
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .conditional import encoded_etag
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성
+    zstandard = None
+
+# 이미 압축되었거나 압축하면 안 되는 형식 (문서 내려받기·XLSX 내보내기·SSE 등)
+EXCLUDED_CONTENT_TYPES = (
+    "application/gzip",
+    "application/x-gzip",
+    "application/zip",
+    "application/pdf",
+    "application/octet-stream",
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "application/x-hwp",
+    "audio/*",
+    "font/woff",
+    "font/woff2",
+    "image/avif",
+    "image/gif",
+    "image/jpeg",
+    "image/png",
+    "image/webp",
+    "text/event-stream",
+    "video/*",
+)
+
+# 이 크기 이상인 청크는 이벤트 루프를 막지 않도록 스레드에서 압축
+THREAD_MINIMUM_SIZE = 128 * 1024
+
+
+def available_encodings() -> tuple:
+    return ("gzip",) + (("br",) if brotli else ()) + (("zstd",) if zstandard else ())
+
+
+def parse_accept_encoding(value: str) -> Dict[str, float]:
+    """Accept-Encoding 헤더를 {인코딩: q} 로 변환합니다. (잘못된 q는 무시)"""
+    weights = {}
+    for item in value.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, raw = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(raw)
+                except ValueError:
+                    q = 0.0
+        weights[coding] = q
+    return weights
+
+
+def choose_encoding(accept_encoding: Optional[str], preferred: Sequence[str]) -> Optional[str]:
+    """
+    클라이언트 q 값이 가장 높은 인코딩을 고릅니다. (같으면 preferred 순서, 없으면 None = 압축 안 함)
+    '*'는 목록에 없는 인코딩에 적용되고 q=0은 거부입니다.
+    """
+    if not accept_encoding:
+        return None
+    weights = parse_accept_encoding(accept_encoding)
+    wildcard = weights.get("*", 0.0)
+    best, best_q = None, 0.0
+    for coding in preferred:
+        q = weights.get(coding, wildcard)
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def _is_excluded(headers: Headers, exclude_content_types: Sequence[str]) -> bool:
+    media_type = headers.get("content-type", "").partition(";")[0].strip().lower()
+    return media_type in exclude_content_types or f"{media_type.partition('/')[0]}/*" in exclude_content_types
+
+
+def _passes_through(message: Message, exclude_content_types: Sequence[str]) -> bool:
+    """
+    압축하지 않고 그대로 보낼 응답인지 확인합니다.
+    Accept-Ranges를 보내는 파일 응답은 압축하면 이후 Range 요청의 바이트 위치가 어긋나므로 제외합니다.
+    """
+    headers = Headers(raw=message["headers"])
+    return (
+        message["status"] == 206
+        or "content-encoding" in headers
+        or headers.get("accept-ranges", "none").lower() != "none"
+        or _is_excluded(headers, exclude_content_types)
+    )
+
+
+class IdentityResponder:
+    """압축하지 않는 경우 (클라이언트가 받는 인코딩 없음): 캐시를 위해 Vary만 추가"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        async def send_with_vary(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(raw=message["headers"]).add_vary_header("Accept-Encoding")
+            await send(message)
+
+        await self.app(scope, receive, send_with_vary)
+
+
+class CompressionResponder(abc.ABC):
+    """
+    응답 하나를 압축하는 ASGI 래퍼 (인코딩별 하위 클래스가 compress만 구현)
+
+    시작 메시지는 첫 본문을 보고 압축 여부를 정할 때까지 보류합니다.
+    """
+    content_encoding: str
+
+    def __init__(self, app: ASGIApp, minimum_size: int, exclude_content_types: Sequence[str]):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.exclude_content_types = tuple(value.partition(";")[0].strip().lower() for value in exclude_content_types)
+        self.send: Optional[Send] = None
+        self.initial_message: Optional[Message] = None
+        self.passthrough = False
+        self.compressing = False
+
+    @abc.abstractmethod
+    def compress(self, body: bytes, more_body: bool) -> bytes:
+        """청크를 압축합니다. more_body가 False이면 스트림을 끝냅니다."""
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_with_compression)
+
+    async def apply_compression(self, body: bytes, more_body: bool) -> bytes:
+        if len(body) >= THREAD_MINIMUM_SIZE:
+            return await anyio.to_thread.run_sync(self.compress, body, more_body)
+        return self.compress(body, more_body)
+
+    async def send_with_compression(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            self.passthrough = _passes_through(message, self.exclude_content_types)
+            if self.passthrough:
+                await self.send(message)
+            else:
+                self.initial_message = message
+        elif message_type == "http.response.body" and self.initial_message is not None:
+            await self._start(message)
+        elif message_type == "http.response.body" and self.compressing:
+            message["body"] = await self.apply_compression(message.get("body", b""),
+                                                           message.get("more_body", False))
+            await self.send(message)
+        elif message_type == "http.response.pathsend" and self.initial_message is not None:
+            # 파일 경로로 보내는 응답은 서버가 직접 전송하므로 압축하지 않음
+            await self.send(self.initial_message)
+            self.initial_message = None
+            await self.send(message)
+        else:
+            await self.send(message)
+
+    async def _start(self, message: Message) -> None:
+        initial, self.initial_message = self.initial_message, None
+        headers = MutableHeaders(raw=initial["headers"])
+        headers.add_vary_header("Accept-Encoding")
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if len(body) < self.minimum_size and not more_body:
+            await self.send(initial)
+            await self.send(message)
+            return
+
+        self.compressing = True
+        message["body"] = await self.apply_compression(body, more_body)
+        headers["Content-Encoding"] = self.content_encoding
+        if "etag" in headers:
+            headers["ETag"] = encoded_etag(headers["etag"], self.content_encoding)
+        if more_body or initial.get("trailers", False):
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(len(message["body"]))
+        await self.send(initial)
+        await self.send(message)
+
+
+class GZipResponder(CompressionResponder):
+    content_encoding = "gzip"
+
+    def __init__(self, app: ASGIApp, minimum_size: int, level: int, exclude_content_types: Sequence[str]):
+        super().__init__(app, minimum_size, exclude_content_types)
+        self.level = level
+        self._compressor = None
+
+    def compress(self, body: bytes, more_body: bool) -> bytes:
+        if self._compressor is None:
+            self._compressor = zlib.compressobj(self.level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        data = self._compressor.compress(body)
+        return data + self._compressor.flush(zlib.Z_SYNC_FLUSH if more_body else zlib.Z_FINISH)
+
+
+class BrotliResponder(CompressionResponder):
+    content_encoding = "br"
+
+    def __init__(self, app: ASGIApp, minimum_size: int, quality: int, exclude_content_types: Sequence[str]):
+        super().__init__(app, minimum_size, exclude_content_types)
+        self.quality = quality
+        self._compressor = None
+
+    def compress(self, body: bytes, more_body: bool) -> bytes:
+        if self._compressor is None:
+            self._compressor = brotli.Compressor(mode=brotli.MODE_TEXT, quality=self.quality)
+        data = self._compressor.process(body)
+        return data + (self._compressor.flush() if more_body else self._compressor.finish())
+
+
+class ZstdResponder(CompressionResponder):
+    content_encoding = "zstd"
+
+    def __init__(self, app: ASGIApp, minimum_size: int, level: int, exclude_content_types: Sequence[str]):
+        super().__init__(app, minimum_size, exclude_content_types)
+        self.level = level
+        self._compressor = None
+
+    def compress(self, body: bytes, more_body: bool) -> bytes:
+        if self._compressor is None:
+            self._compressor = zstandard.ZstdCompressor(level=self.level).compressobj()
+        data = self._compressor.compress(body)
+        return data + (self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK) if more_body
+                       else self._compressor.flush())
+
+
+class CompressionMiddleware:
+    """
+    설정한 인코딩 중 클라이언트가 받는 것으로 응답을 압축합니다.
+
+        app.add_middleware(CompressionMiddleware, minimum_size=1024, encodings=("zstd", "br", "gzip"))
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        encodings: Sequence[str] = ("zstd", "br", "gzip"),
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        zstd_level: int = 3,
+        exclude_content_types: Sequence[str] = EXCLUDED_CONTENT_TYPES,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        # 설치되지 않은 인코딩은 제외
+        self.encodings = tuple(coding for coding in encodings if coding in available_encodings())
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.zstd_level = zstd_level
+        self.exclude_content_types = tuple(value.partition(";")[0].strip().lower() for value in exclude_content_types)
+
+    def responder(self, coding: Optional[str]) -> ASGIApp:
+        if coding == "zstd":
+            return ZstdResponder(self.app, self.minimum_size, self.zstd_level, self.exclude_content_types)
+        if coding == "br":
+            return BrotliResponder(self.app, self.minimum_size, self.brotli_quality, self.exclude_content_types)
+        if coding == "gzip":
+            return GZipResponder(self.app, self.minimum_size, self.gzip_level, self.exclude_content_types)
+        return IdentityResponder(self.app)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        coding = choose_encoding(Headers(scope=scope).get("accept-encoding"), self.encodings)
+        await self.responder(coding)(scope, receive, send)
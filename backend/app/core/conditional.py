@@ -0,0 +1,106 @@
+"""
+조건부 요청 (ETag/Last-Modified, If-None-Match/If-Modified-Since, If-Match)
+
+조회 엔드포인트는 updated_at·행 수 같은 버전 값만 먼저 읽어 ETag를 만들고,
+클라이언트의 ETag와 같으면 본문 조회·직렬화 없이 304를 반환합니다.
+수정 엔드포인트는 If-Match가 현재 ETag와 다르면 412를 반환합니다.
+
+하위 행 삭제는 최근 수정 시각을 바꾸지 않으므로 Last-Modified보다 ETag(행 수 포함)가 정확하며,
+RFC 9110에 따라 If-None-Match가 있으면 If-Modified-Since는 무시합니다.
+
+압축 미들웨어는 압축한 응답의 ETag에 인코딩 접미사("abc-gzip")를 붙이므로 비교할 때는 접미사를 뗍니다.
+"""
+import hashlib
+import re
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional, Sequence
+
+# 조회 응답은 캐시하되 매번 ETag로 다시 확인 (변경이 없으면 304)
+REVALIDATE_CACHE_CONTROL = "private, no-cache"
+
+_ENCODING_SUFFIX = re.compile(r'-(?:gzip|br|zstd)"$')
+
+
+def encoded_etag(etag: str, coding: str) -> str:
+    """압축한 표현의 ETag ("abc" → "abc-gzip")"""
+    return f'{etag[:-1]}-{coding}"' if etag.endswith('"') else etag
+
+
+def _strip_encoding(tag: str) -> str:
+    return _ENCODING_SUFFIX.sub('"', tag.strip())
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match 헤더가 etag와 일치하는지 확인합니다. (약한 비교, RFC 9110 13.1.2)
+    '*' 또는 쉼표로 구분된 목록을 허용합니다.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    target = _strip_encoding(etag.removeprefix("W/"))
+    return any(_strip_encoding(tag.strip().removeprefix("W/")) == target for tag in if_none_match.split(","))
+
+
+def version_etag(*parts) -> str:
+    """버전 값(updated_at, 행 수 등)으로 강한 ETag를 만듭니다."""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest()
+    return f'"{digest}"'
+
+
+def _utc(value: datetime) -> datetime:
+    # DB의 naive datetime은 UTC(datetime.utcnow)로 저장됨
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def latest(*values) -> Optional[datetime]:
+    """버전 값 중 가장 최근 시각 (datetime이 아닌 값과 None은 무시)"""
+    times = [_utc(value) for value in values if isinstance(value, datetime)]
+    return max(times) if times else None
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime] = None) -> dict:
+    headers = {"ETag": etag, "Cache-Control": REVALIDATE_CACHE_CONTROL}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_utc(last_modified), usegmt=True)
+    return headers
+
+
+def version_headers(version: Sequence, last_modified: bool = True) -> dict:
+    """버전 값으로 ETag(와 가장 최근 시각의 Last-Modified) 헤더를 만듭니다."""
+    return validator_headers(version_etag(*version), latest(*version) if last_modified else None)
+
+
+def _parse_http_date(value: str) -> Optional[datetime]:
+    try:
+        return _utc(parsedate_to_datetime(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def is_not_modified(headers: dict, if_none_match: Optional[str], if_modified_since: Optional[str] = None) -> bool:
+    """validator_headers의 ETag/Last-Modified 기준으로 304를 반환해도 되는지 확인합니다. (If-None-Match 우선)"""
+    if if_none_match is not None:
+        return etag_matches(if_none_match, headers["ETag"])
+    if not if_modified_since or "Last-Modified" not in headers:
+        return False
+    # HTTP 날짜는 초 단위이므로 헤더로 보낸 값끼리 비교
+    since = _parse_http_date(if_modified_since)
+    return since is not None and _parse_http_date(headers["Last-Modified"]) <= since
+
+
+def if_match_fails(if_match: Optional[str], etag: Optional[str]) -> bool:
+    """
+    If-Match 조건이 실패하는지 확인합니다. (강한 비교, RFC 9110 13.1.1)
+    헤더가 없으면 통과, '*'는 대상이 있으면 통과, 약한 ETag(W/)는 일치하지 않습니다.
+    압축 응답에서 받은 ETag도 같은 버전이면 통과합니다.
+    """
+    if if_match is None:
+        return False
+    if etag is None:
+        return True
+    if if_match.strip() == "*":
+        return False
+    return not any(_strip_encoding(tag) == etag for tag in if_match.split(","))
@@ -25,6 +25,48 @@ class Settings(BaseSettings):
     USE_LOCAL_DB: bool = True  # True: SQLite 사용, False: Supabase 사용
     DATABASE_URL: str = "sqlite:///./construction_management.db"
     
+    # 커넥션 풀 설정
+    DB_POOL_SIZE: int = 5  # 유지할 커넥션 수
+    DB_MAX_OVERFLOW: int = 10  # 풀 크기를 넘어 추가로 열 수 있는 커넥션 수
+    DB_POOL_RECYCLE: int = 1800  # 초 단위, 오래된 커넥션 재생성 (-1: 사용 안 함)
+    DB_POOL_PRE_PING: bool = True  # 체크아웃 시 커넥션 유효성 검사
+    DB_POOL_TIMEOUT: int = 30  # 초 단위, 커넥션 대기 최대 시간
+    
+    # 일괄 처리 설정
+    BULK_CHUNK_SIZE: int = 500  # 한 번의 다중 행 INSERT/UPDATE/DELETE에 포함할 최대 행 수
+    BULK_MAX_ITEMS: int = 10000  # 요청 하나에 허용하는 최대 항목 수
+    IMPORT_CHUNK_SIZE: int = 5000  # 파일 가져오기에서 한 트랜잭션(executemany)에 넣을 행 수
+    EXPORT_BATCH_SIZE: int = 1000  # 내보내기에서 서버 측 커서로 한 번에 가져올 행 수
+    
+    # 응답 직렬화 설정
+    FAST_JSON_RESPONSES: bool = False  # True: 목록은 검증 없이 열 튜플을 orjson으로 직렬화, 기본 응답도 orjson
+    
+    # 응답 압축 설정 (br·zstd는 brotli·zstandard 패키지가 설치된 경우에만 사용)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024  # 바이트, 이보다 작은 응답은 압축하지 않음
+    COMPRESSION_ENCODINGS: List[str] = ["zstd", "br", "gzip"]  # 클라이언트 q 값이 같을 때의 선호 순서
+    COMPRESSION_GZIP_LEVEL: int = 6  # 1~9, 9는 크기 이득에 비해 CPU 비용이 큼
+    COMPRESSION_BROTLI_QUALITY: int = 4  # 0~11, 동적 응답에는 4~5가 적당
+    COMPRESSION_ZSTD_LEVEL: int = 3  # 1~22
+    
+    # 백그라운드 작업 설정 (문서 생성 등, 외부 브로커 없이 프로세스 풀에서 실행)
+    JOB_RUNNER_ENABLED: bool = True  # API 프로세스에서 작업 디스패처 실행 여부
+    JOB_WORKERS: int = 2  # 동시에 실행할 작업(워커 프로세스) 수
+    JOB_MAX_ATTEMPTS: int = 3  # 실패 시 재시도를 포함한 최대 실행 횟수
+    JOB_RETRY_DELAY: int = 10  # 초 단위, 재시도 대기 시간 (실행 횟수만큼 곱해짐)
+    JOB_POLL_INTERVAL: float = 2.0  # 초 단위, 대기 중인 작업 확인 주기
+    JOB_LEASE_SECONDS: int = 60  # 초 단위, 실행 중인 작업의 임대 시간 (갱신되지 않으면 다른 디스패처가 다시 실행)
+    JOB_RESULT_DIR: str = "generated"  # 생성된 문서 저장 디렉토리
+    DOCUMENT_TEMPLATE_DIR: str = "app/templates/documents"  # 계약서·명세서 DOCX 템플릿 디렉토리
+    
+    # SQLite 성능 설정 (USE_LOCAL_DB=True 일 때만 적용)
+    SQLITE_JOURNAL_MODE: str = "WAL"  # 읽기와 쓰기가 서로를 막지 않도록 WAL 사용
+    SQLITE_SYNCHRONOUS: str = "NORMAL"  # WAL 모드에서는 NORMAL로도 손상 없이 안전
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024  # 256MB
+    SQLITE_CACHE_SIZE: int = -64000  # 음수는 KiB 단위 (약 64MB)
+    SQLITE_BUSY_TIMEOUT: int = 5000  # ms, 잠금 대기 시간
+    SQLITE_SINGLE_WRITER: bool = True  # 쓰기를 단일 writer 커넥션으로 직렬화
+    
     # Supabase 설정 (선택사항 - 클라우드 사용시에만)
     SUPABASE_URL: Optional[str] = None
     SUPABASE_KEY: Optional[str] = None
@@ -50,6 +92,8 @@ class Settings(BaseSettings):
     # 파일 업로드 설정
     UPLOAD_DIR: str = "uploads"
     MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 10MB
+    UPLOAD_CHUNK_SIZE: int = 1024 * 1024  # 업로드 본문을 디스크에 기록하는 단위 (1MB)
+    PREVIEW_MAX_SIZE: int = 320  # 미리보기 이미지의 긴 변 길이 (px)
     ALLOWED_FILE_EXTENSIONS: List[str] = [
         ".pdf", ".doc", ".docx", ".hwp", 
         ".xls", ".xlsx", ".jpg", ".jpeg", ".png"
@@ -80,6 +124,18 @@ class Settings(BaseSettings):
         path.mkdir(exist_ok=True)
         return path
     
+    @property
+    def job_result_path(self) -> Path:
+        """백그라운드 작업 결과(생성 문서) 디렉토리 경로 반환"""
+        path = self.BASE_DIR / self.JOB_RESULT_DIR
+        path.mkdir(exist_ok=True)
+        return path
+    
+    @property
+    def document_template_path(self) -> Path:
+        """문서 템플릿 디렉토리 경로 반환"""
+        return self.BASE_DIR / self.DOCUMENT_TEMPLATE_DIR
+    
     @property
     def is_development(self) -> bool:
         """개발 환경 여부 확인"""
@@ -105,6 +161,35 @@ class Settings(BaseSettings):
                 return f"postgresql://postgres:[password]@[host]:5432/postgres"
             raise ValueError("Supabase 설정이 필요합니다.")
     
+    def get_async_database_url(self) -> str:
+        """비동기 드라이버(aiosqlite/asyncpg)를 사용하는 데이터베이스 URL 반환"""
+        url = self.get_database_url()
+        if url.startswith("sqlite://"):
+            return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+        if url.startswith("postgresql://"):
+            return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+        return url
+    
+    def get_pool_config(self) -> dict:
+        """커넥션 풀 설정 반환 (create_engine 인자)"""
+        return {
+            "pool_size": self.DB_POOL_SIZE,
+            "max_overflow": self.DB_MAX_OVERFLOW,
+            "pool_recycle": self.DB_POOL_RECYCLE,
+            "pool_pre_ping": self.DB_POOL_PRE_PING,
+            "pool_timeout": self.DB_POOL_TIMEOUT
+        }
+    
+    def get_sqlite_pragmas(self) -> dict:
+        """SQLite 커넥션마다 적용할 PRAGMA 설정 반환"""
+        return {
+            "journal_mode": self.SQLITE_JOURNAL_MODE,
+            "synchronous": self.SQLITE_SYNCHRONOUS,
+            "mmap_size": self.SQLITE_MMAP_SIZE,
+            "cache_size": self.SQLITE_CACHE_SIZE,
+            "busy_timeout": self.SQLITE_BUSY_TIMEOUT
+        }
+    
     def get_supabase_config(self) -> dict:
         """Supabase 설정 반환 (클라우드 사용시에만)"""
         if not self.USE_LOCAL_DB:
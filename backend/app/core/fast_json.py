@@ -0,0 +1,81 @@
+"""
+읽기 전용 응답의 빠른 직렬화 경로
+
+DB에서 읽은 행은 이미 스키마 타입과 같으므로 행마다 Pydantic 검증을 거치지 않고
+(열 튜플 → 미리 만든 키 매핑 → orjson) 순서로 바로 JSON 바이트를 만듭니다.
+출력 형식은 Pydantic 직렬화와 같습니다. (Decimal은 문자열, UUID·날짜는 ISO 문자열, UTC는 Z)
+"""
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Iterable, Optional, Sequence, Tuple
+
+import orjson
+from starlette.responses import JSONResponse, Response
+
+JSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def _default(value):
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"JSON으로 직렬화할 수 없는 값입니다: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default, option=JSON_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson으로 렌더링하는 JSONResponse (FAST_JSON_RESPONSES 설정 시 앱 기본 응답 클래스)"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class RowEncoder:
+    """
+    열 튜플을 응답 dict로 바꾸는 미리 만든 변환기
+
+    keys[i]가 행의 i번째 열 이름이며, "client.company_name"처럼 점으로 구분한 키는
+    중첩 객체가 됩니다. keys보다 뒤에 있는 열(페이지 키 등)은 응답에 넣지 않습니다.
+    """
+
+    def __init__(self, keys: Sequence[str]):
+        self.keys = tuple(keys)
+        self.flat = all("." not in key for key in self.keys)
+        # (이름, 열 위치) 또는 (이름, ((하위 이름, 열 위치), ...)) - 첫 등장 순서 유지
+        slots = {}
+        for index, key in enumerate(self.keys):
+            name, _, child = key.partition(".")
+            if child:
+                slots.setdefault(name, []).append((child, index))
+            else:
+                slots[name] = index
+        self.slots: Tuple = tuple(
+            (name, slot if isinstance(slot, int) else tuple(slot)) for name, slot in slots.items()
+        )
+
+    def to_dicts(self, rows: Iterable[Sequence]) -> list:
+        if self.flat:
+            keys = self.keys
+            return [dict(zip(keys, row)) for row in rows]
+        return [
+            {
+                name: row[slot] if isinstance(slot, int) else {child: row[index] for child, index in slot}
+                for name, slot in self.slots
+            }
+            for row in rows
+        ]
+
+    def encode(self, rows: Iterable[Sequence]) -> bytes:
+        return dumps(self.to_dicts(rows))
+
+
+@lru_cache(maxsize=256)
+def row_encoder(keys: Tuple[str, ...]) -> RowEncoder:
+    return RowEncoder(keys)
+
+
+def rows_response(rows: Iterable[Sequence], keys: Sequence[str], headers: Optional[dict] = None) -> Response:
+    """검증 없이 행 목록을 JSON 응답으로 만듭니다. (신뢰할 수 있는 DB 조회 결과 전용)"""
+    return Response(row_encoder(tuple(keys)).encode(rows), media_type="application/json", headers=headers)
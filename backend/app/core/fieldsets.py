@@ -0,0 +1,87 @@
+"""
+목록 엔드포인트의 희소 필드셋 (fields=id,name,status)
+
+요청한 열만 SELECT 하고, 응답 스키마에서 해당 필드만 뽑은 가벼운 모델로 직렬화합니다.
+id와 페이지 키(created_at)는 커서 계산을 위해 항상 읽지만 응답에는 요청한 필드(+id)만 담습니다.
+"""
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter, create_model
+from sqlalchemy import inspect
+from starlette.responses import Response
+
+from .fast_json import rows_response
+
+# 항상 포함하는 필드 (행 식별용)
+ALWAYS_INCLUDED = ("id",)
+# 페이지 커서 계산에 필요한 열
+PAGE_KEYS = ("created_at", "id")
+
+
+class InvalidFieldsError(ValueError):
+    pass
+
+
+@lru_cache(maxsize=None)
+def selectable_fields(schema: Type[BaseModel], model) -> Tuple[str, ...]:
+    """응답 스키마 필드 중 모델의 열과 바로 대응하는 것 (관계·계산 필드 제외)"""
+    columns = inspect(model).column_attrs.keys()
+    return tuple(name for name in schema.model_fields if name in columns)
+
+
+def parse_fields(fields: Optional[str], schema: Type[BaseModel], model) -> Optional[Tuple[str, ...]]:
+    """
+    쉼표로 구분한 fields 값을 검증합니다. 없거나 비어 있으면 None(전체 필드)을 반환합니다.
+
+    Raises:
+        InvalidFieldsError: 스키마에 없거나 선택할 수 없는 필드가 있는 경우
+    """
+    if not fields:
+        return None
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    if not names:
+        return None
+    allowed = selectable_fields(schema, model)
+    unknown = [name for name in names if name not in allowed]
+    if unknown:
+        raise InvalidFieldsError(
+            f"선택할 수 없는 필드입니다: {', '.join(unknown)} (가능한 값: {', '.join(allowed)})"
+        )
+    # 스키마 순서로 정렬하여 같은 조합은 같은 모델을 재사용
+    selected = set(names) | set(ALWAYS_INCLUDED)
+    return tuple(name for name in allowed if name in selected)
+
+
+def select_columns(model, fields: Iterable[str]) -> List[Any]:
+    """SELECT 할 열 (요청 필드 + 페이지 키)"""
+    names = dict.fromkeys([*fields, *PAGE_KEYS])
+    return [getattr(model, name) for name in names]
+
+
+@lru_cache(maxsize=256)
+def sparse_model(schema: Type[BaseModel], fields: Tuple[str, ...]) -> Type[BaseModel]:
+    """스키마에서 fields만 가진 응답 모델 (조합별로 캐시)"""
+    return create_model(
+        f"{schema.__name__}Fields",
+        __config__=ConfigDict(from_attributes=True),
+        **{name: (info.annotation, info) for name, info in schema.model_fields.items() if name in fields},
+    )
+
+
+@lru_cache(maxsize=256)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[model])
+
+
+def sparse_response(rows: Iterable[Any], schema: Type[BaseModel], fields: Tuple[str, ...],
+                    headers: Optional[dict] = None, validate: bool = True) -> Response:
+    """
+    행 목록을 선택한 필드만 담은 JSON 응답으로 직렬화합니다.
+    validate=False이면 DB 행을 그대로 믿고 스키마 검증 없이 orjson으로 직렬화합니다.
+    """
+    if not validate:
+        return rows_response(rows, fields, headers)
+    adapter = _list_adapter(sparse_model(schema, fields))
+    body = adapter.dump_json(adapter.validate_python(list(rows), from_attributes=True))
+    return Response(body, media_type="application/json", headers=headers)
@@ -0,0 +1,73 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import tuple_
+
+# 다음 페이지 커서를 전달하는 응답 헤더
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class InvalidCursorError(ValueError):
+    """디코딩할 수 없는 커서 값"""
+
+
+def encode_cursor(created_at: datetime, row_id: Any) -> str:
+    """
+    (created_at, id) 키를 불투명한 커서 문자열로 변환합니다.
+    """
+    raw = json.dumps([created_at.isoformat(), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    커서 문자열을 (created_at, id) 키로 복원합니다.
+
+    Raises:
+        InvalidCursorError: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(created_at), row_id
+    except (ValueError, TypeError, UnicodeError) as e:
+        raise InvalidCursorError(f"잘못된 커서입니다: {cursor}") from e
+
+
+def apply_page(stmt, created_col, id_col, cursor: Optional[str] = None,
+               skip: int = 0, limit: int = 100):
+    """
+    Query 또는 select() 문에 (created_at, id) 정렬과 페이지 조건을 적용합니다.
+
+    커서가 주어지면 키셋 조건으로 바로 다음 행부터 읽고,
+    없으면 기존 skip/limit(OFFSET) 방식으로 동작합니다.
+    """
+    stmt = stmt.order_by(created_col, id_col)
+    if cursor:
+        created_at, raw_id = decode_cursor(cursor)
+        try:
+            row_id = id_col.type.python_type(raw_id)
+        except (ValueError, TypeError) as e:
+            raise InvalidCursorError(f"잘못된 커서입니다: {cursor}") from e
+        return stmt.filter(tuple_(created_col, id_col) > tuple_(created_at, row_id)).limit(limit)
+    return stmt.offset(skip).limit(limit)
+
+
+def paginate(query, created_col, id_col, cursor: Optional[str] = None,
+             skip: int = 0, limit: int = 100) -> List[Any]:
+    """
+    (created_at, id) 순서로 정렬된 한 페이지를 조회합니다.
+    """
+    return apply_page(query, created_col, id_col, cursor=cursor, skip=skip, limit=limit).all()
+
+
+def next_cursor(rows: List[Any], limit: int) -> Optional[str]:
+    """
+    페이지가 가득 찬 경우 마지막 행 기준의 다음 커서를 반환합니다.
+    """
+    if not rows or len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor(last.created_at, last.id)
@@ -1,21 +1,57 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from ..core.config import settings
+from .pool import TimedAsyncAdaptedQueuePool, TimedQueuePool, instrument_engine
+from .sqlite import RoutingSession, create_async_sqlite_engine, create_sqlite_engine
 
 # 데이터베이스 엔진 생성
+writer_engine = None
+async_writer_engine = None
 if settings.USE_LOCAL_DB:
-    # SQLite 사용
-    engine = create_engine(
-        settings.DATABASE_URL,
-        connect_args={"check_same_thread": False}  # SQLite 전용 설정
-    )
+    # SQLite 사용 (WAL 등 성능 프로필 적용)
+    engine = create_sqlite_engine(settings.DATABASE_URL)
+    async_engine = create_async_sqlite_engine(settings.get_async_database_url())
+    if settings.SQLITE_SINGLE_WRITER:
+        writer_engine = create_sqlite_engine(settings.DATABASE_URL, writer=True)
+        async_writer_engine = create_async_sqlite_engine(settings.get_async_database_url(), writer=True)
 else:
     # PostgreSQL (Supabase) 사용
-    engine = create_engine(settings.get_database_url())
+    engine = create_engine(
+        settings.get_database_url(),
+        poolclass=TimedQueuePool,
+        **settings.get_pool_config()
+    )
+    # 비동기 엔진 생성 (asyncpg)
+    async_engine = create_async_engine(
+        settings.get_async_database_url(),
+        poolclass=TimedAsyncAdaptedQueuePool,
+        **settings.get_pool_config()
+    )
 
-# 세션 팩토리 생성
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# 풀 지표 수집 (진단 엔드포인트에서 사용)
+pool_metrics = instrument_engine(engine)
+async_pool_metrics = instrument_engine(async_engine)
+writer_pool_metrics = instrument_engine(writer_engine) if writer_engine is not None else None
+
+# 세션 팩토리 생성 (SQLite writer가 있으면 쓰기는 writer 커넥션으로 라우팅)
+SessionLocal = sessionmaker(
+    class_=RoutingSession,
+    writer_bind=writer_engine,
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+    bind=engine
+)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    writer_bind=async_writer_engine.sync_engine if async_writer_engine is not None else None,
+    autoflush=False,
+    expire_on_commit=False
+)
 
 # Base 클래스 생성 (모든 모델의 부모 클래스)
 Base = declarative_base()
@@ -32,6 +68,15 @@ def get_db():
     finally:
         db.close()
 
+# 비동기 데이터베이스 세션 의존성
+async def get_async_db():
+    """
+    비동기 데이터베이스 세션을 생성하고 반환하는 의존성 함수
+    async def 핸들러에서 이벤트 루프를 막지 않고 쿼리를 실행할 때 사용합니다.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
 # 데이터베이스 초기화 함수
 def init_db():
     """
@@ -0,0 +1,48 @@
+"""
+관계 로딩 프로필
+
+응답 스키마마다 필요한 관계를 selectinload/joinedload로 미리 읽고(load_only로 열도 제한),
+프로필에 없는 관계와 열은 raiseload로 막습니다. 응답을 직렬화하는 도중 행마다 지연 로딩
+쿼리가 나가는(N+1) 대신 바로 오류가 나므로 스키마와 프로필이 어긋난 것을 테스트에서 잡을 수 있습니다.
+
+    register_profiles(Contract, list=(...), detail=(...))
+    stmt = with_profile(select(Contract), Contract, "detail")
+"""
+from typing import Dict, Tuple
+
+from sqlalchemy.orm import raiseload
+
+_profiles: Dict[type, Dict[str, tuple]] = {}
+
+
+class UnknownLoadingProfile(ValueError):
+    pass
+
+
+def register_profiles(model, **profiles: Tuple):
+    """모델의 이름 붙은 로더 옵션 묶음을 등록합니다."""
+    _profiles.setdefault(model, {}).update({name: tuple(options) for name, options in profiles.items()})
+
+
+def profile_names(model) -> Tuple[str, ...]:
+    return tuple(_profiles.get(model, ()))
+
+
+def loading_options(model, profile: str) -> tuple:
+    """
+    프로필의 로더 옵션 (등록하지 않은 관계는 raiseload)
+
+    Raises:
+        UnknownLoadingProfile: 모델에 없는 프로필 이름인 경우
+    """
+    try:
+        options = _profiles[model][profile]
+    except KeyError:
+        raise UnknownLoadingProfile(
+            f"지원하지 않는 조회 프로필입니다: {profile} (가능한 값: {', '.join(profile_names(model))})"
+        )
+    return options + (raiseload("*"),)
+
+
+def with_profile(stmt, model, profile: str):
+    return stmt.options(*loading_options(model, profile))
@@ -0,0 +1,129 @@
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class PoolMetrics:
+    """
+    커넥션 풀 사용 현황 집계
+
+    체크아웃 대기 시간과 커넥션 생성/종료(churn) 횟수를 누적합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.checkouts = 0
+            self.wait_total = 0.0
+            self.wait_max = 0.0
+            self.connections_opened = 0
+            self.connections_closed = 0
+            self.connections_invalidated = 0
+
+    def record_wait(self, seconds: float):
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+
+    def record_open(self):
+        with self._lock:
+            self.connections_opened += 1
+
+    def record_close(self):
+        with self._lock:
+            self.connections_closed += 1
+
+    def record_invalidate(self):
+        with self._lock:
+            self.connections_invalidated += 1
+
+    def snapshot(self, pool) -> dict:
+        """풀의 현재 상태와 누적 지표를 합쳐 반환합니다."""
+        with self._lock:
+            data = {
+                "checkouts": self.checkouts,
+                "wait_ms_total": round(self.wait_total * 1000, 3),
+                "wait_ms_avg": round(self.wait_total * 1000 / self.checkouts, 3) if self.checkouts else 0.0,
+                "wait_ms_max": round(self.wait_max * 1000, 3),
+                "connections_opened": self.connections_opened,
+                "connections_closed": self.connections_closed,
+                "connections_invalidated": self.connections_invalidated,
+            }
+        if isinstance(pool, QueuePool):
+            data.update({
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": max(pool.overflow(), 0),
+            })
+        else:
+            data["status"] = pool.status()
+        return data
+
+
+class _WaitTimingMixin:
+    """체크아웃(_do_get)에 걸린 시간을 PoolMetrics에 기록"""
+
+    metrics: PoolMetrics = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            if self.metrics is not None:
+                self.metrics.record_wait(time.perf_counter() - start)
+
+    def recreate(self):
+        # engine.dispose() 시 새 풀로 교체되어도 같은 지표를 이어서 사용
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class TimedQueuePool(_WaitTimingMixin, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(_WaitTimingMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def instrument_engine(engine) -> PoolMetrics:
+    """
+    엔진의 풀에 지표 수집기를 연결하고 반환합니다.
+    AsyncEngine이 주어지면 내부 sync_engine의 풀을 사용합니다.
+    """
+    engine = getattr(engine, "sync_engine", engine)
+    metrics = PoolMetrics()
+    engine.pool.metrics = metrics
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        metrics.record_open()
+
+    @event.listens_for(engine, "close")
+    def _on_close(dbapi_connection, connection_record):
+        metrics.record_close()
+
+    @event.listens_for(engine, "close_detached")
+    def _on_close_detached(dbapi_connection):
+        metrics.record_close()
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.record_invalidate()
+
+    return metrics
+
+
+def pool_status(engine, metrics: PoolMetrics) -> dict:
+    """진단 엔드포인트용 풀 상태"""
+    engine = getattr(engine, "sync_engine", engine)
+    return {"url": engine.url.render_as_string(hide_password=True), **metrics.snapshot(engine.pool)}
@@ -0,0 +1,106 @@
+import re
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+from sqlalchemy.sql.elements import TextClause
+
+from ..core.config import settings
+from .pool import TimedAsyncAdaptedQueuePool, TimedQueuePool
+
+SQLITE_CONNECT_ARGS = {"check_same_thread": False}
+# reader로 보내도 되는 text() 문 (그 밖의 원문 SQL은 쓰기로 간주)
+_READ_ONLY_SQL = re.compile(r"^\s*(SELECT|EXPLAIN|VALUES)\b", re.IGNORECASE)
+
+
+def set_sqlite_pragmas(engine, pragmas: dict):
+    """
+    새 SQLite 커넥션이 열릴 때마다 PRAGMA를 적용합니다.
+    AsyncEngine이 주어지면 내부 sync_engine에 등록합니다.
+    """
+    engine = getattr(engine, "sync_engine", engine)
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+
+def enable_sqlite_transactions(engine):
+    """
+    pysqlite(aiosqlite 포함)의 자체 트랜잭션 처리를 끄고 SQLAlchemy가 BEGIN을 직접 실행하게 합니다.
+
+    드라이버는 DML 직전에만 BEGIN을 보내므로 트랜잭션 밖에서 시작한 SAVEPOINT가
+    바깥 트랜잭션이 되고, RELEASE 시점에 커밋됩니다. (begin_nested 청크가 하나씩 확정됨)
+    SQLAlchemy 문서의 pysqlite SAVEPOINT 우회 방법입니다.
+    """
+    engine = getattr(engine, "sync_engine", engine)
+
+    @event.listens_for(engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+
+def _engine_options(writer: bool) -> dict:
+    options = settings.get_pool_config()
+    if writer:
+        # writer는 커넥션 하나만 사용하여 쓰기를 프로세스 안에서 직렬화
+        options.update(pool_size=1, max_overflow=0)
+    return options
+
+
+def create_sqlite_engine(url: str, writer: bool = False):
+    """SQLite 성능 프로필(PRAGMA, 풀 설정)을 적용한 엔진 생성"""
+    engine = create_engine(url, connect_args=SQLITE_CONNECT_ARGS, poolclass=TimedQueuePool,
+                           **_engine_options(writer))
+    enable_sqlite_transactions(engine)
+    set_sqlite_pragmas(engine, settings.get_sqlite_pragmas())
+    return engine
+
+
+def create_async_sqlite_engine(url: str, writer: bool = False):
+    """aiosqlite용 SQLite 성능 프로필 엔진 생성"""
+    engine = create_async_engine(url, poolclass=TimedAsyncAdaptedQueuePool, **_engine_options(writer))
+    enable_sqlite_transactions(engine)
+    set_sqlite_pragmas(engine, settings.get_sqlite_pragmas())
+    return engine
+
+
+def _is_write(clause) -> bool:
+    if isinstance(clause, UpdateBase):
+        return True
+    return isinstance(clause, TextClause) and not _READ_ONLY_SQL.match(clause.text)
+
+
+class RoutingSession(Session):
+    """
+    읽기는 기본 엔진으로, flush와 INSERT/UPDATE/DELETE 문은 writer 엔진으로 보내는 세션
+
+    WAL 모드에서 읽기 커넥션은 쓰기에 막히지 않으며, 쓰기는 단일 writer 커넥션에서
+    순서대로 처리되어 "database is locked" 경합이 생기지 않습니다.
+    한 번 flush 하거나 DML을 실행한 트랜잭션은 끝날 때까지 모든 문장을 writer에서 실행하므로
+    커밋 전의 자기 쓰기를 읽을 수 있고, 쓰기가 두 커넥션에 나뉘어 커밋되지 않습니다.
+    """
+
+    def __init__(self, *args, writer_bind=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.writer_bind = writer_bind
+        self._writing = False
+        event.listen(self, "after_transaction_end", self._after_transaction_end)
+
+    def _after_transaction_end(self, session, transaction):
+        if transaction.parent is None:
+            self._writing = False
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self.writer_bind is not None and (self._writing or self._flushing or _is_write(clause)):
+            self._writing = True
+            return self.writer_bind
+        return super().get_bind(mapper=mapper, clause=clause, **kw)
@@ -0,0 +1,17 @@
+"""
+조건부 요청(ETag)용 버전 값 조회
+
+본문 대신 updated_at과 행 수만 읽는 가벼운 쿼리로, 인덱스만으로 처리되거나 행 하나만 읽습니다.
+행 수를 함께 보므로 최근 수정 시각이 그대로인 삭제도 버전 변경으로 드러납니다.
+
+    version = db.execute(select(*count_and_latest(Task, Task.project_id == project_id))).one()
+"""
+from sqlalchemy import func, select
+
+
+def count_and_latest(model, *criteria):
+    """(행 수, 최근 updated_at) 스칼라 서브쿼리 - 바깥 쿼리의 행과 자동으로 연결(correlate)됩니다."""
+    return (
+        select(func.count()).select_from(model).where(*criteria).scalar_subquery(),
+        select(func.max(model.updated_at)).where(*criteria).scalar_subquery(),
+    )
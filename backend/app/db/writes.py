@@ -0,0 +1,97 @@
+from sqlalchemy import delete, exists, inspect, update
+from sqlalchemy.orm import ONETOMANY
+
+from ..models.search import SEARCH_SOURCES, sync_entries
+
+
+class DeleteConflictError(Exception):
+    """하위 행이 남아 있어 삭제할 수 없는 경우"""
+
+
+def unloaded_columns(obj) -> set:
+    """
+    flush/commit 이후에도 값이 채워지지 않은 컬럼 속성 이름을 반환합니다.
+    (RETURNING으로 받아오지 못한 서버 생성 값이나 커밋으로 만료된 값)
+    """
+    state = inspect(obj)
+    return {attr.key for attr in state.mapper.column_attrs} & state.unloaded
+
+
+def commit_and_load(db, obj):
+    """
+    커밋 후 객체를 반환합니다.
+
+    생성 컬럼은 INSERT/UPDATE ... RETURNING(eager_defaults)과 클라이언트 측 기본값으로
+    이미 채워져 있으므로, 비어 있는 컬럼이 남은 경우에만 refresh(SELECT)를 실행합니다.
+    """
+    db.commit()
+    if unloaded_columns(obj):
+        db.refresh(obj)
+    return obj
+
+
+async def commit_and_load_async(db, obj):
+    """commit_and_load의 AsyncSession 버전"""
+    await db.commit()
+    if unloaded_columns(obj):
+        await db.refresh(obj)
+    return obj
+
+
+def update_by_id(db, model, row_id, values: dict, *criteria):
+    """
+    대상을 먼저 조회하지 않고 UPDATE ... WHERE id = :id RETURNING 한 문장으로 수정합니다.
+    onupdate(updated_at 등)는 UPDATE 문에 그대로 적용됩니다.
+    flush 이벤트를 거치지 않으므로 검색 색인 대상 모델은 같은 트랜잭션에서 색인을 맞춥니다.
+    criteria는 추가 WHERE 조건입니다. (예: updated_at == 읽은 시점 값으로 낙관적 동시성 확인)
+
+    Returns:
+        수정된 ORM 객체, 대상이 없거나 criteria를 만족하지 않으면 None
+    """
+    stmt = update(model).where(model.id == row_id, *criteria).values(**values).returning(model)
+    obj = db.execute(stmt).scalars().one_or_none()
+    if obj is None:
+        db.rollback()
+        return None
+    if model in SEARCH_SOURCES:
+        sync_entries(db, model, [row_id])
+    db.commit()
+    return obj
+
+
+def delete_by_id(db, model, row_id) -> bool:
+    """
+    대상을 로드하지 않고 DELETE ... WHERE id = :id 로 삭제합니다.
+
+    ORM의 db.delete()와 같은 의미를 유지하기 위해 일대다 관계의 하위 행은
+    FK가 nullable이면 NULL로 바꾸고, NOT NULL이면 하위 행이 없을 때만 삭제합니다.
+    검색 색인 대상 모델은 같은 트랜잭션에서 색인 행도 삭제합니다.
+
+    Returns:
+        bool: 삭제 여부 (대상이 없으면 False)
+
+    Raises:
+        DeleteConflictError: 하위 행이 남아 있는 경우
+    """
+    guards = []
+    for rel in inspect(model).relationships:
+        if rel.direction is not ONETOMANY or rel.viewonly:
+            continue
+        for _, remote in rel.local_remote_pairs:
+            if remote.nullable:
+                # ORM UPDATE로 실행해야 세션에 로드된 하위 객체에도 반영됨
+                key = rel.mapper.get_property_by_column(remote).key
+                db.execute(update(rel.mapper.class_).where(remote == row_id).values({key: None}))
+            else:
+                guards.append(~exists().where(remote == row_id))
+
+    result = db.execute(delete(model).where(model.id == row_id, *guards))
+    if result.rowcount == 0:
+        db.rollback()
+        if guards and db.get(model, row_id) is not None:
+            raise DeleteConflictError("연결된 하위 데이터가 있어 삭제할 수 없습니다.")
+        return False
+    if model in SEARCH_SOURCES:
+        sync_entries(db, model, [row_id])
+    db.commit()
+    return True
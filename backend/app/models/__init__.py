@@ -1 +1,3 @@
-# 데이터베이스 모델들 
\ No newline at end of file
+# 데이터베이스 모델들
+# 관계(relationship)의 문자열 참조가 해석되도록 공통 Base를 사용하는 모델을 모두 등록
+from . import user, client, contract, worker, labor_cost, revenue, expense, document, financial_summary, job, upload_session, blob, search
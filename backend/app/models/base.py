@@ -10,6 +10,9 @@ class Base:
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
+    # 서버 생성 값은 INSERT/UPDATE ... RETURNING으로 함께 받아와 별도 SELECT를 생략
+    __mapper_args__ = {"eager_defaults": True}
+
     @declared_attr
     def __tablename__(cls) -> str:
         return cls.__name__.lower() 
\ No newline at end of file
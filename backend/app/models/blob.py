@@ -0,0 +1,54 @@
+from functools import lru_cache
+from typing import Sequence, Tuple
+from sqlalchemy import BigInteger, Integer, String, bindparam, event, inspect
+from sqlalchemy.orm import Mapped, mapped_column
+from .base import Base
+from .document import Document
+
+class Blob(Base):
+    """
+    내용 주소(SHA-256) 기반 파일 저장소의 파일 한 개
+    같은 내용의 파일은 한 번만 저장되고, 이를 가리키는 Document 수를 ref_count로 관리합니다.
+    ref_count는 Document의 ORM flush 이벤트로 갱신되며, ORM을 거치지 않고 삭제한 경우에는
+    app.services.blob_store의 recount/gc가 Document 테이블 기준으로 다시 맞춥니다.
+    """
+    sha256: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
+    size: Mapped[int] = mapped_column(BigInteger, nullable=False)  # 파일 크기 (bytes)
+    ref_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)  # 참조하는 Document 수
+
+    def __repr__(self):
+        return f"<Blob {self.sha256} refs={self.ref_count}>"
+
+
+@lru_cache(maxsize=None)
+def _reference_statement():
+    table = Blob.__table__
+    return table.update().where(table.c.sha256 == bindparam("hash")).values(
+        ref_count=table.c.ref_count + bindparam("delta")
+    )
+
+
+def add_references(connection, deltas: Sequence[Tuple[str, int]]):
+    """(sha256, 증감) 목록을 ref_count에 한 번의 executemany로 더합니다."""
+    deltas = [{"hash": sha256, "delta": delta} for sha256, delta in deltas if sha256 and delta]
+    if deltas:
+        connection.execute(_reference_statement(), deltas)
+
+
+@event.listens_for(Document, "after_insert")
+def _after_insert(mapper, connection, target):
+    add_references(connection, [(target.sha256, 1)])
+
+
+@event.listens_for(Document, "after_update")
+def _after_update(mapper, connection, target):
+    history = inspect(target).attrs.sha256.history
+    if history.has_changes():
+        old = history.deleted[0] if history.deleted else None
+        add_references(connection, [(old, -1), (target.sha256, 1)])
+
+
+@event.listens_for(Document, "after_delete")
+def _after_delete(mapper, connection, target):
+    history = inspect(target).attrs.sha256.history
+    add_references(connection, [(history.deleted[0] if history.deleted else target.sha256, -1)])
@@ -1,5 +1,5 @@
 from sqlalchemy import String, Text
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from .base import Base
 
 class Client(Base):
@@ -14,5 +14,8 @@ class Client(Base):
     email: Mapped[str] = mapped_column(String(255), nullable=True)
     address: Mapped[str] = mapped_column(Text, nullable=True)
 
+    # 관계 설정
+    contracts = relationship("Contract", back_populates="client")
+
     def __repr__(self):
         return f"<Client {self.company_name}>" 
\ No newline at end of file
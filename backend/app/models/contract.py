@@ -1,4 +1,4 @@
-from sqlalchemy import String, Date, Numeric, ForeignKey
+from sqlalchemy import String, Date, Numeric, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from uuid import UUID
 from .base import Base
@@ -7,6 +7,11 @@ class Contract(Base):
     """
     계약 정보를 관리하는 모델
     """
+    __table_args__ = (
+        # 커서 페이지네이션용 (created_at, id) 복합 인덱스
+        Index("ix_contract_created_at_id", "created_at", "id"),
+    )
+
     contract_number: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
     client_id: Mapped[UUID] = mapped_column(ForeignKey('client.id'), nullable=False)
     project_name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -13,6 +13,9 @@ class Document(Base):
     file_path: Mapped[str] = mapped_column(String(255), nullable=False)
     file_size: Mapped[int] = mapped_column(Integer, nullable=False)  # 파일 크기 (bytes)
     mime_type: Mapped[str] = mapped_column(String(100), nullable=False)  # 파일 형식
+    sha256: Mapped[str] = mapped_column(String(64), index=True, nullable=True, active_history=True)  # 저장소(Blob) 키
+    preview_path: Mapped[str] = mapped_column(String(500), nullable=True)  # 미리보기 이미지 경로
+    preview_status: Mapped[str] = mapped_column(String(20), nullable=True)  # pending, ready, unsupported, failed
     uploaded_by: Mapped[UUID] = mapped_column(ForeignKey('user.id'), nullable=False)
 
     # 관계 설정
@@ -1,4 +1,4 @@
-from sqlalchemy import Date, Numeric, ForeignKey, String, Text
+from sqlalchemy import Date, Numeric, ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from uuid import UUID
 from .base import Base
@@ -7,10 +7,15 @@ class Expense(Base):
     """
     비용 지출 내역을 관리하는 모델
     """
-    contract_id: Mapped[UUID] = mapped_column(ForeignKey('contract.id'), nullable=False)
+    __table_args__ = (
+        # 계약·기간별 집계용 커버링 인덱스
+        Index("ix_expense_contract_id_expense_date", "contract_id", "expense_date", "category", "amount"),
+    )
+
+    contract_id: Mapped[UUID] = mapped_column(ForeignKey('contract.id'), nullable=False, active_history=True)
     category: Mapped[str] = mapped_column(String(50), nullable=False)  # material, equipment, subcontract, other
-    amount: Mapped[float] = mapped_column(Numeric(15, 2), nullable=False)  # 비용금액
-    expense_date: Mapped[Date] = mapped_column(Date, nullable=False)  # 지출일
+    amount: Mapped[float] = mapped_column(Numeric(15, 2), nullable=False, active_history=True)  # 비용금액
+    expense_date: Mapped[Date] = mapped_column(Date, nullable=False, active_history=True)  # 지출일
     description: Mapped[str] = mapped_column(Text, nullable=True)  # 비고
     payment_status: Mapped[str] = mapped_column(String(20), default='pending')  # pending, paid
 
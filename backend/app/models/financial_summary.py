@@ -0,0 +1,141 @@
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Sequence, Tuple
+from sqlalchemy import ForeignKey, Integer, Numeric, String, UniqueConstraint, bindparam, event, inspect
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Mapped, mapped_column
+from uuid import UUID
+from .base import Base
+from .expense import Expense
+from .labor_cost import LaborCost
+from .revenue import Revenue
+
+class ContractMonthlySummary(Base):
+    """
+    계약·월별 수입/지출/노무비 합계 (대시보드용 집계 테이블)
+
+    Revenue, Expense, LaborCost의 ORM flush 이벤트로 증분 갱신됩니다.
+    ORM 이벤트를 거치지 않는 일괄(Core/bulk) 문으로 변경한 경우에는
+    app.services.financial_rollup의 rebuild로 다시 계산해야 합니다.
+    """
+    __table_args__ = (
+        UniqueConstraint("contract_id", "month", name="uq_contractmonthlysummary_contract_id_month"),
+    )
+
+    contract_id: Mapped[UUID] = mapped_column(ForeignKey('contract.id'), nullable=False)
+    month: Mapped[str] = mapped_column(String(7), nullable=False)  # YYYY-MM
+    revenue_total: Mapped[Decimal] = mapped_column(Numeric(15, 2), nullable=False, default=0)
+    revenue_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    expense_total: Mapped[Decimal] = mapped_column(Numeric(15, 2), nullable=False, default=0)
+    expense_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    labor_cost_total: Mapped[Decimal] = mapped_column(Numeric(15, 2), nullable=False, default=0)
+    labor_cost_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<ContractMonthlySummary {self.contract_id} {self.month}>"
+
+
+# 집계 대상 모델: (합계 컬럼 접두사, 날짜 속성, 금액 속성)
+ROLLUP_SOURCES = {
+    Revenue: ("revenue", "payment_date", "amount"),
+    Expense: ("expense", "expense_date", "amount"),
+    LaborCost: ("labor_cost", "work_date", "total_amount"),
+}
+
+
+def month_key(value) -> str:
+    return value.strftime("%Y-%m")
+
+
+def _decimal(value) -> Decimal:
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+@lru_cache(maxsize=None)
+def _summary_statements(dialect_name: str, prefix: str):
+    """(contract_id, month) 증감 UPSERT 문과 빈 행 삭제 문 (dialect·구분별로 한 번만 생성)"""
+    table = ContractMonthlySummary.__table__
+    total_col, count_col = f"{prefix}_total", f"{prefix}_count"
+    dialect = postgresql if dialect_name == "postgresql" else sqlite
+    insert = dialect.insert(table).values(
+        contract_id=bindparam("contract_id"), month=bindparam("month"),
+        **{total_col: bindparam("amount"), count_col: bindparam("count")}
+    )
+    upsert = insert.on_conflict_do_update(
+        index_elements=[table.c.contract_id, table.c.month],
+        set_={
+            total_col: table.c[total_col] + insert.excluded[total_col],
+            count_col: table.c[count_col] + insert.excluded[count_col],
+            "updated_at": insert.excluded.updated_at,
+        },
+    )
+    prune = table.delete().where(
+        table.c.contract_id == bindparam("contract_id"),
+        table.c.month == bindparam("month"),
+        table.c.revenue_count == 0,
+        table.c.expense_count == 0,
+        table.c.labor_cost_count == 0,
+    )
+    return upsert, prune
+
+
+def add_to_summary(connection, prefix: str, deltas: Sequence[Tuple[Any, str, Decimal, int]]):
+    """
+    (contract_id, month, 금액 증감, 건수 증감) 목록을 집계 테이블에 한 번의 executemany로 더하고,
+    건수가 줄어든 행 중 모든 건수가 0이 된 행은 삭제합니다.
+    """
+    if not deltas:
+        return
+    upsert, prune = _summary_statements(connection.dialect.name, prefix)
+    connection.execute(upsert, [
+        {"contract_id": contract_id, "month": month, "amount": amount, "count": count}
+        for contract_id, month, amount, count in deltas
+    ])
+    decreased = [{"contract_id": contract_id, "month": month}
+                 for contract_id, month, _, count in deltas if count < 0]
+    if decreased:
+        connection.execute(prune, decreased)
+
+
+def _current(target, date_attr: str, amount_attr: str):
+    return target.contract_id, getattr(target, date_attr), getattr(target, amount_attr)
+
+
+def _previous(target, date_attr: str, amount_attr: str):
+    """
+    flush 직전(변경 전) 값. 변경되지 않은 속성은 현재 값을 사용
+    (원본 모델의 해당 컬럼은 active_history=True로 변경 전 값을 항상 보존)
+    """
+    attrs = inspect(target).attrs
+    values = []
+    for name in ("contract_id", date_attr, amount_attr):
+        history = attrs[name].history
+        values.append(history.deleted[0] if history.deleted else getattr(target, name))
+    return tuple(values)
+
+
+def _register(model, prefix: str, date_attr: str, amount_attr: str):
+    @event.listens_for(model, "after_insert")
+    def _after_insert(mapper, connection, target):
+        contract_id, day, amount = _current(target, date_attr, amount_attr)
+        add_to_summary(connection, prefix, [(contract_id, month_key(day), _decimal(amount), 1)])
+
+    @event.listens_for(model, "after_update")
+    def _after_update(mapper, connection, target):
+        old = _previous(target, date_attr, amount_attr)
+        new = _current(target, date_attr, amount_attr)
+        old_key, new_key = (old[0], month_key(old[1])), (new[0], month_key(new[1]))
+        if old_key == new_key:
+            if _decimal(old[2]) != _decimal(new[2]):
+                add_to_summary(connection, prefix, [(*new_key, _decimal(new[2]) - _decimal(old[2]), 0)])
+            return
+        add_to_summary(connection, prefix, [(*new_key, _decimal(new[2]), 1), (*old_key, -_decimal(old[2]), -1)])
+
+    @event.listens_for(model, "after_delete")
+    def _after_delete(mapper, connection, target):
+        contract_id, day, amount = _previous(target, date_attr, amount_attr)
+        add_to_summary(connection, prefix, [(contract_id, month_key(day), -_decimal(amount), -1)])
+
+
+for _model, (_prefix, _date_attr, _amount_attr) in ROLLUP_SOURCES.items():
+    _register(_model, _prefix, _date_attr, _amount_attr)
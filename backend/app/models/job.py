@@ -0,0 +1,32 @@
+from datetime import datetime
+from sqlalchemy import DateTime, Index, Integer, JSON, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+from .base import Base
+
+class Job(Base):
+    """
+    백그라운드 작업(문서 생성 등)을 관리하는 모델
+    요청 스레드 밖의 워커 프로세스에서 실행되며, 상태는 이 테이블로 조회합니다.
+    """
+    __table_args__ = (
+        # 디스패처가 실행할 작업을 찾는 조건 (status, run_after)
+        Index("ix_job_status_run_after", "status", "run_after"),
+    )
+
+    kind: Mapped[str] = mapped_column(String(50), nullable=False)  # contract_document
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default='queued')  # queued, running, succeeded, failed
+    params: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=3)
+    run_after: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)  # 재시도 대기
+    started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+    claimed_by: Mapped[str] = mapped_column(String(100), nullable=True)  # 실행 중인 디스패처 id
+    lease_expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)  # 실행 임대 만료 시각
+    finished_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+    error: Mapped[str] = mapped_column(Text, nullable=True)
+    result_path: Mapped[str] = mapped_column(String(500), nullable=True)  # 생성된 파일 경로
+    result_name: Mapped[str] = mapped_column(String(255), nullable=True)  # 다운로드 파일 이름
+    mime_type: Mapped[str] = mapped_column(String(100), nullable=True)
+
+    def __repr__(self):
+        return f"<Job {self.kind} {self.status}>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Date, Numeric, ForeignKey, String
+from sqlalchemy import Date, Numeric, ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from uuid import UUID
 from .base import Base
@@ -7,12 +7,17 @@ class LaborCost(Base):
     """
     인건비 지급 내역을 관리하는 모델
     """
-    contract_id: Mapped[UUID] = mapped_column(ForeignKey('contract.id'), nullable=False)
+    __table_args__ = (
+        # 계약·기간별 집계용 커버링 인덱스
+        Index("ix_laborcost_contract_id_work_date", "contract_id", "work_date", "total_amount"),
+    )
+
+    contract_id: Mapped[UUID] = mapped_column(ForeignKey('contract.id'), nullable=False, active_history=True)
     worker_id: Mapped[UUID] = mapped_column(ForeignKey('worker.id'), nullable=False)
-    work_date: Mapped[Date] = mapped_column(Date, nullable=False)
+    work_date: Mapped[Date] = mapped_column(Date, nullable=False, active_history=True)
     hours_worked: Mapped[float] = mapped_column(Numeric(5, 2), nullable=False)  # 작업시간
     hourly_rate: Mapped[float] = mapped_column(Numeric(10, 2), nullable=False)  # 시급
-    total_amount: Mapped[float] = mapped_column(Numeric(15, 2), nullable=False)  # 총액
+    total_amount: Mapped[float] = mapped_column(Numeric(15, 2), nullable=False, active_history=True)  # 총액
     payment_status: Mapped[str] = mapped_column(String(20), default='pending')  # pending, paid
 
     # 관계 설정
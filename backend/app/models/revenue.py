@@ -1,4 +1,4 @@
-from sqlalchemy import Date, Numeric, ForeignKey, String, Text
+from sqlalchemy import Date, Numeric, ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from uuid import UUID
 from .base import Base
@@ -7,9 +7,14 @@ class Revenue(Base):
     """
     수입 내역을 관리하는 모델
     """
-    contract_id: Mapped[UUID] = mapped_column(ForeignKey('contract.id'), nullable=False)
-    amount: Mapped[float] = mapped_column(Numeric(15, 2), nullable=False)  # 수입금액
-    payment_date: Mapped[Date] = mapped_column(Date, nullable=False)  # 수입일
+    __table_args__ = (
+        # 계약·기간별 집계용 커버링 인덱스
+        Index("ix_revenue_contract_id_payment_date", "contract_id", "payment_date", "payment_type", "amount"),
+    )
+
+    contract_id: Mapped[UUID] = mapped_column(ForeignKey('contract.id'), nullable=False, active_history=True)
+    amount: Mapped[float] = mapped_column(Numeric(15, 2), nullable=False, active_history=True)  # 수입금액
+    payment_date: Mapped[Date] = mapped_column(Date, nullable=False, active_history=True)  # 수입일
     payment_type: Mapped[str] = mapped_column(String(20), nullable=False)  # cash, transfer, check
     status: Mapped[str] = mapped_column(String(20), default='pending')  # pending, received
     description: Mapped[str] = mapped_column(Text, nullable=True)  # 비고
@@ -0,0 +1,182 @@
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Sequence, Tuple
+from uuid import UUID
+from sqlalchemy import DDL, BigInteger, Index, String, Text, UniqueConstraint, bindparam, event, inspect, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Mapped, Session, mapped_column
+from .base import Base
+from .client import Client
+from .contract import Contract
+from .document import Document
+
+# SQLite FTS5 색인 테이블 (search_key를 rowid로 사용, entity 열은 MATCH 식 안에서 대상을 거르는 용도)
+FTS_TABLE = "searchentry_fts"
+# 한글은 조사가 붙고 띄어쓰기가 일정하지 않으므로 단어를 2글자 단위(bigram)로 나눠 색인
+WORD = re.compile(r"[^\W_]+")
+
+
+class SearchEntry(Base):
+    """
+    통합 검색 색인 행 (계약·발주처·문서 한 건당 한 행)
+
+    label/detail은 검색 결과 표시용 원문이고, terms/extra_terms는 bigram으로 나눈 색인용 문자열입니다.
+    SQLite는 FTS5 테이블(searchentry_fts), PostgreSQL은 tsvector GIN 인덱스로 검색합니다.
+    원본 모델의 ORM flush 이벤트로 갱신되며, 이벤트를 거치지 않은 변경은
+    app.services.search의 rebuild로 다시 만듭니다.
+    """
+    __table_args__ = (
+        UniqueConstraint("search_key", name="uq_searchentry_search_key"),
+        Index("ix_searchentry_entity_entity_id", "entity", "entity_id"),
+    )
+
+    search_key: Mapped[int] = mapped_column(BigInteger, nullable=False)  # FTS rowid (entity_id에서 계산)
+    entity: Mapped[str] = mapped_column(String(20), nullable=False)  # contract, client, document
+    entity_id: Mapped[UUID] = mapped_column(nullable=False)
+    label: Mapped[str] = mapped_column(String(255), nullable=False)  # 공사명, 회사명, 파일명
+    detail: Mapped[str] = mapped_column(String(255), nullable=True)  # 계약번호, 사업자번호, 문서 유형
+    terms: Mapped[str] = mapped_column(Text, nullable=False)  # label 색인어 (가중치 높음)
+    extra_terms: Mapped[str] = mapped_column(Text, nullable=False, default="")
+
+    def __repr__(self):
+        return f"<SearchEntry {self.entity} {self.label}>"
+
+
+# PostgreSQL: 제목 A, 나머지 B 가중치의 tsvector ('simple' 설정 - bigram을 그대로 사용)
+PG_SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple', terms), 'A') || setweight(to_tsvector('simple', extra_terms), 'B')"
+)
+
+event.listen(SearchEntry.__table__, "after_create", DDL(
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(entity, terms, extra_terms, tokenize='unicode61')"
+).execute_if(dialect="sqlite"))
+event.listen(SearchEntry.__table__, "before_drop", DDL(f"DROP TABLE IF EXISTS {FTS_TABLE}").execute_if(dialect="sqlite"))
+event.listen(SearchEntry.__table__, "after_create", DDL(
+    f"CREATE INDEX IF NOT EXISTS ix_searchentry_vector ON searchentry USING gin (({PG_SEARCH_VECTOR}))"
+).execute_if(dialect="postgresql"))
+
+
+def normalize(value: str) -> str:
+    # 전각/반각 통일, 소문자, 사업자번호 등의 '-' 제거 (123-45-67890 → 1234567890)
+    return unicodedata.normalize("NFKC", value).lower().replace("-", "")
+
+
+def bigrams(word: str) -> list:
+    return [word] if len(word) == 1 else [word[i:i + 2] for i in range(len(word) - 1)]
+
+
+def index_terms(*values) -> str:
+    """값들을 단어별 bigram으로 나눈 색인 문자열 ("신축공사" → "신축 축공 공사")"""
+    return " ".join(
+        gram for value in values if value for word in WORD.findall(normalize(str(value))) for gram in bigrams(word)
+    )
+
+
+def search_key(entity_id: UUID) -> int:
+    """FTS rowid로 쓸 63비트 정수 (UUID 하위 비트)"""
+    return entity_id.int & 0x7FFF_FFFF_FFFF_FFFF
+
+
+# 색인 대상 모델: (entity 이름, 색인 필드, 대상 → (label, detail, 추가 색인 값))
+SEARCH_SOURCES: Dict[type, Tuple[str, Tuple[str, ...], Callable]] = {
+    Contract: ("contract", ("project_name", "contract_number"),
+               lambda c: (c.project_name, c.contract_number, (c.contract_number,))),
+    Client: ("client", ("company_name", "business_number", "representative_name"),
+             lambda c: (c.company_name, c.business_number, (c.business_number, c.representative_name))),
+    Document: ("document", ("file_name", "document_type"),
+               lambda d: (d.file_name, d.document_type, ())),
+}
+
+
+def entry_values(model, target) -> dict:
+    entity, _, describe = SEARCH_SOURCES[model]
+    label, detail, extra = describe(target)
+    return {
+        "search_key": search_key(target.id), "entity": entity, "entity_id": target.id,
+        "label": label, "detail": detail, "terms": index_terms(label), "extra_terms": index_terms(*extra),
+    }
+
+
+@lru_cache(maxsize=None)
+def _entry_statements(dialect_name: str):
+    table = SearchEntry.__table__
+    dialect = postgresql if dialect_name == "postgresql" else sqlite
+    insert = dialect.insert(table)
+    upsert = insert.on_conflict_do_update(
+        index_elements=[table.c.search_key],
+        set_={name: insert.excluded[name] for name in ("label", "detail", "terms", "extra_terms", "updated_at")},
+    )
+    remove = table.delete().where(table.c.search_key.in_(bindparam("keys", expanding=True)))
+    return upsert, remove
+
+
+def write_entries(connection, entries: Iterable[dict], replace: bool = True):
+    """
+    색인 행을 UPSERT 합니다. SQLite는 FTS5 색인도 같은 트랜잭션에서 교체합니다.
+    (replace=False는 비운 색인을 다시 채울 때 기존 FTS 행 삭제를 생략)
+    """
+    entries = list(entries)
+    if not entries:
+        return
+    upsert, _ = _entry_statements(connection.dialect.name)
+    connection.execute(upsert, entries)
+    if connection.dialect.name == "sqlite":
+        if replace:
+            keys = [{"key": entry["search_key"]} for entry in entries]
+            connection.execute(text(f"DELETE FROM {FTS_TABLE} WHERE rowid = :key"), keys)
+        connection.execute(
+            text(f"INSERT INTO {FTS_TABLE} (rowid, entity, terms, extra_terms) "
+                 f"VALUES (:search_key, :entity, :terms, :extra_terms)"),
+            [{k: entry[k] for k in ("search_key", "entity", "terms", "extra_terms")} for entry in entries],
+        )
+
+
+def remove_entries(connection, keys: Iterable[int]):
+    keys = list(keys)
+    if not keys:
+        return
+    _, remove = _entry_statements(connection.dialect.name)
+    connection.execute(remove, {"keys": keys})
+    if connection.dialect.name == "sqlite":
+        connection.execute(text(f"DELETE FROM {FTS_TABLE} WHERE rowid = :key"), [{"key": key} for key in keys])
+
+
+def write_connection(session: Session):
+    """색인을 쓸 커넥션 (RoutingSession은 DML 문을 writer로 보내므로 같은 기준으로 선택)"""
+    return session.connection(bind_arguments={"clause": SearchEntry.__table__.delete()})
+
+
+def sync_entries(session: Session, model, ids: Sequence, chunk_size: int = 500):
+    """
+    주어진 id의 색인 행을 현재 테이블 내용으로 다시 맞춥니다. (행이 없으면 색인에서 삭제)
+    flush 이벤트를 거치지 않는 일괄 INSERT/UPDATE/DELETE 뒤에 같은 트랜잭션에서 호출합니다.
+    """
+    connection = write_connection(session)
+    table = model.__table__
+    for start in range(0, len(ids), chunk_size):
+        chunk = list(ids[start:start + chunk_size])
+        rows = connection.execute(select(table).where(table.c.id.in_(chunk))).all()
+        write_entries(connection, (entry_values(model, row) for row in rows))
+        found = {row.id for row in rows}
+        remove_entries(connection, (search_key(row_id) for row_id in chunk if row_id not in found))
+
+
+def _register(model, fields: Tuple[str, ...]):
+    @event.listens_for(model, "after_insert")
+    def _after_insert(mapper, connection, target):
+        write_entries(connection, [entry_values(model, target)])
+
+    @event.listens_for(model, "after_update")
+    def _after_update(mapper, connection, target):
+        attrs = inspect(target).attrs
+        if any(attrs[name].history.has_changes() for name in fields):
+            write_entries(connection, [entry_values(model, target)])
+
+    @event.listens_for(model, "after_delete")
+    def _after_delete(mapper, connection, target):
+        remove_entries(connection, [search_key(target.id)])
+
+
+for _model, (_entity, _fields, _) in SEARCH_SOURCES.items():
+    _register(_model, _fields)
@@ -6,6 +6,7 @@ import uuid
 
 class Transaction(Base):
     __tablename__ = "transactions"
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     transaction_type = Column(String, nullable=False, index=True)  # income(수입), expense(지출)
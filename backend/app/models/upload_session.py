@@ -0,0 +1,23 @@
+from sqlalchemy import BigInteger, ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column
+from uuid import UUID
+from .base import Base
+
+class UploadSession(Base):
+    """
+    이어받기 가능한 파일 업로드 세션
+    청크를 받을 때마다 받은 크기(received_size)를 기록하고, 전체를 받으면 Document 행을 생성합니다.
+    """
+    contract_id: Mapped[UUID] = mapped_column(ForeignKey('contract.id'), nullable=False)
+    document_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    file_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    mime_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    uploaded_by: Mapped[UUID] = mapped_column(ForeignKey('user.id'), nullable=False)
+    total_size: Mapped[int] = mapped_column(BigInteger, nullable=False)  # 전체 파일 크기 (bytes)
+    received_size: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)  # 다음 청크 시작 위치
+    sha256: Mapped[str] = mapped_column(String(64), nullable=True)  # 클라이언트가 보낸 값 또는 완료 시 계산 값
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default='uploading')  # uploading, completed, failed
+    document_id: Mapped[UUID] = mapped_column(ForeignKey('document.id'), nullable=True)
+
+    def __repr__(self):
+        return f"<UploadSession {self.file_name} {self.received_size}/{self.total_size}>"
@@ -1,5 +1,5 @@
 from sqlalchemy import String, Boolean
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from uuid import UUID
 from .base import Base
 
@@ -12,5 +12,9 @@ class User(Base):
     phone: Mapped[str] = mapped_column(String(20), nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
 
+    # 관계 설정
+    created_contracts = relationship("Contract", back_populates="creator")
+    uploaded_documents = relationship("Document", back_populates="uploader")
+
     def __repr__(self):
         return f"<User {self.email}>" 
\ No newline at end of file
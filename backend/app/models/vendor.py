@@ -6,6 +6,7 @@ import uuid
 
 class Vendor(Base):
     __tablename__ = "vendors"
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     company_name = Column(String, nullable=False, index=True)
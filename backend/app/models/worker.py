@@ -1,5 +1,5 @@
 from sqlalchemy import String, Boolean, Numeric
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from .base import Base
 
 class Worker(Base):
@@ -14,5 +14,8 @@ class Worker(Base):
     hourly_rate: Mapped[float] = mapped_column(Numeric(10, 2), nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
 
+    # 관계 설정
+    labor_costs = relationship("LaborCost", back_populates="worker")
+
     def __repr__(self):
         return f"<Worker {self.full_name}>" 
\ No newline at end of file
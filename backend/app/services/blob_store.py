@@ -0,0 +1,193 @@
+"""
+내용 주소(SHA-256) 기반 문서 저장소와 참조 정리
+
+파일은 settings.upload_path/blobs/ab/cd/abcd... 형태로 해시 앞 네 자리로 나눈 디렉토리에 저장되고,
+Document.file_path와 Document.sha256이 같은 파일(Blob)을 가리킵니다.
+
+    python -m app.services.blob_store recount            # ref_count를 Document 기준으로 다시 계산
+    python -m app.services.blob_store gc [--dry-run]     # 참조가 없는 파일 삭제
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Optional
+
+from pydantic import BaseModel
+from sqlalchemy import delete, exists, func, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from ..models.blob import Blob
+from ..models.document import Document
+from .previews import preview_path_for
+
+BLOB_DIR = "blobs"
+# 저장 직후 아직 커밋되지 않은 파일/행을 지우지 않도록 이 시간보다 오래된 것만 정리
+GC_GRACE_SECONDS = 3600
+
+
+class GarbageReport(BaseModel):
+    blobs: int = 0  # 삭제한 (참조 없는) Blob 행
+    files: int = 0  # 삭제한 파일 (Blob 행이 없는 파일 포함)
+    freed_bytes: int = 0
+    dry_run: bool = False
+
+
+def blob_root(upload_dir: Path) -> Path:
+    return upload_dir / BLOB_DIR
+
+
+def blob_path(upload_dir: Path, sha256: str) -> Path:
+    return blob_root(upload_dir) / sha256[:2] / sha256[2:4] / sha256
+
+
+def _insert_blob(dialect_name: str, sha256: str, size: int):
+    # 이미 있는 Blob은 updated_at을 갱신하여 참조를 추가하기 전에 gc가 지우지 않도록 함
+    dialect = postgresql if dialect_name == "postgresql" else sqlite
+    return dialect.insert(Blob).values(sha256=sha256, size=size).on_conflict_do_update(
+        index_elements=[Blob.sha256], set_={"updated_at": datetime.utcnow()}
+    )
+
+
+def _move_into_store(source: Path, target: Path):
+    if target.exists():
+        # 같은 내용이 이미 있으면 새로 받은 파일은 버림
+        source.unlink(missing_ok=True)
+        return
+    target.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(source, target)
+
+
+async def store_blob(db: AsyncSession, source: Path, sha256: str, size: int, upload_dir: Path) -> Path:
+    """
+    받은 파일을 저장소로 옮기고 Blob 행을 만듭니다. (이미 있으면 updated_at만 갱신하여 재사용)
+    참조 수는 이 Blob을 가리키는 Document가 flush될 때 증가합니다.
+    """
+    target = blob_path(upload_dir, sha256)
+    await run_in_threadpool(_move_into_store, source, target)
+    await db.execute(_insert_blob(db.bind.dialect.name, sha256, size))
+    return target
+
+
+async def find_blob(db: AsyncSession, sha256: str, size: int, upload_dir: Path) -> Optional[Path]:
+    """
+    같은 해시·크기의 파일이 저장소에 있으면 경로를 반환합니다. (재업로드 생략용)
+    updated_at을 갱신하여 참조를 추가하기 전에 gc가 같은 Blob을 지우지 않도록 합니다.
+    """
+    found = await db.scalar(
+        update(Blob).where(Blob.sha256 == sha256, Blob.size == size)
+        .values(updated_at=datetime.utcnow()).returning(Blob.sha256)
+        .execution_options(synchronize_session=False)
+    )
+    if found is None:
+        return None
+    path = blob_path(upload_dir, sha256)
+    return path if path.is_file() else None
+
+
+def recount_references(db: Session) -> int:
+    """
+    ref_count를 Document 테이블 기준으로 다시 계산합니다.
+    (ORM 이벤트를 거치지 않은 일괄 삭제 등으로 어긋난 값을 바로잡음)
+
+    Returns:
+        int: 값이 바뀐 Blob 수
+    """
+    references = (
+        select(func.count()).select_from(Document).where(Document.sha256 == Blob.sha256).scalar_subquery()
+    )
+    try:
+        result = db.execute(
+            update(Blob).where(Blob.ref_count != references).values(ref_count=references)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return result.rowcount
+
+
+def collect_garbage(db: Session, upload_dir: Path, grace_seconds: int = GC_GRACE_SECONDS,
+                    dry_run: bool = False) -> GarbageReport:
+    """
+    Document가 참조하지 않는 Blob 행과 파일, Blob 행이 없는 저장소 파일을 삭제합니다.
+    ref_count가 어긋났을 수 있으므로 Document 테이블을 직접 확인하고(삭제 전 recount),
+    grace_seconds 안에 변경된 행/파일은 남겨 둡니다.
+    """
+    report = GarbageReport(dry_run=dry_run)
+    if not dry_run:
+        recount_references(db)
+    cutoff = datetime.utcnow() - timedelta(seconds=grace_seconds)
+    unreferenced = ~exists().where(Document.sha256 == Blob.sha256)
+    candidates = db.execute(
+        select(Blob.id, Blob.sha256).where(unreferenced, Blob.updated_at < cutoff)
+    ).all()
+    for blob_id, sha256 in candidates:
+        path = blob_path(upload_dir, sha256)
+        if not dry_run:
+            # 조회 이후 다시 저장/참조된 Blob은 남도록 같은 조건으로 지우고,
+            # 행을 지워 커밋한 경우에만 파일을 삭제 (도중에 실패해도 남는 것은 행 없는 파일뿐)
+            deleted = db.execute(
+                delete(Blob).where(Blob.id == blob_id, Blob.updated_at < cutoff, unreferenced)
+            ).rowcount
+            db.commit()
+            if deleted != 1:
+                continue
+        report.blobs += 1
+        if path.is_file():
+            report.files += 1
+            report.freed_bytes += path.stat().st_size
+        if not dry_run:
+            path.unlink(missing_ok=True)
+            preview_path_for(str(path)).unlink(missing_ok=True)
+
+    known = set(db.scalars(select(Blob.sha256)))
+    root = blob_root(upload_dir)
+    orphans: List[Path] = []
+    if root.is_dir():
+        now = time.time()
+        for path in root.glob("*/*/*"):
+            # 미리보기(<해시>.preview.jpg)는 원본 Blob이 남아 있으면 유지
+            if path.is_file() and path.name.split(".", 1)[0] not in known \
+                    and now - path.stat().st_mtime > grace_seconds:
+                orphans.append(path)
+    for path in orphans:
+        report.files += 1
+        report.freed_bytes += path.stat().st_size
+        if not dry_run:
+            path.unlink(missing_ok=True)
+    return report
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="문서 저장소(Blob) 관리")
+    parser.add_argument("command", choices=["recount", "gc"])
+    parser.add_argument("--dry-run", action="store_true", help="삭제하지 않고 대상만 집계")
+    parser.add_argument("--grace-seconds", type=int, default=GC_GRACE_SECONDS,
+                        help="이 시간(초) 안에 저장된 파일은 삭제하지 않음")
+    args = parser.parse_args(argv)
+
+    from ..core.config import settings
+    from ..db.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        if args.command == "recount":
+            print(f"참조 수가 바뀐 파일 {recount_references(db)}건을 수정했습니다.")
+            return 0
+        report = collect_garbage(db, settings.upload_path, args.grace_seconds, args.dry_run)
+        action = "삭제 대상" if report.dry_run else "삭제"
+        print(f"{action}: Blob 행 {report.blobs}건, 파일 {report.files}개 ({report.freed_bytes:,} bytes)")
+        return 0
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
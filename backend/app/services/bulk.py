@@ -0,0 +1,195 @@
+from typing import Any, Callable, List, Sequence, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+from ..models.search import SEARCH_SOURCES, sync_entries
+
+
+class BulkRequest(BaseModel):
+    """일괄 처리 요청 (항목별로 검증하므로 원본 dict로 받음)"""
+    create: List[dict] = []
+    update: List[dict] = []  # 각 항목은 "id"와 변경할 필드를 포함
+    delete: List[Any] = []  # 삭제할 id 목록
+
+    @property
+    def size(self) -> int:
+        return len(self.create) + len(self.update) + len(self.delete)
+
+
+class BulkCreated(BaseModel):
+    index: int
+    id: Any
+
+
+class BulkItemError(BaseModel):
+    op: str  # create, update, delete
+    index: int
+    detail: str
+
+
+class BulkResult(BaseModel):
+    created: List[BulkCreated] = []
+    updated: int = 0
+    deleted: int = 0
+    errors: List[BulkItemError] = []
+
+
+def _chunks(items: Sequence, size: int):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _describe(error: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(map(str, e['loc']))}: {e['msg']}" for e in error.errors())
+
+
+def _run_chunk(db: Session, op: str, chunk: List[Tuple[int, Any]], result: BulkResult,
+               run_many: Callable[[List[Any]], None], run_one: Callable[[int, Any], None]):
+    """
+    청크 전체를 하나의 SAVEPOINT에서 실행하고, 실패하면 어떤 항목이 원인인지
+    알 수 있도록 항목별 SAVEPOINT로 다시 실행합니다.
+    """
+    try:
+        with db.begin_nested():
+            run_many([item for _, item in chunk])
+        return
+    except DBAPIError:
+        pass
+    for index, item in chunk:
+        try:
+            with db.begin_nested():
+                run_one(index, item)
+        except DBAPIError as e:
+            result.errors.append(BulkItemError(op=op, index=index, detail=str(e.orig)))
+
+
+def _bulk_create(db, model, schema, items, chunk_size, result):
+    valid = []
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, schema(**item).dict()))
+        except ValidationError as e:
+            result.errors.append(BulkItemError(op="create", index=index, detail=_describe(e)))
+
+    stmt = insert(model).returning(model.id, sort_by_parameter_order=True)
+    for chunk in _chunks(valid, chunk_size):
+        def run_many(rows, chunk=chunk):
+            # 다중 행 INSERT ... RETURNING 한 번으로 청크 전체를 삽입
+            ids = db.scalars(stmt, rows).all()
+            result.created.extend(BulkCreated(index=i, id=row_id) for (i, _), row_id in zip(chunk, ids))
+
+        def run_one(index, row):
+            result.created.append(BulkCreated(index=index, id=db.scalars(stmt, [row]).one()))
+
+        _run_chunk(db, "create", chunk, result, run_many, run_one)
+
+
+def _existing_ids(db, model, ids) -> set:
+    return set(db.scalars(select(model.id).where(model.id.in_(ids))))
+
+
+def _bulk_update(db, model, schema, items, chunk_size, result) -> list:
+    id_type = model.id.type.python_type
+    valid = []
+    for index, item in enumerate(items):
+        try:
+            row_id = id_type(item["id"])
+            values = schema(**{k: v for k, v in item.items() if k != "id"}).dict(exclude_unset=True)
+        except ValidationError as e:
+            result.errors.append(BulkItemError(op="update", index=index, detail=_describe(e)))
+            continue
+        except (KeyError, ValueError, TypeError, AttributeError):
+            result.errors.append(BulkItemError(op="update", index=index, detail="유효한 id가 필요합니다."))
+            continue
+        valid.append((index, {"id": row_id, **values}))
+
+    touched = []
+    for chunk in _chunks(valid, chunk_size):
+        existing = _existing_ids(db, model, [params["id"] for _, params in chunk])
+        found = []
+        for index, params in chunk:
+            if params["id"] in existing:
+                found.append((index, params))
+            else:
+                result.errors.append(BulkItemError(op="update", index=index, detail="대상을 찾을 수 없습니다."))
+
+        def run_many(rows):
+            # 기본키 기준 ORM 일괄 UPDATE (executemany)
+            db.execute(update(model), rows)
+            result.updated += len(rows)
+
+        def run_one(index, params):
+            db.execute(update(model), [params])
+            result.updated += 1
+
+        _run_chunk(db, "update", found, result, run_many, run_one)
+        touched.extend(params["id"] for _, params in found)
+    return touched
+
+
+def _bulk_delete(db, model, items, chunk_size, result) -> list:
+    id_type = model.id.type.python_type
+    valid = []
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, id_type(item)))
+        except (ValueError, TypeError, AttributeError):
+            result.errors.append(BulkItemError(op="delete", index=index, detail="유효한 id가 필요합니다."))
+
+    touched = []
+    for chunk in _chunks(valid, chunk_size):
+        existing = _existing_ids(db, model, [row_id for _, row_id in chunk])
+        found = []
+        for index, row_id in chunk:
+            if row_id in existing:
+                found.append((index, row_id))
+            else:
+                result.errors.append(BulkItemError(op="delete", index=index, detail="대상을 찾을 수 없습니다."))
+
+        def run_many(ids):
+            db.execute(delete(model).where(model.id.in_(ids)))
+            result.deleted += len(ids)
+
+        def run_one(index, row_id):
+            db.execute(delete(model).where(model.id == row_id))
+            result.deleted += 1
+
+        _run_chunk(db, "delete", found, result, run_many, run_one)
+        touched.extend(row_id for _, row_id in found)
+    return touched
+
+
+def apply_bulk(db: Session, model, create_schema: Type[BaseModel], update_schema: Type[BaseModel],
+               request: BulkRequest, chunk_size: int) -> BulkResult:
+    """
+    생성/수정/삭제 요청을 하나의 트랜잭션에서 청크 단위로 처리합니다.
+
+    항목별 검증 오류나 DB 오류는 errors에 index와 함께 기록되고, 나머지 항목은 커밋됩니다.
+
+    Args:
+        db (Session): 데이터베이스 세션 (AsyncSession은 run_sync로 전달)
+        model: 대상 ORM 모델 (id 기본키 필요)
+        create_schema: 생성 항목 검증 스키마
+        update_schema: 수정 항목 검증 스키마 (부분 수정)
+        request (BulkRequest): 일괄 처리 요청
+        chunk_size (int): 한 문장에 포함할 최대 행 수
+
+    Returns:
+        BulkResult: 생성된 id, 수정/삭제 건수와 항목별 오류
+    """
+    result = BulkResult()
+    try:
+        _bulk_create(db, model, create_schema, request.create, chunk_size, result)
+        updated = _bulk_update(db, model, update_schema, request.update, chunk_size, result)
+        deleted = _bulk_delete(db, model, request.delete, chunk_size, result)
+        if model in SEARCH_SOURCES:
+            # 일괄 문장은 flush 이벤트를 거치지 않으므로 검색 색인을 직접 맞춤 (실패한 항목은 현재 값으로)
+            sync_entries(db, model, [created.id for created in result.created] + updated + deleted, chunk_size)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return result
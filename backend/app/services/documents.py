@@ -0,0 +1,163 @@
+import zipfile
+from datetime import date
+from itertools import groupby
+from pathlib import Path
+from typing import List, NamedTuple
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..models.client import Client
+from ..models.contract import Contract
+from ..models.financial_summary import month_key
+from ..models.labor_cost import LaborCost
+from ..models.worker import Worker
+from .templates import render, render_batch
+
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+ZIP_MIME = "application/zip"
+DOCUMENT_FORMATS = ("docx", "xlsx")
+
+
+class GeneratedFile(NamedTuple):
+    path: str
+    name: str  # 다운로드 파일 이름
+    mime_type: str
+
+
+def load_contract_context(db: Session, contract_id: UUID) -> dict:
+    """계약서에 채울 계약/발주처 정보를 조회합니다."""
+    row = db.execute(
+        select(Contract, Client).join(Client, Contract.client_id == Client.id).where(Contract.id == contract_id)
+    ).one_or_none()
+    if row is None:
+        raise LookupError(f"계약을 찾을 수 없습니다: {contract_id}")
+    contract, client = row
+    return {
+        "contract_number": contract.contract_number,
+        "project_name": contract.project_name,
+        "contract_amount": contract.contract_amount,
+        "start_date": contract.start_date,
+        "end_date": contract.end_date,
+        "contract_type": contract.contract_type,
+        "status": contract.status,
+        "client_name": client.company_name,
+        "client_representative": client.representative_name or "",
+        "client_business_number": client.business_number or "",
+        "client_address": client.address or "",
+    }
+
+
+def _contract_fields(context: dict):
+    return [
+        ("계약번호", context["contract_number"]),
+        ("공사명", context["project_name"]),
+        ("발주처", context["client_name"]),
+        ("대표자", context["client_representative"]),
+        ("사업자등록번호", context["client_business_number"]),
+        ("계약금액", f"{context['contract_amount']:,.0f}원"),
+        ("착공일", context["start_date"].isoformat()),
+        ("준공일", context["end_date"].isoformat() if context["end_date"] else "-"),
+        ("계약유형", context["contract_type"]),
+    ]
+
+
+def template_path(name: str) -> Path:
+    return settings.document_template_path / name
+
+
+def render_contract_docx(context: dict, path: Path):
+    """계약서(Word)를 템플릿으로 생성합니다."""
+    values = dict(context, contract_amount=f"{context['contract_amount']:,.0f}",
+                  end_date=context["end_date"] or "-", issued_date=date.today())
+    path.write_bytes(render(template_path("contract.docx"), values))
+
+
+def render_contract_xlsx(context: dict, path: Path):
+    """계약 내역서(Excel)를 생성합니다."""
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("계약")
+    sheet.append(["공사 도급 계약 내역"])
+    for label, value in _contract_fields(context):
+        sheet.append([label, value])
+    workbook.save(path)
+
+
+def generate_contract_document(db: Session, params: dict, output_dir: Path) -> GeneratedFile:
+    """
+    계약서 파일을 생성합니다. (백그라운드 작업 핸들러)
+
+    Args:
+        db (Session): 데이터베이스 세션
+        params (dict): contract_id, format(docx/xlsx)
+        output_dir (Path): 결과 파일을 저장할 디렉토리
+
+    Returns:
+        GeneratedFile: 생성된 파일 경로, 다운로드 이름, MIME 형식
+    """
+    file_format = params.get("format", "docx")
+    if file_format not in DOCUMENT_FORMATS:
+        raise ValueError(f"지원하지 않는 문서 형식입니다: {file_format}")
+    context = load_contract_context(db, UUID(str(params["contract_id"])))
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / f"contract.{file_format}"
+    if file_format == "docx":
+        render_contract_docx(context, path)
+        mime_type = DOCX_MIME
+    else:
+        render_contract_xlsx(context, path)
+        mime_type = XLSX_MIME
+    return GeneratedFile(str(path), f"계약서_{context['contract_number']}.{file_format}", mime_type)
+
+
+def load_labor_statement_contexts(db: Session, contract_id: UUID) -> List[dict]:
+    """계약의 노무비 내역을 월별 명세서 템플릿 값으로 묶습니다. (작업일 순)"""
+    contract = load_contract_context(db, contract_id)
+    rows = db.execute(
+        select(LaborCost.work_date, Worker.full_name, LaborCost.worker_id, LaborCost.hours_worked,
+               LaborCost.hourly_rate, LaborCost.total_amount, LaborCost.payment_status)
+        .join(Worker, LaborCost.worker_id == Worker.id)
+        .where(LaborCost.contract_id == contract_id)
+        .order_by(LaborCost.work_date, Worker.full_name)
+    ).all()
+    contexts = []
+    for month, month_rows in groupby(rows, key=lambda row: month_key(row.work_date)):
+        items = [row._asdict() for row in month_rows]
+        contexts.append(dict(
+            contract,
+            month=month,
+            items=items,
+            days=len(items),
+            worker_count=len({item["worker_id"] for item in items}),
+            total_hours=sum(item["hours_worked"] for item in items),
+            total_amount=sum(item["total_amount"] for item in items),
+        ))
+    return contexts
+
+
+def generate_labor_statements(db: Session, params: dict, output_dir: Path) -> GeneratedFile:
+    """
+    계약의 월별 노무비 명세서를 한 번에 생성하여 zip으로 묶습니다. (백그라운드 작업 핸들러)
+    모든 월이 같은 컴파일된 템플릿을 재사용합니다.
+
+    Args:
+        db (Session): 데이터베이스 세션
+        params (dict): contract_id
+        output_dir (Path): 결과 파일을 저장할 디렉토리
+    """
+    contexts = load_labor_statement_contexts(db, UUID(str(params["contract_id"])))
+    if not contexts:
+        raise LookupError(f"노무비 내역이 없습니다: {params['contract_id']}")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / "labor_statements.zip"
+    documents = render_batch(template_path("labor_statement.docx"), contexts)
+    # 각 문서는 이미 압축된 DOCX이므로 다시 압축하지 않음
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_STORED) as archive:
+        for context, content in zip(contexts, documents):
+            archive.writestr(f"노무비명세서_{context['month']}.docx", content)
+    return GeneratedFile(str(path), f"노무비명세서_{contexts[0]['contract_number']}.zip", ZIP_MIME)
@@ -0,0 +1,145 @@
+import csv
+import io
+import tempfile
+from dataclasses import dataclass
+from datetime import date
+from typing import AsyncIterator, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from ..models.client import Client
+from ..models.contract import Contract
+from ..models.expense import Expense
+from ..models.labor_cost import LaborCost
+from ..models.revenue import Revenue
+from ..models.worker import Worker
+
+MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+XLSX_READ_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True)
+class ExportSpec:
+    """내보내기 대상: 시트 이름, (헤더, 컬럼) 목록, 날짜 필터 컬럼, 조인"""
+    title: str
+    columns: Tuple[Tuple[str, object], ...]
+    date_column: object
+    contract_column: object
+    joins: Tuple[Tuple[object, object], ...] = ()
+
+
+EXPORTS = {
+    "contracts": ExportSpec(
+        title="계약",
+        columns=(
+            ("계약번호", Contract.contract_number), ("발주처", Client.company_name),
+            ("공사명", Contract.project_name), ("계약금액", Contract.contract_amount),
+            ("착공일", Contract.start_date), ("준공일", Contract.end_date),
+            ("상태", Contract.status), ("계약유형", Contract.contract_type),
+        ),
+        date_column=Contract.start_date,
+        contract_column=Contract.id,
+        joins=((Client, Contract.client_id == Client.id),),
+    ),
+    "revenues": ExportSpec(
+        title="수입",
+        columns=(
+            ("수입일", Revenue.payment_date), ("계약번호", Contract.contract_number),
+            ("금액", Revenue.amount), ("수입유형", Revenue.payment_type),
+            ("상태", Revenue.status), ("비고", Revenue.description),
+        ),
+        date_column=Revenue.payment_date,
+        contract_column=Revenue.contract_id,
+        joins=((Contract, Revenue.contract_id == Contract.id),),
+    ),
+    "expenses": ExportSpec(
+        title="지출",
+        columns=(
+            ("지출일", Expense.expense_date), ("계약번호", Contract.contract_number),
+            ("분류", Expense.category), ("금액", Expense.amount),
+            ("지급상태", Expense.payment_status), ("비고", Expense.description),
+        ),
+        date_column=Expense.expense_date,
+        contract_column=Expense.contract_id,
+        joins=((Contract, Expense.contract_id == Contract.id),),
+    ),
+    "labor-costs": ExportSpec(
+        title="노무비",
+        columns=(
+            ("작업일", LaborCost.work_date), ("계약번호", Contract.contract_number),
+            ("작업자", Worker.full_name), ("작업시간", LaborCost.hours_worked),
+            ("시급", LaborCost.hourly_rate), ("총액", LaborCost.total_amount),
+            ("지급상태", LaborCost.payment_status),
+        ),
+        date_column=LaborCost.work_date,
+        contract_column=LaborCost.contract_id,
+        joins=((Contract, LaborCost.contract_id == Contract.id), (Worker, LaborCost.worker_id == Worker.id)),
+    ),
+}
+
+
+def export_stmt(spec: ExportSpec, contract_id: Optional[UUID] = None,
+                date_from: Optional[date] = None, date_to: Optional[date] = None):
+    """내보낼 컬럼만 조회하는 문장 (ORM 객체를 만들지 않음)"""
+    stmt = select(*(column for _, column in spec.columns))
+    for target, onclause in spec.joins:
+        stmt = stmt.join(target, onclause)
+    if contract_id is not None:
+        stmt = stmt.where(spec.contract_column == contract_id)
+    if date_from is not None:
+        stmt = stmt.where(spec.date_column >= date_from)
+    if date_to is not None:
+        stmt = stmt.where(spec.date_column <= date_to)
+    return stmt.order_by(spec.date_column)
+
+
+async def _partitions(db: AsyncSession, stmt, batch_size: int) -> AsyncIterator[List[tuple]]:
+    # 서버 측 커서(stream_results)로 batch_size 행씩 가져와 전체 결과를 메모리에 올리지 않음
+    result = await db.stream(stmt.execution_options(yield_per=batch_size))
+    async for rows in result.partitions():
+        yield rows
+
+
+async def iter_csv(db: AsyncSession, spec: ExportSpec, stmt, batch_size: int) -> AsyncIterator[bytes]:
+    """
+    CSV를 배치 단위로 인코딩하여 내보냅니다.
+    헤더(엑셀에서 한글이 깨지지 않도록 UTF-8 BOM 포함)는 쿼리 전에 먼저 전송됩니다.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([header for header, _ in spec.columns])
+    yield ("\ufeff" + buffer.getvalue()).encode("utf-8")
+    async for rows in _partitions(db, stmt, batch_size):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(rows)
+        yield buffer.getvalue().encode("utf-8")
+
+
+async def iter_xlsx(db: AsyncSession, spec: ExportSpec, stmt, batch_size: int) -> AsyncIterator[bytes]:
+    """
+    openpyxl write-only 워크북으로 XLSX를 만들어 내보냅니다.
+
+    행은 워크시트 임시 파일에 바로 기록되어 메모리가 일정하게 유지되지만, XLSX는 zip 형식이라
+    마지막 행을 쓴 뒤에야 파일을 완성할 수 있으므로 전송은 모든 행을 기록한 후 시작됩니다.
+    """
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(spec.title)
+    sheet.append([header for header, _ in spec.columns])
+    async for rows in _partitions(db, stmt, batch_size):
+        for row in rows:
+            sheet.append([str(value) if isinstance(value, UUID) else value for value in row])
+
+    with tempfile.TemporaryFile() as output:
+        await run_in_threadpool(workbook.save, output)
+        output.seek(0)
+        while chunk := await run_in_threadpool(output.read, XLSX_READ_SIZE):
+            yield chunk
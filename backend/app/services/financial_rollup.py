@@ -0,0 +1,121 @@
+"""
+계약·월별 집계 테이블(ContractMonthlySummary) 재구성 및 정합성 검사
+
+    python -m app.services.financial_rollup rebuild   # 원본 테이블에서 다시 계산 (백필)
+    python -m app.services.financial_rollup check     # 집계 테이블과 원본 합계 비교
+"""
+import argparse
+import sys
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from pydantic import BaseModel
+from sqlalchemy import Numeric, delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from ..models.financial_summary import ROLLUP_SOURCES, ContractMonthlySummary
+from .statistics import period_key
+
+SUMMARY_FIELDS = tuple(
+    f"{prefix}_{suffix}" for prefix, _, _ in ROLLUP_SOURCES.values() for suffix in ("total", "count")
+)
+
+
+class SummaryMismatch(BaseModel):
+    contract_id: UUID
+    month: str
+    field: str
+    expected: Decimal
+    actual: Decimal
+
+
+def compute_summaries(db: Session, contract_id: Optional[UUID] = None) -> Dict[Tuple[UUID, str], dict]:
+    """원본 테이블을 계약·월 단위로 GROUP BY 하여 기대 집계 값을 계산합니다."""
+    summaries: Dict[Tuple[UUID, str], dict] = {}
+    for model, (prefix, date_attr, amount_attr) in ROLLUP_SOURCES.items():
+        month = period_key(getattr(model, date_attr), "month")
+        total = func.sum(getattr(model, amount_attr)).cast(Numeric(15, 2))
+        stmt = select(model.contract_id, month, total, func.count()).group_by(model.contract_id, month)
+        if contract_id is not None:
+            stmt = stmt.where(model.contract_id == contract_id)
+        for row_contract_id, row_month, total, count in db.execute(stmt):
+            row = summaries.setdefault(
+                (row_contract_id, row_month), {field: Decimal(0) if field.endswith("_total") else 0
+                                               for field in SUMMARY_FIELDS}
+            )
+            row[f"{prefix}_total"] = total
+            row[f"{prefix}_count"] = count
+    return summaries
+
+
+def rebuild_summaries(db: Session, contract_id: Optional[UUID] = None) -> int:
+    """
+    집계 테이블을 원본 테이블에서 다시 계산합니다.
+    contract_id가 주어지면 해당 계약의 행만 교체합니다.
+
+    Returns:
+        int: 새로 기록한 (계약, 월) 행 수
+    """
+    try:
+        summaries = compute_summaries(db, contract_id)
+        stmt = delete(ContractMonthlySummary)
+        if contract_id is not None:
+            stmt = stmt.where(ContractMonthlySummary.contract_id == contract_id)
+        db.execute(stmt)
+        if summaries:
+            db.execute(insert(ContractMonthlySummary), [
+                {"contract_id": key[0], "month": key[1], **values} for key, values in summaries.items()
+            ])
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return len(summaries)
+
+
+def check_summaries(db: Session, contract_id: Optional[UUID] = None) -> List[SummaryMismatch]:
+    """집계 테이블과 원본 테이블의 합계가 다른 (계약, 월, 필드) 목록을 반환합니다."""
+    expected = compute_summaries(db, contract_id)
+    stmt = select(ContractMonthlySummary)
+    if contract_id is not None:
+        stmt = stmt.where(ContractMonthlySummary.contract_id == contract_id)
+    actual = {
+        (row.contract_id, row.month): {field: getattr(row, field) for field in SUMMARY_FIELDS}
+        for row in db.scalars(stmt)
+    }
+    empty = {field: 0 for field in SUMMARY_FIELDS}
+    mismatches = []
+    for key in sorted(expected.keys() | actual.keys(), key=lambda k: (str(k[0]), k[1])):
+        want, have = expected.get(key, empty), actual.get(key, empty)
+        for field in SUMMARY_FIELDS:
+            if Decimal(str(want[field])) != Decimal(str(have[field])):
+                mismatches.append(SummaryMismatch(contract_id=key[0], month=key[1], field=field,
+                                                  expected=want[field], actual=have[field]))
+    return mismatches
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="계약·월별 집계 테이블 관리")
+    parser.add_argument("command", choices=["rebuild", "check"])
+    parser.add_argument("--contract-id", type=UUID, default=None, help="특정 계약만 처리")
+    args = parser.parse_args(argv)
+
+    from ..db.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        if args.command == "rebuild":
+            print(f"집계 행 {rebuild_summaries(db, args.contract_id)}건을 다시 계산했습니다.")
+            return 0
+        mismatches = check_summaries(db, args.contract_id)
+        for m in mismatches:
+            print(f"{m.contract_id} {m.month} {m.field}: 기대값 {m.expected}, 집계값 {m.actual}")
+        print("집계 테이블이 원본과 일치합니다." if not mismatches else f"불일치 {len(mismatches)}건")
+        return 1 if mismatches else 0
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,235 @@
+import logging
+import multiprocessing
+import os
+import socket
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import create_engine, or_, select, update
+from sqlalchemy.orm import Session, sessionmaker
+
+from ..models.job import Job
+from .documents import GeneratedFile, generate_contract_document, generate_labor_statements
+from .previews import generate_document_preview
+
+logger = logging.getLogger(__name__)
+
+# 작업 종류 → 핸들러(db, params, output_dir) -> GeneratedFile
+# 워커 프로세스에서 실행되므로 모듈 최상위 함수여야 합니다.
+JOB_HANDLERS: Dict[str, Callable[[Session, dict, Path], GeneratedFile]] = {
+    "contract_document": generate_contract_document,
+    "labor_statements": generate_labor_statements,
+    "document_preview": generate_document_preview,
+}
+
+_worker_sessions: Dict[str, sessionmaker] = {}
+
+
+def run_job(kind: str, job_id: str, params: dict, database_url: str, output_dir: str) -> GeneratedFile:
+    """
+    워커 프로세스에서 작업 하나를 실행합니다.
+    DB 엔진은 워커 프로세스마다 한 번 만들어 재사용합니다.
+    """
+    factory = _worker_sessions.get(database_url)
+    if factory is None:
+        factory = _worker_sessions[database_url] = sessionmaker(bind=create_engine(database_url))
+    with factory() as db:
+        return JOB_HANDLERS[kind](db, params, Path(output_dir) / job_id)
+
+
+class JobRunner:
+    """
+    job 테이블의 대기 작업을 프로세스 풀에서 실행하는 디스패처
+
+    외부 브로커 없이 API 프로세스의 스레드 하나가 대기 작업을 찾아 실행 중 상태로 바꾸고
+    워커 프로세스에 넘깁니다. 실패한 작업은 max_attempts까지 retry_delay × 실행 횟수만큼
+    기다린 뒤 다시 실행됩니다.
+
+    작업을 가져갈 때 디스패처 id와 임대 만료 시각(lease_seconds 후)을 기록하고 실행하는 동안
+    확인 주기마다 임대를 연장합니다. 여러 프로세스가 같은 DB를 쓰므로 임대가 만료된
+    (종료·중단된 프로세스의) 실행 중 작업만 대기 상태로 되돌립니다.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session], database_url: str, result_dir: Path,
+                 workers: int = 2, poll_interval: float = 2.0, retry_delay: float = 10, lease_seconds: float = 60,
+                 executor_factory: Optional[Callable[[], Executor]] = None):
+        self.session_factory = session_factory
+        self.database_url = database_url
+        self.result_dir = Path(result_dir)
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.retry_delay = retry_delay
+        self.lease_seconds = lease_seconds
+        self.runner_id = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self.executor_factory = executor_factory or partial(
+            # Windows/macOS(Tauri 데스크톱)와 같은 방식으로 동작하도록 spawn 사용
+            ProcessPoolExecutor, max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        self._executor: Optional[Executor] = None
+        self._running: Dict[UUID, Future] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._recover()
+        self._executor = self.executor_factory()
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._loop, name="job-dispatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """대기 중인 작업은 취소(다음 시작 시 재실행)하고 실행 중인 작업이 끝나기를 기다립니다."""
+        self._stopping.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def wake(self):
+        """새 작업이 등록되었음을 알려 다음 확인 주기를 기다리지 않고 실행합니다."""
+        self._wake.set()
+
+    def _lease_until(self, now: datetime) -> datetime:
+        return now + timedelta(seconds=self.lease_seconds)
+
+    def _recover(self):
+        """임대가 만료된 실행 중 작업을 대기 상태로 되돌립니다. (임대 기록이 없는 이전 버전의 작업 포함)"""
+        now = datetime.utcnow()
+        with self.session_factory() as db:
+            result = db.execute(
+                update(Job)
+                .where(Job.status == "running", or_(Job.lease_expires_at.is_(None), Job.lease_expires_at < now))
+                .values(status="queued", claimed_by=None, lease_expires_at=None)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+        if result.rowcount:
+            logger.warning("임대가 만료된 작업 %d건을 다시 대기열에 넣었습니다.", result.rowcount)
+
+    def _renew_leases(self):
+        with self._lock:
+            if not self._running:
+                return
+        with self.session_factory() as db:
+            db.execute(
+                update(Job).where(Job.claimed_by == self.runner_id, Job.status == "running")
+                .values(lease_expires_at=self._lease_until(datetime.utcnow()))
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+
+    def _loop(self):
+        while not self._stopping.is_set():
+            try:
+                self._dispatch()
+            except Exception:
+                logger.exception("작업 디스패치 실패")
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+    def _dispatch(self):
+        self._renew_leases()
+        self._recover()
+        with self._lock:
+            free = self.workers - len(self._running)
+        if free <= 0:
+            return
+        now = datetime.utcnow()
+        with self.session_factory() as db:
+            jobs = db.scalars(
+                select(Job).where(Job.status == "queued", Job.run_after <= now)
+                .order_by(Job.run_after, Job.created_at).limit(free)
+            ).all()
+            claimed = []
+            for job in jobs:
+                result = db.execute(
+                    update(Job).where(Job.id == job.id, Job.status == "queued")
+                    .values(status="running", attempts=Job.attempts + 1, started_at=now, error=None,
+                            claimed_by=self.runner_id, lease_expires_at=self._lease_until(now))
+                    .execution_options(synchronize_session=False)
+                )
+                if result.rowcount:
+                    claimed.append((job.id, job.kind, dict(job.params), job.attempts + 1, job.max_attempts))
+            db.commit()
+
+        for job_id, kind, params, attempt, max_attempts in claimed:
+            try:
+                future = self._executor.submit(run_job, kind, str(job_id), params, self.database_url,
+                                               str(self.result_dir))
+            except BrokenProcessPool:
+                self._executor = self.executor_factory()
+                future = self._executor.submit(run_job, kind, str(job_id), params, self.database_url,
+                                               str(self.result_dir))
+            with self._lock:
+                self._running[job_id] = future
+            future.add_done_callback(partial(self._finish, job_id, attempt, max_attempts))
+
+    def _finish(self, job_id: UUID, attempt: int, max_attempts: int, future: Future):
+        with self._lock:
+            self._running.pop(job_id, None)
+        now = datetime.utcnow()
+        if future.cancelled():
+            # 종료 중 취소된 작업은 실행 횟수에 포함하지 않음
+            values = {"status": "queued", "attempts": attempt - 1}
+        else:
+            error = future.exception()
+            if error is None:
+                output = future.result()
+                values = {"status": "succeeded", "finished_at": now, "result_path": output.path,
+                          "result_name": output.name, "mime_type": output.mime_type}
+            elif attempt < max_attempts and not self._stopping.is_set():
+                values = {"status": "queued", "error": f"{type(error).__name__}: {error}",
+                          "run_after": now + timedelta(seconds=self.retry_delay * attempt)}
+            else:
+                values = {"status": "failed", "finished_at": now, "error": f"{type(error).__name__}: {error}"}
+            if isinstance(error, BrokenProcessPool) and not self._stopping.is_set():
+                self._executor = self.executor_factory()
+        values.update(claimed_by=None, lease_expires_at=None)
+        try:
+            with self.session_factory() as db:
+                # 임대가 만료되어 다른 디스패처가 다시 가져간 작업은 덮어쓰지 않음
+                db.execute(update(Job).where(Job.id == job_id, Job.claimed_by == self.runner_id).values(**values)
+                           .execution_options(synchronize_session=False))
+                db.commit()
+        except Exception:
+            logger.exception("작업 상태 저장 실패: %s", job_id)
+        self.wake()
+
+
+job_runner: Optional[JobRunner] = None
+
+
+def start_job_runner() -> JobRunner:
+    """설정에 따라 전역 작업 디스패처를 시작합니다. (애플리케이션 시작 시 호출)"""
+    global job_runner
+    from ..core.config import settings
+    from ..db.database import SessionLocal
+
+    job_runner = JobRunner(
+        SessionLocal, settings.get_database_url(), settings.job_result_path,
+        workers=settings.JOB_WORKERS, poll_interval=settings.JOB_POLL_INTERVAL,
+        retry_delay=settings.JOB_RETRY_DELAY, lease_seconds=settings.JOB_LEASE_SECONDS,
+    )
+    job_runner.start()
+    return job_runner
+
+
+def stop_job_runner():
+    global job_runner
+    if job_runner is not None:
+        job_runner.stop()
+        job_runner = None
+
+
+def notify_job_queued():
+    if job_runner is not None:
+        job_runner.wake()
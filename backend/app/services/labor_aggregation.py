@@ -0,0 +1,192 @@
+from datetime import date
+from decimal import Decimal
+from typing import List, Optional
+from uuid import UUID
+
+import numpy as np
+from pydantic import BaseModel
+from sqlalchemy import Float, String, select, type_coerce
+from sqlalchemy.orm import Session
+
+from ..models.labor_cost import LaborCost
+from ..models.worker import Worker
+
+PERIODS = ("week", "month")
+MAX_MISMATCHES = 100
+
+
+class WorkerLaborTotal(BaseModel):
+    worker_id: UUID
+    full_name: Optional[str] = None
+    days: int
+    hours: Decimal
+    amount: Decimal
+
+
+class ContractLaborTotal(BaseModel):
+    contract_id: UUID
+    days: int
+    hours: Decimal
+    amount: Decimal
+
+
+class PeriodLaborTotal(BaseModel):
+    period_start: date  # 주(월요일) 또는 월의 시작일
+    days: int
+    hours: Decimal
+    amount: Decimal
+
+
+class LaborAmountMismatch(BaseModel):
+    labor_cost_id: UUID
+    worker_id: UUID
+    work_date: date
+    stored: Decimal
+    expected: Decimal  # hours_worked * hourly_rate
+
+
+class LaborAggregation(BaseModel):
+    rows: int
+    hours: Decimal
+    amount: Decimal
+    by_worker: List[WorkerLaborTotal] = []
+    by_contract: List[ContractLaborTotal] = []
+    by_period: List[PeriodLaborTotal] = []
+    mismatch_count: int = 0
+    mismatches: List[LaborAmountMismatch] = []  # 최대 MAX_MISMATCHES건
+
+
+def _hundredths(values) -> np.ndarray:
+    """소수 둘째 자리 금액/시간을 정수(1/100 단위) 배열로 변환하여 합계 오차를 없앰"""
+    return np.rint(np.asarray(values, dtype=np.float64) * 100).astype(np.int64)
+
+
+def _decimal(hundredths) -> Decimal:
+    return Decimal(int(hundredths)).scaleb(-2)
+
+
+def _uuid(raw) -> UUID:
+    # SQLite는 32자리 hex 문자열, PostgreSQL 드라이버는 UUID 객체를 반환
+    return raw if isinstance(raw, UUID) else UUID(str(raw))
+
+
+def _factorize(values):
+    """원시 키 값 → 그룹 번호 배열과 그룹별 UUID 목록"""
+    keys, codes = np.unique(np.asarray(values), return_inverse=True)
+    return codes.ravel(), [_uuid(key) for key in keys.tolist()]
+
+
+def _group_totals(codes: np.ndarray, size: int, hours: np.ndarray, amount: np.ndarray):
+    days = np.bincount(codes, minlength=size)
+    hour_sums = np.bincount(codes, weights=hours, minlength=size).astype(np.int64)
+    amount_sums = np.bincount(codes, weights=amount, minlength=size).astype(np.int64)
+    return days, hour_sums, amount_sums
+
+
+def _period_starts(days: np.ndarray, period: str) -> np.ndarray:
+    if period == "month":
+        return days.astype("datetime64[M]").astype("datetime64[D]")
+    # 1970-01-01은 목요일: (일수 + 3) % 7 이 월요일 기준 요일
+    ordinal = days.astype(np.int64)
+    return (ordinal - (ordinal + 3) % 7).astype("datetime64[D]")
+
+
+def labor_rows_stmt(contract_id: Optional[UUID] = None, worker_id: Optional[UUID] = None,
+                    date_from: Optional[date] = None, date_to: Optional[date] = None):
+    """
+    집계에 필요한 컬럼만 조회하는 문장
+
+    행마다 UUID/Decimal/date 객체를 만들지 않도록 결과 타입 변환을 생략하고
+    드라이버 원시 값(문자열, float)을 그대로 받아 NumPy 배열로 만듭니다.
+    """
+    stmt = select(
+        type_coerce(LaborCost.id, String),
+        type_coerce(LaborCost.worker_id, String),
+        type_coerce(LaborCost.contract_id, String),
+        type_coerce(LaborCost.work_date, String),
+        type_coerce(LaborCost.hours_worked, Float),
+        type_coerce(LaborCost.hourly_rate, Float),
+        type_coerce(LaborCost.total_amount, Float),
+    )
+    if contract_id is not None:
+        stmt = stmt.where(LaborCost.contract_id == contract_id)
+    if worker_id is not None:
+        stmt = stmt.where(LaborCost.worker_id == worker_id)
+    if date_from is not None:
+        stmt = stmt.where(LaborCost.work_date >= date_from)
+    if date_to is not None:
+        stmt = stmt.where(LaborCost.work_date <= date_to)
+    return stmt
+
+
+def aggregate_labor(db: Session, period: str = "week", contract_id: Optional[UUID] = None,
+                    worker_id: Optional[UUID] = None, date_from: Optional[date] = None,
+                    date_to: Optional[date] = None) -> LaborAggregation:
+    """
+    노무비를 작업자·계약·기간(주/월)별로 집계하고 저장된 총액을 검증합니다.
+
+    한 번의 쿼리로 필요한 컬럼만 가져와 NumPy 배열로 변환한 뒤 bincount로 그룹 합계를 구하며,
+    hours_worked * hourly_rate를 배열 연산으로 다시 계산하여 total_amount와 다른 행을 찾습니다.
+    금액은 1/100 단위 정수로 계산하므로 부동소수점 오차가 없습니다.
+
+    Args:
+        db (Session): 데이터베이스 세션 (AsyncSession은 run_sync로 전달)
+        period (str): 기간 단위 (week: 월요일 시작 주, month: 월)
+        contract_id, worker_id, date_from, date_to: 조회 조건
+
+    Returns:
+        LaborAggregation: 전체/작업자별/계약별/기간별 합계와 총액 불일치 행
+    """
+    if period not in PERIODS:
+        raise ValueError(f"지원하지 않는 집계 기간입니다: {period}")
+
+    # ORM 행 처리를 거치지 않도록 커넥션에서 바로 실행
+    rows = db.connection().execute(labor_rows_stmt(contract_id, worker_id, date_from, date_to)).all()
+    if not rows:
+        return LaborAggregation(rows=0, hours=Decimal("0.00"), amount=Decimal("0.00"))
+    ids, worker_ids, contract_ids, work_dates, hours_col, rates_col, totals_col = zip(*rows)
+
+    hours = _hundredths(hours_col)
+    rates = _hundredths(rates_col)
+    stored = _hundredths(totals_col)
+    # (시간 × 100) × (시급 × 100) / 100 → 1/100 단위, 반올림
+    expected = (hours * rates + 50) // 100
+
+    worker_codes, worker_keys = _factorize(worker_ids)
+    contract_codes, contract_keys = _factorize(contract_ids)
+    work_days = np.array(work_dates, dtype="datetime64[D]")
+    period_starts = _period_starts(work_days, period)
+    period_keys, period_codes = np.unique(period_starts, return_inverse=True)
+
+    names = dict(db.execute(select(Worker.id, Worker.full_name).where(Worker.id.in_(worker_keys))).all())
+
+    result = LaborAggregation(rows=len(rows), hours=_decimal(hours.sum()), amount=_decimal(stored.sum()))
+    days, hour_sums, amount_sums = _group_totals(worker_codes, len(worker_keys), hours, stored)
+    result.by_worker = [
+        WorkerLaborTotal(worker_id=key, full_name=names.get(key), days=int(days[i]),
+                         hours=_decimal(hour_sums[i]), amount=_decimal(amount_sums[i]))
+        for i, key in enumerate(worker_keys)
+    ]
+    days, hour_sums, amount_sums = _group_totals(contract_codes, len(contract_keys), hours, stored)
+    result.by_contract = [
+        ContractLaborTotal(contract_id=key, days=int(days[i]),
+                           hours=_decimal(hour_sums[i]), amount=_decimal(amount_sums[i]))
+        for i, key in enumerate(contract_keys)
+    ]
+    days, hour_sums, amount_sums = _group_totals(period_codes.ravel(), len(period_keys), hours, stored)
+    result.by_period = [
+        PeriodLaborTotal(period_start=key.item(), days=int(days[i]),
+                         hours=_decimal(hour_sums[i]), amount=_decimal(amount_sums[i]))
+        for i, key in enumerate(period_keys)
+    ]
+    result.by_worker.sort(key=lambda t: t.amount, reverse=True)
+    result.by_contract.sort(key=lambda t: t.amount, reverse=True)
+
+    mismatched = np.flatnonzero(expected != stored)
+    result.mismatch_count = len(mismatched)
+    result.mismatches = [
+        LaborAmountMismatch(labor_cost_id=_uuid(ids[i]), worker_id=_uuid(worker_ids[i]),
+                            work_date=work_days[i].item(), stored=_decimal(stored[i]), expected=_decimal(expected[i]))
+        for i in mismatched[:MAX_MISMATCHES]
+    ]
+    return result
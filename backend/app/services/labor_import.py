@@ -0,0 +1,245 @@
+import csv
+import io
+from collections import defaultdict
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from pydantic import BaseModel
+from sqlalchemy import insert, select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+from ..models.contract import Contract
+from ..models.financial_summary import add_to_summary, month_key
+from ..models.labor_cost import LaborCost
+from ..models.worker import Worker
+
+# 표준 필드 → 허용하는 헤더 이름
+HEADER_ALIASES = {
+    "work_date": ("work_date", "작업일", "일자"),
+    "worker": ("worker", "작업자", "id_number", "주민번호", "full_name", "성명"),
+    "contract_number": ("contract_number", "계약번호"),
+    "hours_worked": ("hours_worked", "작업시간", "시간"),
+    "hourly_rate": ("hourly_rate", "시급"),  # 없으면 작업자의 기본 시급
+}
+REQUIRED_FIELDS = ("work_date", "worker", "contract_number", "hours_worked")
+MAX_ERRORS = 1000
+CENT = Decimal("0.01")
+# LaborCost.hourly_rate 컬럼(Numeric(10, 2))에 들어가는 최대값 (작업시간 24 이하이므로 총액도 Numeric(15, 2) 범위)
+MAX_HOURLY_RATE = Decimal("99999999.99")
+
+
+class LaborImportError(BaseModel):
+    row: int  # 파일 기준 행 번호 (헤더 = 1)
+    detail: str
+
+
+class LaborImportProgress(BaseModel):
+    processed: int = 0
+    inserted: int = 0
+    error_count: int = 0
+    done: bool = False
+    errors: List[LaborImportError] = []  # 완료 시에만 채움 (최대 MAX_ERRORS건)
+
+
+def read_rows(file: BinaryIO, filename: str) -> Iterator[Sequence]:
+    """
+    업로드 파일을 한 행씩 읽습니다. 시트 전체를 메모리에 올리지 않습니다.
+    .xlsx는 openpyxl read-only 모드, .csv는 csv 모듈(UTF-8, BOM 허용)을 사용합니다.
+    """
+    name = (filename or "").lower()
+    if name.endswith(".xlsx"):
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(file, read_only=True, data_only=True)
+        try:
+            yield from workbook.active.iter_rows(values_only=True)
+        finally:
+            workbook.close()
+    elif name.endswith(".csv"):
+        yield from csv.reader(io.TextIOWrapper(file, encoding="utf-8-sig", newline=""))
+    else:
+        raise ValueError("지원하지 않는 파일 형식입니다. (.xlsx, .csv)")
+
+
+def resolve_columns(header: Optional[Sequence]) -> Dict[str, int]:
+    """헤더 행에서 표준 필드별 컬럼 위치를 찾습니다."""
+    names = [str(value).strip().lower() if value is not None else "" for value in (header or ())]
+    columns = {}
+    for field, aliases in HEADER_ALIASES.items():
+        for alias in aliases:
+            if alias in names:
+                columns[field] = names.index(alias)
+                break
+    missing = [field for field in REQUIRED_FIELDS if field not in columns]
+    if missing:
+        raise ValueError(f"필수 컬럼이 없습니다: {', '.join(missing)}")
+    return columns
+
+
+class _Lookup:
+    """가져오기 한 번에 한 번만 만드는 작업자/계약 조회 테이블"""
+
+    def __init__(self, db: Session):
+        self.workers = {}
+        names = defaultdict(list)
+        for worker_id, id_number, full_name, hourly_rate in db.execute(
+            select(Worker.id, Worker.id_number, Worker.full_name, Worker.hourly_rate)
+        ):
+            if id_number:
+                self.workers[id_number] = (worker_id, hourly_rate)
+            names[full_name].append((worker_id, hourly_rate))
+        # 동명이인이 없는 이름만 이름으로 조회 가능
+        for full_name, matches in names.items():
+            if len(matches) == 1:
+                self.workers.setdefault(full_name, matches[0])
+        self.contracts = dict(db.execute(select(Contract.contract_number, Contract.id)).all())
+
+
+def _cell(row: Sequence, index: Optional[int]):
+    if index is None or index >= len(row):
+        return None
+    value = row[index]
+    return value.strip() if isinstance(value, str) else value
+
+
+def _to_date(value) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value))
+
+
+def _to_decimal(value) -> Decimal:
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+def _parse_row(row: Sequence, columns: Dict[str, int], lookup: _Lookup) -> dict:
+    """한 행을 검증하여 LaborCost INSERT 파라미터로 변환합니다. 오류는 ValueError"""
+    worker_key = _cell(row, columns["worker"])
+    worker = lookup.workers.get(str(worker_key)) if worker_key not in (None, "") else None
+    if worker is None:
+        raise ValueError(f"작업자를 찾을 수 없습니다: {worker_key}")
+    contract_number = _cell(row, columns["contract_number"])
+    contract_id = lookup.contracts.get(str(contract_number))
+    if contract_id is None:
+        raise ValueError(f"계약을 찾을 수 없습니다: {contract_number}")
+    try:
+        work_date = _to_date(_cell(row, columns["work_date"]))
+    except (TypeError, ValueError):
+        raise ValueError(f"작업일 형식이 올바르지 않습니다: {_cell(row, columns['work_date'])}")
+    try:
+        hours = _to_decimal(_cell(row, columns["hours_worked"]))
+        rate = _cell(row, columns.get("hourly_rate"))
+        rate = worker[1] if rate in (None, "") else _to_decimal(rate)
+        # "NaN"/"Infinity"도 Decimal로 변환되지만 이후 비교에서 InvalidOperation이 나므로 여기서 거부
+        if not (hours.is_finite() and rate.is_finite()):
+            raise InvalidOperation
+    except InvalidOperation:
+        raise ValueError("작업시간/시급은 숫자여야 합니다.")
+    if not (0 < hours <= 24):
+        raise ValueError(f"작업시간은 0 초과 24 이하여야 합니다: {hours}")
+    if rate < 0:
+        raise ValueError(f"시급은 0 이상이어야 합니다: {rate}")
+    if rate > MAX_HOURLY_RATE:
+        raise ValueError(f"시급은 {MAX_HOURLY_RATE:,} 이하여야 합니다: {rate}")
+    return {
+        "contract_id": contract_id,
+        "worker_id": worker[0],
+        "work_date": work_date,
+        "hours_worked": hours,
+        "hourly_rate": rate,
+        "total_amount": (hours * rate).quantize(CENT),
+    }
+
+
+def _insert_chunk(db: Session, params: List[dict]):
+    """
+    청크 하나를 executemany INSERT와 계약·월별 집계 증분으로 한 트랜잭션에 기록합니다.
+    (일괄 INSERT는 ORM 이벤트를 거치지 않으므로 집계 테이블을 여기서 직접 갱신)
+    """
+    deltas = defaultdict(lambda: [Decimal(0), 0])
+    for row in params:
+        delta = deltas[(row["contract_id"], month_key(row["work_date"]))]
+        delta[0] += row["total_amount"]
+        delta[1] += 1
+    stmt = insert(LaborCost.__table__)
+    try:
+        # 쓰기 문장 기준으로 커넥션을 골라 SQLite writer 커넥션으로 라우팅
+        connection = db.connection(bind_arguments={"clause": stmt})
+        connection.execute(stmt, params)
+        add_to_summary(connection, "labor_cost", [(*key, amount, count) for key, (amount, count) in deltas.items()])
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+
+def run_labor_import(db: Session, rows: Iterable[Sequence], columns: Dict[str, int],
+                     chunk_size: int) -> Iterator[LaborImportProgress]:
+    """
+    작업일지 행을 청크 단위로 검증·삽입하며 청크마다 진행 상황을 yield 합니다.
+
+    작업자(주민번호 또는 고유한 성명)와 계약번호는 시작 시 한 번 만든 조회 테이블로 찾고,
+    검증을 통과한 행은 chunk_size개씩 executemany INSERT 후 커밋합니다.
+    메모리에는 현재 청크와 오류 목록(최대 MAX_ERRORS건)만 유지됩니다.
+
+    Args:
+        db (Session): 데이터베이스 세션
+        rows: 헤더를 제외한 데이터 행 (read_rows 결과에서 헤더를 소비한 이터레이터)
+        columns: resolve_columns 결과
+        chunk_size (int): 한 트랜잭션에 넣을 행 수
+
+    Yields:
+        LaborImportProgress: 청크마다 누적 진행 상황, 마지막은 done=True와 오류 목록
+    """
+    lookup = _Lookup(db)
+    progress = LaborImportProgress()
+    errors: List[LaborImportError] = []
+    chunk: List[dict] = []
+    chunk_rows: List[int] = []
+
+    def record_error(row_number: int, detail: str):
+        progress.error_count += 1
+        if len(errors) < MAX_ERRORS:
+            errors.append(LaborImportError(row=row_number, detail=detail))
+
+    def flush():
+        try:
+            _insert_chunk(db, chunk)
+            progress.inserted += len(chunk)
+        except DBAPIError as e:
+            for row_number in chunk_rows:
+                record_error(row_number, f"저장 실패: {e.orig}")
+        chunk.clear()
+        chunk_rows.clear()
+
+    for row_number, row in enumerate(rows, start=2):
+        if not any(value not in (None, "") for value in row):
+            continue  # 빈 행
+        progress.processed += 1
+        try:
+            chunk.append(_parse_row(row, columns, lookup))
+            chunk_rows.append(row_number)
+        except ValueError as e:
+            record_error(row_number, str(e))
+        if len(chunk) >= chunk_size:
+            flush()
+            yield progress.model_copy()
+    if chunk:
+        flush()
+    progress.done = True
+    progress.errors = errors
+    yield progress
+
+
+def import_labor_costs(db: Session, file: BinaryIO, filename: str, chunk_size: int) -> LaborImportProgress:
+    """파일 전체를 가져오고 최종 결과를 반환합니다."""
+    rows = read_rows(file, filename)
+    columns = resolve_columns(next(rows, None))
+    result = None
+    for result in run_labor_import(db, rows, columns, chunk_size):
+        pass
+    return result
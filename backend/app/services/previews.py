@@ -0,0 +1,159 @@
+"""
+문서 미리보기(썸네일) 생성
+
+이미지는 Pillow로 축소하고 PDF는 pypdfium2로 첫 페이지를 렌더링하여 원본 파일 옆에
+<원본 파일 이름>.preview.jpg로 저장합니다. 생성은 백그라운드 작업(document_preview)으로
+워커 프로세스에서 실행되며, 같은 파일(Blob)을 가리키는 문서는 미리보기를 공유합니다.
+
+    python -m app.services.previews backfill   # 미리보기가 없는 기존 문서의 생성 작업 등록
+"""
+import argparse
+import os
+import sys
+from pathlib import Path
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from ..core.config import settings
+from ..models.document import Document
+from ..models.job import Job
+from .documents import GeneratedFile
+
+PREVIEW_SUFFIX = ".preview.jpg"
+PREVIEW_MIME = "image/jpeg"
+PREVIEW_QUALITY = 80
+PDF_MIME = "application/pdf"
+IMAGE_MIMES = ("image/jpeg", "image/png", "image/gif", "image/bmp", "image/tiff", "image/webp")
+
+
+def can_preview(mime_type: str) -> bool:
+    return mime_type == PDF_MIME or mime_type in IMAGE_MIMES
+
+
+def preview_path_for(file_path: str) -> Path:
+    """미리보기는 원본 옆에 저장 (내용 주소 저장소에서는 같은 내용이면 같은 미리보기)"""
+    return Path(file_path + PREVIEW_SUFFIX)
+
+
+def render_image_preview(source: Path, target, max_size: int):
+    from PIL import Image, ImageOps
+
+    with Image.open(source) as image:
+        # JPEG는 디코딩 단계에서 축소하여 큰 사진도 메모리를 적게 사용
+        image.draft("RGB", (max_size, max_size))
+        image = ImageOps.exif_transpose(image)
+        image.thumbnail((max_size, max_size))
+        image.convert("RGB").save(target, "JPEG", quality=PREVIEW_QUALITY, optimize=True)
+
+
+def render_pdf_preview(source: Path, target, max_size: int):
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(str(source))
+    try:
+        page = pdf[0]
+        width, height = page.get_size()
+        bitmap = page.render(scale=max_size / max(width, height))
+        bitmap.to_pil().convert("RGB").save(target, "JPEG", quality=PREVIEW_QUALITY, optimize=True)
+    finally:
+        pdf.close()
+
+
+def render_preview(source: Path, mime_type: str, target: Path, max_size: int):
+    """임시 파일에 렌더링한 뒤 교체하여 읽는 쪽이 만들다 만 파일을 보지 않도록 합니다."""
+    render = render_pdf_preview if mime_type == PDF_MIME else render_image_preview
+    partial = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        with open(partial, "wb") as f:
+            render(source, f, max_size)
+        os.replace(partial, target)
+    finally:
+        partial.unlink(missing_ok=True)
+
+
+def generate_document_preview(db: Session, params: dict, output_dir: Path) -> GeneratedFile:
+    """
+    문서 미리보기를 생성합니다. (백그라운드 작업 핸들러)
+    결과는 output_dir이 아니라 원본 옆에 저장하고, 같은 파일을 가리키는 문서에 모두 기록합니다.
+    """
+    document = db.get(Document, UUID(str(params["document_id"])))
+    if document is None:
+        raise LookupError(f"문서를 찾을 수 없습니다: {params['document_id']}")
+    target = preview_path_for(document.file_path)
+    same_file = update(Document).where(Document.file_path == document.file_path)
+    try:
+        if not target.is_file():
+            render_preview(Path(document.file_path), document.mime_type, target,
+                           params.get("max_size", settings.PREVIEW_MAX_SIZE))
+    except Exception:
+        db.execute(same_file.values(preview_status="failed"))
+        db.commit()
+        raise
+    db.execute(same_file.values(preview_path=str(target), preview_status="ready"))
+    db.commit()
+    return GeneratedFile(str(target), f"{document.file_name}{PREVIEW_SUFFIX}", PREVIEW_MIME)
+
+
+async def schedule_preview(db: AsyncSession, document: Document) -> bool:
+    """
+    새 문서의 미리보기 상태를 정하고 필요하면 생성 작업을 등록합니다. (커밋은 호출하는 쪽에서)
+    같은 내용의 미리보기가 이미 있으면 바로 연결합니다.
+
+    Returns:
+        bool: 작업을 등록했으면 True (커밋 후 notify_job_queued 호출)
+    """
+    if not can_preview(document.mime_type):
+        document.preview_status = "unsupported"
+        return False
+    target = preview_path_for(document.file_path)
+    if await run_in_threadpool(target.is_file):
+        document.preview_path = str(target)
+        document.preview_status = "ready"
+        return False
+    document.preview_status = "pending"
+    db.add(Job(kind="document_preview", max_attempts=settings.JOB_MAX_ATTEMPTS,
+               params={"document_id": str(document.id)}))
+    return True
+
+
+def backfill_previews(db: Session) -> int:
+    """미리보기 상태가 없는 기존 문서의 생성 작업을 등록합니다."""
+    documents = db.execute(
+        select(Document.id, Document.mime_type).where(Document.preview_status.is_(None))
+    ).all()
+    queued = [document_id for document_id, mime_type in documents if can_preview(mime_type)]
+    try:
+        db.execute(update(Document).where(Document.preview_status.is_(None), Document.id.in_(queued))
+                   .values(preview_status="pending").execution_options(synchronize_session=False))
+        db.execute(update(Document).where(Document.preview_status.is_(None))
+                   .values(preview_status="unsupported").execution_options(synchronize_session=False))
+        db.add_all(Job(kind="document_preview", max_attempts=settings.JOB_MAX_ATTEMPTS,
+                       params={"document_id": str(document_id)}) for document_id in queued)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return len(queued)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="문서 미리보기 관리")
+    parser.add_argument("command", choices=["backfill"])
+    parser.parse_args(argv)
+
+    from ..db.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        print(f"미리보기 생성 작업 {backfill_previews(db)}건을 등록했습니다.")
+        return 0
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
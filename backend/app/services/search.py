@@ -0,0 +1,157 @@
+"""
+계약·발주처·문서 통합 검색
+
+색인(SearchEntry)은 원본 모델의 ORM flush 이벤트와 일괄 처리(apply_bulk)에서 갱신됩니다.
+SQLite는 FTS5(bm25), PostgreSQL은 tsvector GIN 인덱스(ts_rank)로 순위를 매깁니다.
+
+    python -m app.services.search rebuild   # 색인 전체 재생성 (마이그레이션 직후, 직접 SQL로 수정한 경우)
+"""
+import argparse
+import sys
+from typing import List, Optional, Sequence
+from uuid import UUID
+
+from pydantic import BaseModel
+from sqlalchemy import bindparam, delete, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..models.search import (
+    FTS_TABLE, PG_SEARCH_VECTOR, SEARCH_SOURCES, WORD, SearchEntry, bigrams, entry_values, normalize, write_connection,
+    write_entries,
+)
+
+SEARCH_TYPES = tuple(entity for entity, _, _ in SEARCH_SOURCES.values())
+# 제목(label) 일치를 계약번호·사업자번호 등 부가 정보 일치보다 높게
+LABEL_WEIGHT = 10.0
+EXTRA_WEIGHT = 1.0
+REBUILD_BATCH_SIZE = 1000
+
+
+class SearchHit(BaseModel):
+    type: str  # contract, client, document
+    id: UUID
+    label: str
+    detail: Optional[str] = None
+    score: float
+
+
+def _query_words(q: str) -> List[str]:
+    return WORD.findall(normalize(q))
+
+
+def fts_query(q: str, types: Sequence[str] = SEARCH_TYPES) -> str:
+    """
+    FTS5 MATCH 식: 두 글자 이상 단어는 bigram 구(phrase), 한 글자는 접두어 검색, 단어끼리는 AND
+    ("신축 공사" → "신축" AND "공사", "ㄱ" → "ㄱ"*)
+    대상 제한도 색인된 entity 열 조건으로 넣어 일치한 행의 원문을 읽지 않고 거릅니다.
+    """
+    words = " AND ".join(
+        f'"{" ".join(bigrams(word))}"' if len(word) > 1 else f'"{word}"*' for word in _query_words(q)
+    )
+    if not words or set(types) >= set(SEARCH_TYPES):
+        return words
+    return f"entity : ({' OR '.join(types)}) AND {{terms extra_terms}} : ({words})"
+
+
+def ts_query(q: str) -> str:
+    """PostgreSQL to_tsquery 식 (bigram은 <->로 연결, 한 글자는 :* 접두어)"""
+    return " & ".join(
+        " <-> ".join(bigrams(word)) if len(word) > 1 else f"{word}:*" for word in _query_words(q)
+    )
+
+
+# 색인 안에서 순위를 매겨 상위 limit건만 원본 행과 조인 (일치 건수가 많아도 조인 비용은 limit건)
+_SQLITE_SEARCH = f"""
+SELECT e.entity, e.entity_id, e.label, e.detail, -hits.rank AS score
+FROM (
+    SELECT rowid, bm25({FTS_TABLE}, 0, {LABEL_WEIGHT}, {EXTRA_WEIGHT}) AS rank
+    FROM {FTS_TABLE}
+    WHERE {FTS_TABLE} MATCH :query
+    ORDER BY rank
+    LIMIT :limit
+) AS hits JOIN searchentry e ON e.search_key = hits.rowid
+ORDER BY hits.rank
+"""
+
+# ts_rank 가중치 배열은 {D, C, B, A} 순서
+_POSTGRES_SEARCH = f"""
+SELECT entity, entity_id, label, detail,
+       ts_rank('{{0, 0, {EXTRA_WEIGHT / LABEL_WEIGHT}, 1}}'::float4[], {PG_SEARCH_VECTOR}, query) AS score
+FROM searchentry, to_tsquery('simple', :query) AS query
+WHERE ({PG_SEARCH_VECTOR}) @@ query AND entity IN :types
+ORDER BY score DESC
+LIMIT :limit
+"""
+
+
+async def search(db: AsyncSession, q: str, types: Sequence[str] = SEARCH_TYPES, limit: int = 20) -> List[SearchHit]:
+    """
+    검색어와 일치하는 계약·발주처·문서를 관련도 순으로 반환합니다.
+    검색어는 색인과 같은 방식으로 정규화하므로 '-' 유무(사업자번호 등)와 대소문자는 구분하지 않습니다.
+    """
+    types = [entity for entity in SEARCH_TYPES if entity in types]
+    if not types:
+        return []
+    if db.bind.dialect.name == "postgresql":
+        query = ts_query(q)
+        stmt = text(_POSTGRES_SEARCH).bindparams(bindparam("types", expanding=True))
+        params = {"query": query, "types": types, "limit": limit}
+    else:
+        query = fts_query(q, types)
+        stmt = text(_SQLITE_SEARCH)
+        params = {"query": query, "limit": limit}
+    if not query:
+        return []
+    rows = await db.execute(stmt, params)
+    return [
+        SearchHit(type=entity, id=UUID(str(entity_id)), label=label, detail=detail, score=score)
+        for entity, entity_id, label, detail, score in rows
+    ]
+
+
+def rebuild_index(db: Session) -> int:
+    """
+    색인을 비우고 원본 테이블에서 다시 만듭니다.
+
+    Returns:
+        int: 색인한 행 수
+    """
+    connection = write_connection(db)
+    count = 0
+    try:
+        connection.execute(delete(SearchEntry))
+        if connection.dialect.name == "sqlite":
+            connection.execute(text(f"DELETE FROM {FTS_TABLE}"))
+        for model in SEARCH_SOURCES:
+            rows = connection.execution_options(yield_per=REBUILD_BATCH_SIZE).execute(select(model.__table__))
+            for batch in rows.partitions():
+                write_entries(connection, (entry_values(model, row) for row in batch), replace=False)
+                count += len(batch)
+        if connection.dialect.name == "sqlite":
+            # 삭제 후 다시 넣은 색인 세그먼트를 하나로 병합
+            connection.execute(text(f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}) VALUES ('optimize')"))
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return count
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="통합 검색 색인 관리")
+    parser.add_argument("command", choices=["rebuild"])
+    parser.parse_args(argv)
+
+    from ..db.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        print(f"검색 색인 {rebuild_index(db)}건을 다시 만들었습니다.")
+        return 0
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+from datetime import date
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import Numeric, String, func, literal, select, union_all
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+from ..models.contract import Contract
+from ..models.expense import Expense
+from ..models.financial_summary import ContractMonthlySummary
+from ..models.labor_cost import LaborCost
+from ..models.revenue import Revenue
+
+PERIODS = ("month", "quarter", "year")
+
+
+class period_key(FunctionElement):
+    """
+    날짜 컬럼을 집계 기간 문자열로 변환하는 SQL 식
+    month: 2024-01, quarter: 2024-Q1, year: 2024
+    """
+    type = String()
+    inherit_cache = True
+    name = "period_key"
+
+    def __init__(self, column, period: str):
+        if period not in PERIODS:
+            raise ValueError(f"지원하지 않는 집계 기간입니다: {period}")
+        self.period = period
+        super().__init__(column)
+
+
+@compiles(period_key, "sqlite")
+def _period_key_sqlite(element, compiler, **kw):
+    column = compiler.process(list(element.clauses)[0], **kw)
+    if element.period == "month":
+        return f"strftime('%Y-%m', {column})"
+    if element.period == "quarter":
+        return f"(strftime('%Y', {column}) || '-Q' || ((CAST(strftime('%m', {column}) AS INTEGER) + 2) / 3))"
+    return f"strftime('%Y', {column})"
+
+
+@compiles(period_key, "postgresql")
+def _period_key_postgresql(element, compiler, **kw):
+    column = compiler.process(list(element.clauses)[0], **kw)
+    formats = {"month": "YYYY-MM", "quarter": 'YYYY-"Q"Q', "year": "YYYY"}
+    return f"to_char({column}, '{formats[element.period]}')"
+
+
+def _money(expr):
+    return func.coalesce(func.sum(expr), 0).cast(Numeric(15, 2))
+
+
+def _date_filters(column, contract_column, contract_id, date_from, date_to):
+    filters = []
+    if contract_id is not None:
+        filters.append(contract_column == contract_id)
+    if date_from is not None:
+        filters.append(column >= date_from)
+    if date_to is not None:
+        filters.append(column <= date_to)
+    return filters
+
+
+def financial_summary_stmt(period: str = "month", contract_id: Optional[UUID] = None,
+                           date_from: Optional[date] = None, date_to: Optional[date] = None):
+    """
+    계약 / 구분(수입·지출·노무비) / 분류 / 기간별 합계를 한 번의 쿼리(UNION ALL + GROUP BY)로 조회합니다.
+
+    (contract_id, 날짜, 분류, 금액) 인덱스로 각 테이블을 인덱스만 읽고 집계할 수 있습니다.
+    """
+    parts = []
+    for kind, model, date_col, category_col, amount_col in (
+        ("revenue", Revenue, Revenue.payment_date, Revenue.payment_type, Revenue.amount),
+        ("expense", Expense, Expense.expense_date, Expense.category, Expense.amount),
+        ("labor", LaborCost, LaborCost.work_date, None, LaborCost.total_amount),
+    ):
+        period_col = period_key(date_col, period)
+        group_by = [model.contract_id, period_col] + ([category_col] if category_col is not None else [])
+        parts.append(
+            select(
+                model.contract_id.label("contract_id"),
+                period_col.label("period"),
+                literal(kind).label("kind"),
+                (category_col if category_col is not None else literal(kind)).label("category"),
+                _money(amount_col).label("total"),
+                func.count().label("count"),
+            )
+            .where(*_date_filters(date_col, model.contract_id, contract_id, date_from, date_to))
+            .group_by(*group_by)
+        )
+    summary = union_all(*parts).subquery()
+    return select(summary).order_by(summary.c.contract_id, summary.c.period, summary.c.kind, summary.c.category)
+
+
+def profit_loss_stmt(contract_id: Optional[UUID] = None,
+                     date_from: Optional[date] = None, date_to: Optional[date] = None):
+    """
+    계약별 손익(수입 - 지출 - 노무비)을 한 번의 쿼리로 조회합니다.
+    각 테이블을 계약 단위로 먼저 집계한 뒤 계약 테이블에 LEFT JOIN 합니다.
+    """
+    def totals(model, date_col, amount_col, label):
+        return (
+            select(model.contract_id, _money(amount_col).label(label))
+            .where(*_date_filters(date_col, model.contract_id, None, date_from, date_to))
+            .group_by(model.contract_id)
+            .subquery()
+        )
+
+    revenue = totals(Revenue, Revenue.payment_date, Revenue.amount, "revenue")
+    expense = totals(Expense, Expense.expense_date, Expense.amount, "expense")
+    labor = totals(LaborCost, LaborCost.work_date, LaborCost.total_amount, "labor_cost")
+
+    revenue_total = func.coalesce(revenue.c.revenue, 0)
+    expense_total = func.coalesce(expense.c.expense, 0)
+    labor_total = func.coalesce(labor.c.labor_cost, 0)
+    stmt = (
+        select(
+            Contract.id.label("contract_id"),
+            Contract.contract_number,
+            Contract.project_name,
+            Contract.contract_amount,
+            revenue_total.cast(Numeric(15, 2)).label("revenue"),
+            expense_total.cast(Numeric(15, 2)).label("expense"),
+            labor_total.cast(Numeric(15, 2)).label("labor_cost"),
+            (revenue_total - expense_total - labor_total).cast(Numeric(15, 2)).label("profit"),
+        )
+        .outerjoin(revenue, revenue.c.contract_id == Contract.id)
+        .outerjoin(expense, expense.c.contract_id == Contract.id)
+        .outerjoin(labor, labor.c.contract_id == Contract.id)
+        .order_by(Contract.contract_number)
+    )
+    if contract_id is not None:
+        stmt = stmt.where(Contract.id == contract_id)
+    return stmt
+
+
+def contract_totals_stmt(contract_id: Optional[UUID] = None,
+                         month_from: Optional[str] = None, month_to: Optional[str] = None):
+    """
+    계약별 수입/지출/노무비 합계를 계약·월별 집계 테이블에서 조회합니다.
+    원본 거래 행이 아니라 (계약 × 월) 행만 읽으므로 대시보드 조회 비용이 거래 건수와 무관합니다.
+    """
+    summary = ContractMonthlySummary
+    filters = []
+    if contract_id is not None:
+        filters.append(summary.contract_id == contract_id)
+    if month_from is not None:
+        filters.append(summary.month >= month_from)
+    if month_to is not None:
+        filters.append(summary.month <= month_to)
+    revenue = _money(summary.revenue_total)
+    expense = _money(summary.expense_total)
+    labor = _money(summary.labor_cost_total)
+    return (
+        select(
+            summary.contract_id,
+            revenue.label("revenue"),
+            expense.label("expense"),
+            labor.label("labor_cost"),
+            (revenue - expense - labor).cast(Numeric(15, 2)).label("profit"),
+        )
+        .where(*filters)
+        .group_by(summary.contract_id)
+        .order_by(summary.contract_id)
+    )
@@ -0,0 +1,187 @@
+import io
+import os
+import re
+import zipfile
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Iterator, List, Tuple, Union
+from xml.sax.saxutils import escape
+
+TEMPLATE_CACHE_SIZE = 32
+# 치환 대상 XML 파트 (본문, 머리글/바닥글)
+TEMPLATE_PARTS = re.compile(r"word/(document|header\d*|footer\d*)\.xml")
+# {{필드}} - Word가 자리표시자를 여러 run으로 나눠 저장해도 찾을 수 있도록 사이의 태그를 허용
+PLACEHOLDER = re.compile(rb"\{(?:<[^>]*>)*\{((?:[^{}<]|<[^>]*>)*?)\}(?:<[^>]*>)*\}")
+TAG = re.compile(rb"<[^>]*>")
+# 표의 행 하나 (중첩 표는 지원하지 않음)
+TABLE_ROW = re.compile(rb"<w:tr[ >].*?</w:tr>", re.S)
+FIELD = re.compile(rb"\{\{([^{}]+)\}\}")
+
+# 컴파일된 조각: bytes(고정 XML) | str(필드 이름) | (목록 이름, 행 조각)
+Segment = Union[bytes, str, Tuple[str, list]]
+
+
+class TemplateError(ValueError):
+    pass
+
+
+def format_value(value) -> str:
+    """필드 값을 문서에 넣을 문자열로 변환 (숫자는 천 단위 구분, 날짜는 ISO 형식)"""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "예" if value else "아니오"
+    if isinstance(value, (int, float, Decimal)):
+        return f"{value:,}"
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+def _normalize(xml: bytes) -> bytes:
+    # run 경계 태그를 제거하여 자리표시자를 {{이름}} 형태의 연속된 텍스트로 만듦
+    def clean(match):
+        name = TAG.sub(b"", match.group(1)).strip()
+        return b"{{" + name + b"}}"
+    return PLACEHOLDER.sub(clean, xml)
+
+
+def _fields(xml: bytes) -> List[Segment]:
+    segments: List[Segment] = []
+    position = 0
+    for match in FIELD.finditer(xml):
+        segments.append(xml[position:match.start()])
+        segments.append(match.group(1).decode("utf-8"))
+        position = match.end()
+    segments.append(xml[position:])
+    return segments
+
+
+def _compile_part(xml: bytes) -> List[Segment]:
+    """
+    XML 파트를 고정 조각과 필드 목록으로 나눕니다.
+    모든 필드가 '목록.필드' 형태인 표 행은 목록 항목마다 반복되는 행이 됩니다.
+    """
+    xml = _normalize(xml)
+    segments: List[Segment] = []
+    position = 0
+    for row in TABLE_ROW.finditer(xml):
+        names = [name.decode("utf-8") for name in FIELD.findall(row.group(0))]
+        lists = {name.split(".", 1)[0] for name in names if "." in name}
+        if len(lists) != 1 or not all("." in name for name in names):
+            continue
+        segments.extend(_fields(xml[position:row.start()]))
+        prefix = lists.pop()
+        inner = [
+            segment[len(prefix) + 1:] if isinstance(segment, str) else segment
+            for segment in _fields(row.group(0))
+        ]
+        segments.append((prefix, inner))
+        position = row.end()
+    segments.extend(_fields(xml[position:]))
+    return segments
+
+
+def _render_segments(segments: List[Segment], context: dict, out: List[bytes]):
+    for segment in segments:
+        if isinstance(segment, bytes):
+            out.append(segment)
+        elif isinstance(segment, str):
+            if segment not in context:
+                raise TemplateError(f"템플릿 필드 값이 없습니다: {segment}")
+            out.append(escape(format_value(context[segment])).encode("utf-8"))
+        else:
+            name, row = segment
+            for item in context.get(name) or ():
+                _render_segments(row, item, out)
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """
+    한 번 파싱한 DOCX 템플릿
+
+    치환할 XML 파트는 조각 목록으로 보관하고, 나머지 파트(스타일, 글꼴, 이미지 등)는 컴파일할 때
+    미리 압축한 zip으로 만들어 두어 렌더링할 때는 그 뒤에 채운 파트만 압축해 덧붙입니다.
+    """
+    path: str
+    static_zip: bytes
+    # (파트 이름, 수정 시각, 조각 목록) - ZipInfo는 기록 시 변경되므로 렌더링마다 새로 만듦
+    parts: Tuple[Tuple[str, tuple, List[Segment]], ...]
+
+    @property
+    def fields(self) -> List[str]:
+        names = []
+
+        def collect(segments, prefix=""):
+            for segment in segments:
+                if isinstance(segment, str):
+                    names.append(prefix + segment)
+                elif isinstance(segment, tuple):
+                    collect(segment[1], segment[0] + ".")
+        for *_, segments in self.parts:
+            collect(segments)
+        return names
+
+    def render(self, context: dict) -> bytes:
+        """context 값을 채운 문서(DOCX 바이트)를 반환합니다."""
+        output = io.BytesIO(self.static_zip)
+        with zipfile.ZipFile(output, "a", zipfile.ZIP_DEFLATED) as archive:
+            for name, date_time, segments in self.parts:
+                out: List[bytes] = []
+                _render_segments(segments, context, out)
+                info = zipfile.ZipInfo(name, date_time)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                archive.writestr(info, b"".join(out))
+        return output.getvalue()
+
+
+def compile_template(path: Union[str, Path]) -> CompiledTemplate:
+    """DOCX 템플릿을 읽어 렌더링용으로 컴파일합니다. (캐시 없음, 보통 load_template 사용)"""
+    parts = []
+    static = io.BytesIO()
+    try:
+        with zipfile.ZipFile(path) as archive, zipfile.ZipFile(static, "w", zipfile.ZIP_DEFLATED) as static_archive:
+            for info in archive.infolist():
+                content = archive.read(info)
+                if TEMPLATE_PARTS.fullmatch(info.filename):
+                    parts.append((info.filename, info.date_time, _compile_part(content)))
+                else:
+                    static_archive.writestr(info, content)
+    except zipfile.BadZipFile:
+        raise TemplateError(f"DOCX 템플릿이 아닙니다: {path}")
+    return CompiledTemplate(str(path), static.getvalue(), tuple(parts))
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _cached_template(path: str, mtime_ns: int, size: int) -> CompiledTemplate:
+    return compile_template(path)
+
+
+def load_template(path: Union[str, Path]) -> CompiledTemplate:
+    """
+    컴파일된 템플릿을 반환합니다.
+    (경로, 수정 시각, 크기)를 키로 LRU 캐시하므로 파일이 바뀌면 자동으로 다시 컴파일됩니다.
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    return _cached_template(path, stat.st_mtime_ns, stat.st_size)
+
+
+def clear_template_cache():
+    _cached_template.cache_clear()
+
+
+def render(path: Union[str, Path], context: dict) -> bytes:
+    """템플릿 하나를 렌더링합니다."""
+    return load_template(path).render(context)
+
+
+def render_batch(path: Union[str, Path], contexts: Iterable[dict]) -> Iterator[bytes]:
+    """같은 템플릿으로 여러 문서를 렌더링합니다. 템플릿은 처음 한 번만 조회합니다."""
+    template = load_template(path)
+    for context in contexts:
+        yield template.render(context)
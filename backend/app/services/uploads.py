@@ -0,0 +1,189 @@
+import asyncio
+import hashlib
+import mimetypes
+import weakref
+from pathlib import Path
+from typing import AsyncIterator, Dict, Tuple
+from uuid import UUID
+
+import aiofiles
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from ..models.document import Document
+from ..models.upload_session import UploadSession
+from .blob_store import find_blob, store_blob
+from .jobs import notify_job_queued
+from .previews import schedule_preview
+
+HASH_READ_SIZE = 1024 * 1024
+
+
+class UploadError(ValueError):
+    pass
+
+
+class UploadOffsetMismatch(UploadError):
+    """요청의 시작 위치가 서버에 기록된 받은 크기와 다른 경우 (클라이언트는 GET으로 위치를 다시 확인)"""
+
+
+class UploadTooLarge(UploadError):
+    pass
+
+
+class UploadChecksumMismatch(UploadError):
+    pass
+
+
+# 세션별 (해시 위치, sha256 객체) - 이어받기마다 파일을 다시 읽지 않도록 프로세스 안에서 유지
+_hashers: Dict[UUID, Tuple[int, "hashlib._Hash"]] = {}
+_locks: "weakref.WeakValueDictionary[UUID, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+
+def upload_lock(upload_id: UUID) -> asyncio.Lock:
+    """같은 세션에 대한 동시 청크 요청을 직렬화하는 잠금"""
+    lock = _locks.get(upload_id)
+    if lock is None:
+        lock = _locks[upload_id] = asyncio.Lock()
+    return lock
+
+
+def guess_mime_type(file_name: str) -> str:
+    return mimetypes.guess_type(file_name)[0] or "application/octet-stream"
+
+
+def partial_path(upload_dir: Path, upload_id: UUID) -> Path:
+    path = upload_dir / ".partial"
+    path.mkdir(parents=True, exist_ok=True)
+    return path / str(upload_id)
+
+
+def _hash_file(path: Path, size: int):
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        remaining = size
+        while remaining > 0:
+            block = f.read(min(HASH_READ_SIZE, remaining))
+            if not block:
+                break
+            hasher.update(block)
+            remaining -= len(block)
+    return hasher
+
+
+async def _hasher_at(path: Path, upload_id: UUID, offset: int):
+    # 다른 프로세스에서 시작했거나 재시작 후 이어받는 경우에는 받은 부분을 다시 해시
+    cached = _hashers.get(upload_id)
+    if cached is not None and cached[0] == offset:
+        return cached[1]
+    if offset == 0:
+        return hashlib.sha256()
+    return await run_in_threadpool(_hash_file, path, offset)
+
+
+async def append_chunks(db: AsyncSession, upload: UploadSession, offset: int, chunks: AsyncIterator[bytes],
+                        upload_dir: Path, chunk_size: int) -> UploadSession:
+    """
+    요청 본문을 chunk_size 단위로 디스크에 이어 쓰고 쓰는 동안 sha256을 계산합니다.
+
+    본문 전체를 메모리에 올리지 않으며, 선언한 전체 크기를 넘는 순간 중단합니다.
+    연결이 끊기거나 오류가 나도 기록한 위치까지는 received_size에 저장되어 이어받을 수 있고,
+    마지막 바이트를 받으면 complete_upload로 Document 행을 생성합니다.
+    (호출하는 쪽에서 upload_lock으로 세션별 요청을 직렬화해야 합니다)
+
+    Raises:
+        UploadOffsetMismatch: offset이 received_size와 다른 경우
+        UploadTooLarge: 본문이 남은 크기보다 큰 경우
+        UploadChecksumMismatch: 완료 시 해시가 클라이언트가 보낸 sha256과 다른 경우
+    """
+    if offset != upload.received_size:
+        raise UploadOffsetMismatch(f"업로드 위치가 맞지 않습니다. (서버: {upload.received_size}, 요청: {offset})")
+    path = partial_path(upload_dir, upload.id)
+    hasher = await _hasher_at(path, upload.id, offset)
+    written = offset
+    buffer = bytearray()
+
+    async with aiofiles.open(path, "r+b" if path.exists() else "wb") as f:
+        # 이전 요청이 기록 후 위치 저장 전에 중단된 경우 남은 꼬리를 버림
+        await f.truncate(offset)
+        await f.seek(offset)
+
+        async def flush(block: bytes):
+            nonlocal written
+            await f.write(block)
+            hasher.update(block)
+            written += len(block)
+
+        try:
+            async for data in chunks:
+                if written + len(buffer) + len(data) > upload.total_size:
+                    raise UploadTooLarge(f"파일 크기가 선언한 크기({upload.total_size} bytes)를 넘습니다.")
+                buffer += data
+                while len(buffer) >= chunk_size:
+                    block = bytes(buffer[:chunk_size])
+                    del buffer[:chunk_size]
+                    await flush(block)
+        finally:
+            if buffer:
+                await flush(bytes(buffer))
+            _hashers[upload.id] = (written, hasher)
+            upload.received_size = written
+            await db.commit()
+
+    if written == upload.total_size:
+        await complete_upload(db, upload, upload_dir, hasher.hexdigest())
+    return upload
+
+
+async def _attach_document(db: AsyncSession, upload: UploadSession, path: Path, sha256: str) -> Document:
+    document = Document(contract_id=upload.contract_id, document_type=upload.document_type,
+                        file_name=upload.file_name, file_path=str(path), file_size=upload.total_size,
+                        mime_type=upload.mime_type, uploaded_by=upload.uploaded_by, sha256=sha256)
+    db.add(document)
+    await db.flush()
+    queued = await schedule_preview(db, document)
+    upload.received_size = upload.total_size
+    upload.sha256 = sha256
+    upload.status = "completed"
+    upload.document_id = document.id
+    await db.commit()
+    if queued:
+        notify_job_queued()
+    return document
+
+
+async def complete_upload(db: AsyncSession, upload: UploadSession, upload_dir: Path, sha256: str) -> Document:
+    """받은 파일을 내용 주소 저장소로 옮기고(같은 내용이 있으면 재사용) Document 행을 생성합니다."""
+    _hashers.pop(upload.id, None)
+    path = partial_path(upload_dir, upload.id)
+    if upload.sha256 and upload.sha256.lower() != sha256:
+        await run_in_threadpool(path.unlink, missing_ok=True)
+        upload.status = "failed"
+        await db.commit()
+        raise UploadChecksumMismatch(f"파일 해시가 일치하지 않습니다. (받은 파일: {sha256})")
+    target = await store_blob(db, path, sha256, upload.total_size, upload_dir)
+    return await _attach_document(db, upload, target, sha256)
+
+
+async def complete_from_store(db: AsyncSession, upload: UploadSession, upload_dir: Path) -> bool:
+    """
+    세션 생성 시 받은 sha256의 파일이 저장소에 이미 있으면 본문을 받지 않고 바로 완료합니다.
+
+    Returns:
+        bool: 완료했으면 True, 파일을 받아야 하면 False
+    """
+    if not upload.sha256:
+        return False
+    path = await find_blob(db, upload.sha256, upload.total_size, upload_dir)
+    if path is None:
+        return False
+    await _attach_document(db, upload, path, upload.sha256)
+    return True
+
+
+async def discard_upload(db: AsyncSession, upload: UploadSession, upload_dir: Path):
+    """진행 중인 업로드 세션과 받은 부분 파일을 삭제합니다."""
+    _hashers.pop(upload.id, None)
+    await run_in_threadpool(partial_path(upload_dir, upload.id).unlink, missing_ok=True)
+    await db.delete(upload)
+    await db.commit()
@@ -1,19 +1,29 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy import event, inspect
 from sqlalchemy.orm import Session
 
 from .database import SessionLocal
-from . import crud
+from . import crud, models
 
 # JWT 설정
 SECRET_KEY = "your-secret-key"  # 실제 운영에서는 환경 변수로 관리
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# 인증 사용자 캐시 설정
+USER_CACHE_TTL_SECONDS = 60
+USER_CACHE_MAX_SIZE = 1024
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
@@ -25,6 +35,95 @@ def get_db():
     finally:
         db.close()
 
+@dataclass(frozen=True)
+class AuthenticatedUser:
+    """
+    인증된 사용자 스냅샷
+
+    캐시 항목은 여러 요청·스레드가 함께 쓰므로 요청이 끝나면 닫히는 세션의 ORM 객체 대신
+    필요한 값만 복사한 불변 객체를 저장합니다. (지연 로딩·DetachedInstanceError 없음)
+    """
+    id: int
+    email: str
+    role: str
+    is_active: bool
+
+    @classmethod
+    def from_model(cls, user: models.User) -> "AuthenticatedUser":
+        return cls(id=user.id, email=user.email, role=user.role, is_active=user.is_active)
+
+class UserCache:
+    """
+    토큰별 인증 사용자 캐시 (TTL + LRU)
+
+    토큰 해시를 키로 사용하며, 항목은 TTL과 토큰 만료 시각 중 먼저 도래하는 시점까지만 유효합니다.
+    """
+
+    def __init__(self, max_size: int = USER_CACHE_MAX_SIZE, ttl: int = USER_CACHE_TTL_SECONDS):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # token_hash -> (expires_at, email, AuthenticatedUser)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, token: str):
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.time():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def set(self, token: str, user: AuthenticatedUser, token_exp: Optional[float] = None):
+        expires_at = time.time() + self.ttl
+        if token_exp is not None:
+            expires_at = min(expires_at, token_exp)
+        with self._lock:
+            key = self._key(token)
+            self._entries[key] = (expires_at, user.email, user)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, email: str):
+        """해당 사용자의 캐시 항목을 모두 제거합니다."""
+        with self._lock:
+            for key in [k for k, v in self._entries.items() if v[1] == email]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+user_cache = UserCache()
+
+
+# 사용자 행이 변경/삭제되면 (is_active, role 등) 캐시를 무효화
+@event.listens_for(models.User, "after_update")
+@event.listens_for(models.User, "after_delete")
+def _invalidate_cached_user(mapper, connection, target):
+    user_cache.invalidate(target.email)
+    # 이메일 자체가 바뀐 경우 이전 이메일 항목도 제거
+    for email in inspect(target).attrs.email.history.deleted or ():
+        user_cache.invalidate(email)
+
 def verify_password(plain_password: str, hashed_password: str):
     return pwd_context.verify(plain_password, hashed_password)
 
@@ -49,7 +148,11 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> AuthenticatedUser:
+    # 이미 검증된 토큰이면 JWT 디코딩과 DB 조회를 생략
+    user = user_cache.get(token)
+    if user is not None:
+        return user
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -62,12 +165,14 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
             raise credentials_exception
     except JWTError:
         raise credentials_exception
-    user = crud.get_user_by_email(db, email=email)
-    if user is None:
+    db_user = crud.get_user_by_email(db, email=email)
+    if db_user is None:
         raise credentials_exception
+    user = AuthenticatedUser.from_model(db_user)
+    user_cache.set(token, user, token_exp=payload.get("exp"))
     return user
 
-def get_current_active_user(current_user = Depends(get_current_user)):
+def get_current_active_user(current_user: AuthenticatedUser = Depends(get_current_user)):
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user 
\ No newline at end of file
@@ -0,0 +1,114 @@
+"""
+계약 라우터 부하 테스트: 동기 세션(이전 방식)과 비동기 세션의 동시 요청 처리량 비교
+
+이전 방식은 async 핸들러 안에서 동기 SessionLocal을 호출하므로 쿼리 동안 이벤트 루프가 막힙니다.
+
+실행: python benchmarks/bench_async_contracts.py [동시 요청 수] [총 요청 수]
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import uuid
+from datetime import date
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import create_engine, insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.api import contracts
+from app.db.database import get_async_db
+from app.models import client, contract, document, expense, labor_cost, revenue, user, worker
+from app.models.base import Base
+
+ROWS = 2_000
+
+
+def seed(engine):
+    Base.metadata.create_all(bind=engine)
+    client_id, user_id = uuid.uuid4(), uuid.uuid4()
+    with engine.begin() as conn:
+        conn.execute(insert(client.Client), [{"id": client_id, "company_name": "테스트건설"}])
+        conn.execute(insert(user.User), [{"id": user_id, "email": "kim@example.com", "password_hash": "x",
+                                          "full_name": "김철수", "role": "admin"}])
+        conn.execute(insert(contract.Contract), [
+            {"contract_number": f"CONT-{i:06d}", "client_id": client_id, "project_name": f"공사 {i}",
+             "contract_amount": 1_000_000, "start_date": date(2024, 1, 1), "status": "진행중",
+             "contract_type": "construction", "created_by": user_id}
+            for i in range(ROWS)
+        ])
+
+
+def build_sync_app(db_url, pool_size):
+    """기존 구현과 같은 패턴: async 핸들러 + 동기 세션"""
+    # 풀이 동시 요청 수보다 작으면 이벤트 루프가 막힌 채 커넥션을 기다리다 교착 상태가 됨
+    engine = create_engine(db_url, connect_args={"check_same_thread": False}, pool_size=pool_size)
+    SessionLocal = sessionmaker(bind=engine)
+
+    def get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+
+    @app.get("/api/contracts/", response_model=list[contracts.Contract])
+    async def get_contracts(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+        return db.query(contract.Contract).offset(skip).limit(limit).all()
+
+    return app
+
+
+def build_async_app(db_url, pool_size):
+    async_engine = create_async_engine(db_url.replace("sqlite://", "sqlite+aiosqlite://", 1), pool_size=pool_size)
+    AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(contracts.router, prefix="/api/contracts")
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    return app
+
+
+async def load(app, concurrency, total):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+        queue = asyncio.Queue()
+        for i in range(total):
+            queue.put_nowait(i)
+
+        async def worker_loop():
+            while not queue.empty():
+                i = queue.get_nowait()
+                response = await http.get("/api/contracts/", params={"skip": (i * 100) % ROWS, "limit": 100})
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker_loop() for _ in range(concurrency)))
+        return total / (time.perf_counter() - start)
+
+
+def main(concurrency=16, total=400):
+    with tempfile.TemporaryDirectory() as tmp:
+        db_url = f"sqlite:///{tmp}/bench.db"
+        seed(create_engine(db_url))
+        apps = (("sync session", build_sync_app(db_url, concurrency)),
+                ("async session", build_async_app(db_url, concurrency)))
+        for name, app in apps:
+            rps = asyncio.run(load(app, concurrency, total))
+            print(f"{name:>14}: {rps:8.1f} req/s (동시 {concurrency}, 총 {total})")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,58 @@
+"""
+태스크 일괄 생성 처리량: 단건 경로(crud.create_task)와 일괄 경로(crud.bulk_tasks) 비교
+
+실행: python benchmarks/bench_bulk.py [태스크 수]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sqlalchemy.orm import sessionmaker
+
+from backend import crud, schemas
+from backend.database import Base
+from backend.app.db.sqlite import RoutingSession, create_sqlite_engine
+from backend.app.services.bulk import BulkRequest
+
+
+def make_items(total):
+    return [
+        {"name": f"공정 {i}", "description": "", "status": "planned", "progress": 0.0,
+         "start_date": "2024-01-01T00:00:00", "end_date": "2024-02-01T00:00:00", "project_id": 1}
+        for i in range(total)
+    ]
+
+
+def session_factory(tmp, name):
+    url = f"sqlite:///{tmp}/{name}.db"
+    engine, writer = create_sqlite_engine(url), create_sqlite_engine(url, writer=True)
+    Base.metadata.create_all(bind=writer)
+    return sessionmaker(class_=RoutingSession, writer_bind=writer, autoflush=False, bind=engine)
+
+
+def main(total=2000):
+    items = make_items(total)
+    with tempfile.TemporaryDirectory() as tmp:
+        db = session_factory(tmp, "single")()
+        start = time.perf_counter()
+        for item in items:
+            crud.create_task(db, schemas.TaskCreate(**item))
+        single = time.perf_counter() - start
+        db.close()
+        print(f"{'single-row':>16}: {single:7.3f}s  {total / single:9.0f} rows/s")
+
+        for chunk_size in (100, 500, 2000):
+            db = session_factory(tmp, f"bulk{chunk_size}")()
+            start = time.perf_counter()
+            result = crud.bulk_tasks(db, BulkRequest(create=items), chunk_size)
+            elapsed = time.perf_counter() - start
+            assert len(result.created) == total and not result.errors
+            db.close()
+            print(f"{f'bulk chunk={chunk_size}':>16}: {elapsed:7.3f}s  {total / elapsed:9.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
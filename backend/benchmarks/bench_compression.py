@@ -0,0 +1,124 @@
+"""
+응답 압축: 인코딩·레벨별 전송 바이트와 요청당 CPU 비용
+
+CompressionMiddleware를 ASGI로 직접 호출하여(HTTP 클라이언트 비용 제외) 측정합니다.
+- contracts: 계약 목록 JSON (발주처 포함, 1,000행 / 10,000행)
+- export: CSV 내보내기 스트림 (1,000행 배치 10개)
+CPU(ms)는 압축하지 않은(identity) 경우를 뺀 요청당 process_time 입니다.
+
+실행: python benchmarks/bench_compression.py
+"""
+import asyncio
+import os
+import sys
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from starlette.responses import Response, StreamingResponse
+
+from backend.app.core.compression import CompressionMiddleware, available_encodings
+from backend.app.core.fast_json import dumps
+
+# (이름, Accept-Encoding, 미들웨어 옵션)
+CASES = [
+    ("identity", "identity", {}),
+    ("gzip-1", "gzip", {"gzip_level": 1}),
+    ("gzip-6", "gzip", {"gzip_level": 6}),
+    ("gzip-9", "gzip", {"gzip_level": 9}),
+    ("br-4", "br", {"brotli_quality": 4}),
+    ("br-5", "br", {"brotli_quality": 5}),
+    ("zstd-3", "zstd", {"zstd_level": 3}),
+    ("zstd-9", "zstd", {"zstd_level": 9}),
+]
+
+
+def contract_rows(total):
+    client_id, user_id = str(uuid.uuid4()), str(uuid.uuid4())
+    base = datetime(2024, 1, 1)
+    return [
+        {"contract_number": f"C-{i:06d}", "client_id": client_id, "project_name": f"서울 {i % 40}구역 신축 공사",
+         "contract_amount": Decimal(1_000_000 + i * 137) / 100, "start_date": date(2024, 1, 1) + timedelta(days=i % 365),
+         "end_date": None, "status": "진행중", "contract_type": "construction", "created_by": user_id,
+         "id": uuid.uuid4(), "created_at": base + timedelta(seconds=i), "updated_at": base + timedelta(seconds=i),
+         "client": {"id": client_id, "company_name": "벤치건설"}}
+        for i in range(total)
+    ]
+
+
+def csv_chunks(batches, batch_size=1000):
+    return [
+        "".join(f"{b * batch_size + i},C-{b * batch_size + i:06d},서울 신축 공사,{(b * batch_size + i) * 1.37:.2f},"
+                f"2024-01-01,진행중\n" for i in range(batch_size)).encode()
+        for b in range(batches)
+    ]
+
+
+async def request(app, accept_encoding):
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": [(b"accept-encoding", accept_encoding.encode())]}
+    sent = 0
+    received = False
+
+    async def receive():
+        # 본문은 한 번만 전달하고 이후에는 서버처럼 연결 종료까지 대기
+        nonlocal received
+        if received:
+            await asyncio.Event().wait()
+        received = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal sent
+        if message["type"] == "http.response.body":
+            sent += len(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return sent
+
+
+def measure(make_response, accept_encoding, options, repeat):
+    async def endpoint(scope, receive, send):
+        await make_response()(scope, receive, send)
+
+    app = CompressionMiddleware(endpoint, minimum_size=1024, **options)
+
+    async def run():
+        size = await request(app, accept_encoding)
+        start = time.process_time()
+        for _ in range(repeat):
+            await request(app, accept_encoding)
+        return size, (time.process_time() - start) / repeat * 1000
+
+    return asyncio.run(run())
+
+
+def main():
+    installed = available_encodings()
+    payloads = {
+        "contracts 1k": (dumps(contract_rows(1000)), 20),
+        "contracts 10k": (dumps(contract_rows(10_000)), 3),
+    }
+    chunks = csv_chunks(10)
+
+    scenarios = {name: (lambda body=body: Response(body, media_type="application/json"), repeat)
+                 for name, (body, repeat) in payloads.items()}
+    scenarios["export csv 10k"] = (lambda: StreamingResponse(iter(chunks), media_type="text/csv"), 5)
+
+    for name, (make_response, repeat) in scenarios.items():
+        print(f"\n{name}")
+        print(f"{'encoding':>9} {'wire(KB)':>9} {'ratio':>6} {'cpu(ms)':>8}")
+        baseline = None
+        for label, accept_encoding, options in CASES:
+            if accept_encoding != "identity" and accept_encoding not in installed:
+                continue
+            size, cpu_ms = measure(make_response, accept_encoding, options, repeat)
+            if baseline is None:
+                baseline = (size, cpu_ms)
+            print(f"{label:>9} {size / 1024:>9.1f} {baseline[0] / size:>6.1f} {cpu_ms - baseline[1]:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
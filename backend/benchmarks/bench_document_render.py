@@ -0,0 +1,59 @@
+"""
+문서 템플릿 렌더링: 매번 템플릿을 파싱·컴파일하는 경우(cold)와 캐시된 템플릿을 재사용하는
+일괄 렌더링(warm) 비교. 월별 노무비 명세서(월마다 작업 행 N개)를 기준으로 측정합니다.
+
+실행: python benchmarks/bench_document_render.py [문서 수] [문서당 행 수]
+"""
+import os
+import sys
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.app.services.templates import clear_template_cache, render, render_batch
+
+TEMPLATE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        "app", "templates", "documents", "labor_statement.docx")
+
+
+def contexts(documents, rows):
+    for month in range(documents):
+        items = [
+            {"work_date": date(2024, 1, 1) + timedelta(days=i % 28), "full_name": f"작업자{i % 15}",
+             "hours_worked": Decimal("8.00"), "hourly_rate": Decimal("15000.00"),
+             "total_amount": Decimal("120000.00"), "payment_status": "pending"}
+            for i in range(rows)
+        ]
+        yield {"contract_number": "BENCH-1", "project_name": "공사", "client_name": "벤치건설",
+               "month": f"{2024 + month // 12}-{month % 12 + 1:02d}", "items": items, "days": rows,
+               "worker_count": 15, "total_hours": Decimal("8.00") * rows,
+               "total_amount": Decimal("120000.00") * rows}
+
+
+def cold(documents, rows):
+    for context in contexts(documents, rows):
+        clear_template_cache()
+        render(TEMPLATE, context)
+
+
+def warm(documents, rows):
+    clear_template_cache()
+    for _ in render_batch(TEMPLATE, contexts(documents, rows)):
+        pass
+
+
+def main():
+    documents = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    print(f"문서 {documents}개, 문서당 {rows}행")
+    for name, run in (("cold (매번 컴파일)", cold), ("warm (캐시 재사용)", warm)):
+        start = time.perf_counter()
+        run(documents, rows)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<20} 전체 {elapsed:7.3f}s  문서당 {elapsed / documents * 1000:7.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+장부 내보내기: 전체 목록을 Pydantic으로 만든 뒤 응답하는 방식과 서버 측 커서 스트리밍(CSV) 비교
+첫 바이트까지의 시간, 전체 시간, tracemalloc 기준 최대 메모리를 출력합니다.
+
+실행: python benchmarks/bench_export.py [행 수]
+"""
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from pydantic import BaseModel
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.models.base import Base
+from backend.app.models.client import Client
+from backend.app.models.contract import Contract
+from backend.app.models.revenue import Revenue
+from backend.app.models.user import User
+from backend.app.services.export import EXPORTS, export_stmt, iter_csv
+
+BATCH_SIZE = 1000
+
+
+class RevenueOut(BaseModel):
+    id: UUID
+    contract_id: UUID
+    amount: Decimal
+    payment_date: date
+    payment_type: str
+    status: str
+    description: Optional[str] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+def seed(url, total):
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as session:
+        client = Client(company_name="벤치건설")
+        user = User(email="bench@example.com", password_hash="x", full_name="벤치", role="admin")
+        session.add_all([client, user])
+        session.flush()
+        contract = Contract(contract_number="BENCH-1", client_id=client.id, project_name="공사",
+                            contract_amount=100000000, start_date=date(2024, 1, 1), status="active",
+                            contract_type="construction", created_by=user.id)
+        session.add(contract)
+        session.flush()
+        session.execute(insert(Revenue), [
+            {"contract_id": contract.id, "amount": Decimal("1234.50"), "payment_type": "transfer",
+             "payment_date": date(2020, 1, 1) + timedelta(days=i % 2000), "description": "기성금"}
+            for i in range(total)
+        ])
+        session.commit()
+    engine.dispose()
+
+
+async def materialized(db):
+    """기존 목록 엔드포인트 방식: ORM 객체 → List[Pydantic] → JSON 한 번에 직렬화"""
+    rows = (await db.execute(select(Revenue))).scalars().all()
+    body = json.dumps([RevenueOut.model_validate(r).model_dump(mode="json") for r in rows]).encode()
+    yield body
+
+
+async def streaming(db):
+    spec = EXPORTS["revenues"]
+    async for chunk in iter_csv(db, spec, export_stmt(spec), BATCH_SIZE):
+        yield chunk
+
+
+async def consume(factory, producer):
+    async with factory() as db:
+        start = time.perf_counter()
+        first, size = None, 0
+        async for chunk in producer(db):
+            first = first or time.perf_counter() - start
+            size += len(chunk)
+        return first, time.perf_counter() - start, size
+
+
+async def run(factory, producer):
+    first, total, size = await consume(factory, producer)
+    tracemalloc.start()
+    await consume(factory, producer)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return first, total, size, peak
+
+
+async def main(total):
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{tmp}/bench.db"
+        seed(url, total)
+        engine = create_async_engine(url.replace("sqlite://", "sqlite+aiosqlite://", 1))
+        factory = async_sessionmaker(engine, expire_on_commit=False)
+        for label, producer in (("list + pydantic", materialized), ("streaming csv", streaming)):
+            first, elapsed, size, peak = await run(factory, producer)
+            print(f"{label:>16}: first byte {first * 1000:8.1f} ms  total {elapsed * 1000:8.1f} ms"
+                  f"  {size / 2**20:6.1f} MiB body  peak {peak / 2**20:7.1f} MiB")
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000))
@@ -0,0 +1,100 @@
+"""
+계약 목록 직렬화: 검증 경로와 FAST_JSON_RESPONSES 경로(열 튜플 → orjson) 비교
+
+조회(SELECT)부터 JSON 바이트까지 엔드포인트와 같은 경로를 측정합니다.
+- jsonable: ORM 객체 → jsonable_encoder → json.dumps (이전 FastAPI 기본 동작)
+- validated: ORM 객체 → TypeAdapter 검증 → dump_json (현재 FastAPI response_model 경로)
+- fast: 열 튜플 → RowEncoder → orjson (검증 없음)
+
+실행: python benchmarks/bench_fast_json.py [행 수]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.api.contracts import CONTRACT_LIST_COLUMNS, CONTRACT_LIST_KEYS, ContractListItem
+from backend.app.core.fast_json import row_encoder
+from backend.app.db.loading import with_profile
+from backend.app.models.base import Base
+from backend.app.models.client import Client
+from backend.app.models.contract import Contract
+from backend.app.models.user import User
+
+
+def seed(session, total):
+    client_id, user_id = uuid.uuid4(), uuid.uuid4()
+    session.execute(insert(Client), [{"id": client_id, "company_name": "벤치건설"}])
+    session.execute(insert(User), [{"id": user_id, "email": "bench@example.com", "password_hash": "x",
+                                    "full_name": "벤치", "role": "admin"}])
+    base = datetime(2020, 1, 1)
+    session.execute(insert(Contract), [
+        {"id": uuid.uuid4(), "contract_number": f"C-{i:06d}", "client_id": client_id,
+         "project_name": f"공사 {i}", "contract_amount": Decimal("1234567.89"), "start_date": date(2024, 1, 1),
+         "end_date": date(2024, 12, 31), "status": "진행중", "contract_type": "construction",
+         "created_by": user_id, "created_at": base + timedelta(seconds=i), "updated_at": base}
+        for i in range(total)
+    ])
+    session.commit()
+
+
+def timed(fn, repeat=7):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+
+def main(total=20_000):
+    adapter = TypeAdapter(List[ContractListItem])
+    order = (Contract.created_at, Contract.id)
+
+    def orm_rows(session, limit):
+        session.expunge_all()
+        stmt = with_profile(select(Contract), Contract, "list").order_by(*order).limit(limit)
+        return session.execute(stmt).scalars().all()
+
+    def jsonable(session, limit):
+        items = adapter.validate_python(orm_rows(session, limit), from_attributes=True)
+        return json.dumps(jsonable_encoder(items), ensure_ascii=False).encode()
+
+    def validated(session, limit):
+        return adapter.dump_json(adapter.validate_python(orm_rows(session, limit), from_attributes=True))
+
+    def fast(session, limit):
+        stmt = select(*CONTRACT_LIST_COLUMNS).join(Contract.client).order_by(*order).limit(limit)
+        return row_encoder(CONTRACT_LIST_KEYS).encode(session.execute(stmt).all())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/bench.db")
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+        seed(session, total)
+
+        print(f"{'rows':>6} {'jsonable(ms)':>13} {'validated(ms)':>14} {'fast(ms)':>9} {'size(KB)':>9}")
+        for limit in (1000, 10_000):
+            jsonable_ms, _ = timed(lambda: jsonable(session, limit))
+            validated_ms, validated_body = timed(lambda: validated(session, limit))
+            fast_ms, fast_body = timed(lambda: fast(session, limit))
+            assert fast_body == validated_body
+            print(f"{limit:>6} {jsonable_ms:>13.2f} {validated_ms:>14.2f} {fast_ms:>9.2f} "
+                  f"{len(fast_body) / 1024:>9.1f}")
+        session.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
@@ -0,0 +1,83 @@
+"""
+목록 응답: 전체 필드(wide)와 fields= 희소 필드셋(narrow)의 응답 크기·지연시간 비교
+
+조회(SELECT)부터 JSON 직렬화까지 엔드포인트와 같은 경로를 측정합니다.
+wide는 FastAPI가 response_model로 직렬화하는 방식(TypeAdapter.dump_json)을 그대로 사용합니다.
+
+실행: python benchmarks/bench_fieldsets.py [행 수]
+"""
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from backend import crud, models, schemas
+from backend.database import Base
+from backend.app.core.fieldsets import parse_fields, sparse_response
+
+# 그리드 화면에서 쓰는 필드
+GRID_FIELDS = "name,status,start_date,end_date,updated_at"
+DESCRIPTION = "현장 위치, 공정 메모, 협력업체 연락처와 특이사항을 기록한 긴 설명입니다. " * 20
+
+
+def seed(session, total):
+    base = datetime(2020, 1, 1)
+    session.execute(insert(models.User), [{"id": 1, "email": "bench@example.com", "username": "bench",
+                                           "hashed_password": "x"}])
+    rows = [
+        {"name": f"프로젝트 {i}", "description": DESCRIPTION, "status": "active",
+         "start_date": base, "end_date": base, "owner_id": 1, "created_at": base + timedelta(seconds=i),
+         "updated_at": base}
+        for i in range(total)
+    ]
+    session.execute(insert(models.Project), rows)
+    session.commit()
+
+
+def timed(fn, repeat=7):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+
+def main(total=20_000):
+    wide_adapter = TypeAdapter(List[schemas.Project])
+    fields = parse_fields(GRID_FIELDS, schemas.Project, models.Project)
+
+    def wide(session, limit):
+        session.expunge_all()
+        projects = crud.get_projects(session, limit=limit)
+        return wide_adapter.dump_json(wide_adapter.validate_python(projects, from_attributes=True))
+
+    def narrow(session, limit):
+        return sparse_response(crud.get_projects(session, limit=limit, fields=fields), schemas.Project, fields).body
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/bench.db")
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+        seed(session, total)
+
+        print(f"fields={GRID_FIELDS}")
+        print(f"{'rows':>6} {'wide(KB)':>10} {'narrow(KB)':>11} {'wide(ms)':>10} {'narrow(ms)':>11}")
+        for limit in (100, 1000, 10_000):
+            wide_ms, wide_body = timed(lambda: wide(session, limit))
+            narrow_ms, narrow_body = timed(lambda: narrow(session, limit))
+            print(f"{limit:>6} {len(wide_body) / 1024:>10.1f} {len(narrow_body) / 1024:>11.1f} "
+                  f"{wide_ms:>10.2f} {narrow_ms:>11.2f}")
+        session.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
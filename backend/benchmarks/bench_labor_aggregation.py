@@ -0,0 +1,105 @@
+"""
+노무비 집계: ORM 객체를 로드해 파이썬 루프로 합산하는 방식과 NumPy 벡터화 집계 서비스 비교
+
+실행: python benchmarks/bench_labor_aggregation.py [행 수]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from decimal import Decimal
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.models.base import Base
+from backend.app.models.client import Client
+from backend.app.models.contract import Contract
+from backend.app.models.labor_cost import LaborCost
+from backend.app.models.user import User
+from backend.app.models.worker import Worker
+from backend.app.services.labor_aggregation import aggregate_labor
+
+WORKERS = 500
+CONTRACTS = 50
+
+
+def seed(session, total):
+    rng = random.Random(0)
+    client = Client(company_name="벤치건설")
+    user = User(email="bench@example.com", password_hash="x", full_name="벤치", role="admin")
+    workers = [Worker(full_name=f"작업자 {i}", hourly_rate=rng.choice([15000, 18000, 20000, 25000]))
+               for i in range(WORKERS)]
+    session.add_all([client, user, *workers])
+    session.flush()
+    contracts = [Contract(contract_number=f"BENCH-{i}", client_id=client.id, project_name=f"공사 {i}",
+                          contract_amount=100000000, start_date=date(2024, 1, 1), status="active",
+                          contract_type="construction", created_by=user.id) for i in range(CONTRACTS)]
+    session.add_all(contracts)
+    session.flush()
+    rows = []
+    for i in range(total):
+        worker = workers[rng.randrange(WORKERS)]
+        hours = Decimal(rng.choice(["4", "8", "8.5", "10"]))
+        rows.append({"contract_id": contracts[rng.randrange(CONTRACTS)].id, "worker_id": worker.id,
+                     "work_date": date(2024, 1, 1) + timedelta(days=rng.randrange(365)),
+                     "hours_worked": hours, "hourly_rate": worker.hourly_rate,
+                     "total_amount": hours * worker.hourly_rate})
+    # 일괄 INSERT (ORM 이벤트를 거치지 않음)
+    session.execute(insert(LaborCost), rows)
+    session.commit()
+
+
+def orm_loop(session):
+    """기존 방식: 모든 행을 ORM 객체로 로드해 파이썬에서 합산"""
+    by_worker, by_contract, by_week = defaultdict(Decimal), defaultdict(Decimal), defaultdict(Decimal)
+    mismatches = 0
+    for row in session.scalars(select(LaborCost)):
+        by_worker[row.worker_id] += row.total_amount
+        by_contract[row.contract_id] += row.total_amount
+        by_week[row.work_date - timedelta(days=row.work_date.weekday())] += row.total_amount
+        mismatches += (row.hours_worked * row.hourly_rate).quantize(Decimal("0.01")) != row.total_amount
+    session.expunge_all()
+    return len(by_worker), len(by_contract), len(by_week), mismatches
+
+
+def vectorized(session):
+    result = aggregate_labor(session, "week")
+    session.expunge_all()
+    return len(result.by_worker), len(result.by_contract), len(result.by_period), result.mismatch_count
+
+
+def timed(fn, repeat=3):
+    best, value = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, value
+
+
+def main(total=100_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/bench.db")
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+        seed(session, total)
+
+        orm_time, orm_value = timed(lambda: orm_loop(session))
+        vec_time, vec_value = timed(lambda: vectorized(session))
+        assert orm_value == vec_value, (orm_value, vec_value)
+
+        print(f"rows={total} workers={WORKERS} contracts={CONTRACTS} groups(worker/contract/week/mismatch)={vec_value}")
+        print(f"{'ORM loop':>12}: {orm_time * 1000:9.1f} ms")
+        print(f"{'vectorized':>12}: {vec_time * 1000:9.1f} ms  ({orm_time / vec_time:.1f}x)")
+        session.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,148 @@
+"""
+작업일지 가져오기: 행마다 ORM INSERT 하는 방식과 스트리밍 청크 가져오기(labor_import) 비교
+처리량과 tracemalloc 기준 최대 메모리(별도 실행에서 측정)를 출력합니다.
+
+실행: python benchmarks/bench_labor_import.py [행 수]
+"""
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from openpyxl import Workbook
+from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.db.sqlite import RoutingSession, create_sqlite_engine
+from backend.app.models.base import Base
+from backend.app.models.client import Client
+from backend.app.models.contract import Contract
+from backend.app.models.labor_cost import LaborCost
+from backend.app.models.user import User
+from backend.app.models.worker import Worker
+from backend.app.services.labor_import import import_labor_costs
+
+WORKERS = 500
+CONTRACTS = 20
+ORM_ROWS = 2000  # 행 단위 ORM INSERT는 느리므로 일부 행만 측정 후 환산
+HEADER = ["작업일", "작업자", "계약번호", "작업시간"]
+
+
+def make_rows(total):
+    rng = random.Random(0)
+    for i in range(total):
+        yield [(date(2024, 1, 1) + timedelta(days=rng.randrange(365))).isoformat(),
+               f"9001{rng.randrange(WORKERS):03d}-1000000", f"BENCH-{rng.randrange(CONTRACTS)}",
+               rng.choice(["4", "8", "8.5", "10"])]
+
+
+def write_csv(path, total):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADER)
+        writer.writerows(make_rows(total))
+
+
+def write_xlsx(path, total):
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(HEADER)
+    for row in make_rows(total):
+        sheet.append(row)
+    workbook.save(path)
+
+
+def session_factory(tmp, name):
+    url = f"sqlite:///{tmp}/{name}.db"
+    engine, writer = create_sqlite_engine(url), create_sqlite_engine(url, writer=True)
+    Base.metadata.create_all(bind=writer)
+    factory = sessionmaker(class_=RoutingSession, writer_bind=writer, autoflush=False,
+                           expire_on_commit=False, bind=engine)
+    db = factory()
+    client = Client(company_name="벤치건설")
+    user = User(email="bench@example.com", password_hash="x", full_name="벤치", role="admin")
+    db.add_all([client, user])
+    db.add_all(Worker(full_name=f"작업자 {i}", id_number=f"9001{i:03d}-1000000", hourly_rate=20000)
+               for i in range(WORKERS))
+    db.flush()
+    db.add_all(Contract(contract_number=f"BENCH-{i}", client_id=client.id, project_name=f"공사 {i}",
+                        contract_amount=100000000, start_date=date(2024, 1, 1), status="active",
+                        contract_type="construction", created_by=user.id) for i in range(CONTRACTS))
+    db.commit()
+    db.close()
+    return factory
+
+
+def orm_per_row(factory, path):
+    """기존 방식: 행마다 작업자/계약을 조회하고 ORM 객체 하나씩 INSERT"""
+    db = factory()
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader)
+        for i, (work_date, worker_key, contract_number, hours) in enumerate(reader):
+            if i >= ORM_ROWS:
+                break
+            worker = db.scalars(select(Worker).where(Worker.id_number == worker_key)).one()
+            contract = db.scalars(select(Contract).where(Contract.contract_number == contract_number)).one()
+            db.add(LaborCost(contract_id=contract.id, worker_id=worker.id, work_date=date.fromisoformat(work_date),
+                             hours_worked=float(hours), hourly_rate=worker.hourly_rate,
+                             total_amount=float(hours) * float(worker.hourly_rate)))
+            db.commit()
+    db.close()
+
+
+def streaming(factory, path):
+    db = factory()
+    with open(path, "rb") as f:
+        result = import_labor_costs(db, f, path, chunk_size=5000)
+    db.close()
+    return result
+
+
+def timed(fn):
+    start = time.perf_counter()
+    value = fn()
+    return time.perf_counter() - start, value
+
+
+def peak_memory(fn):
+    # tracemalloc은 실행을 크게 느리게 하므로 시간 측정과 분리
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main(total=100_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path, xlsx_path = f"{tmp}/worklog.csv", f"{tmp}/worklog.xlsx"
+        write_csv(csv_path, total)
+        write_xlsx(xlsx_path, total)
+
+        factory = session_factory(tmp, "orm")
+        elapsed, _ = timed(lambda: orm_per_row(factory, csv_path))
+        print(f"{'ORM per-row':>14}: {ORM_ROWS / elapsed:9.0f} rows/s  (~{total * elapsed / ORM_ROWS:6.1f}s for {total})")
+
+        for label, path in (("streaming csv", csv_path), ("streaming xlsx", xlsx_path)):
+            name = label.replace(" ", "_")
+            factory = session_factory(tmp, name)
+            elapsed, result = timed(lambda: streaming(factory, path))
+            assert result.inserted == total and result.error_count == 0, result
+            db = factory()
+            assert db.scalar(select(func.count()).select_from(LaborCost)) == total
+            db.close()
+            memory_factory = session_factory(tmp, f"{name}_memory")
+            peak = peak_memory(lambda: streaming(memory_factory, path))
+            print(f"{label:>14}: {total / elapsed:9.0f} rows/s  ({elapsed:6.1f}s for {total})"
+                  f"  peak {peak / 2**20:6.1f} MiB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,66 @@
+"""
+OFFSET 페이지네이션과 커서(키셋) 페이지네이션의 페이지별 지연시간 비교
+
+실행: python benchmarks/bench_pagination.py [행 수]
+"""
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from backend import crud, models
+from backend.database import Base
+from backend.app.core.pagination import encode_cursor
+
+PAGE_SIZE = 100
+
+
+def seed(session, total):
+    base = datetime(2020, 1, 1)
+    rows = [
+        {"name": f"프로젝트 {i}", "description": "", "status": "active",
+         "start_date": base, "end_date": base, "created_at": base + timedelta(seconds=i),
+         "updated_at": base}
+        for i in range(total)
+    ]
+    session.execute(insert(models.Project), rows)
+    session.commit()
+
+
+def timed(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(total=200_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/bench.db")
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+        seed(session, total)
+
+        print(f"{'page':>8} {'offset(ms)':>12} {'cursor(ms)':>12}")
+        for page in (1, 10, 100, 500, (total // PAGE_SIZE) - 1):
+            skip = page * PAGE_SIZE
+            # 직전 페이지 마지막 행의 키로 커서를 만든다
+            anchor = session.get(models.Project, skip)
+            cursor = encode_cursor(anchor.created_at, anchor.id)
+            offset_ms = timed(lambda: crud.get_projects(session, skip=skip, limit=PAGE_SIZE))
+            cursor_ms = timed(lambda: crud.get_projects(session, limit=PAGE_SIZE, cursor=cursor))
+            print(f"{page:>8} {offset_ms:>12.2f} {cursor_ms:>12.2f}")
+        session.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,106 @@
+"""
+통합 검색: LIKE '%검색어%' 전체 스캔과 FTS5 bigram 색인(app.services.search) 지연시간 비교
+
+LIKE는 순위 없이 먼저 찾은 LIMIT건에서 멈추므로 흔한 단어는 빠르지만, 드물거나 없는 단어는
+테이블 전체를 읽습니다. FTS는 일치 건수에 비례해 bm25 순위를 계산하고 없는 단어는 즉시 끝납니다.
+
+실행: python benchmarks/bench_search.py [계약 수]
+"""
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+from datetime import date
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sqlalchemy import create_engine, insert, or_, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.models.base import Base
+from backend.app.models.client import Client
+from backend.app.models.contract import Contract
+from backend.app.models.user import User
+from backend.app.services.search import rebuild_index, search
+
+REGIONS = ["서울", "부산", "대구", "인천", "광주", "대전", "울산", "세종", "수원", "창원", "전주", "청주"]
+SITES = ["사옥", "물류창고", "아파트", "초등학교", "교량", "터널", "주차장", "체육관", "도서관", "병원", "공장", "상가"]
+WORKS = ["신축공사", "보수공사", "리모델링", "전기공사", "설비공사", "철거공사", "도장공사", "방수공사"]
+QUERIES = ["교량", "물류창고 신축", "cont-0012345", "체육관 방수", "세종", "없는현장"]
+LIMIT = 20
+
+
+def seed(session, total):
+    random.seed(0)
+    user_id, client_id = uuid.uuid4(), uuid.uuid4()
+    session.execute(insert(User), [{"id": user_id, "email": "bench@example.com", "password_hash": "x",
+                                    "full_name": "벤치", "role": "admin"}])
+    session.execute(insert(Client), [{"id": client_id, "company_name": "벤치건설"}])
+    for start in range(0, total, 10_000):
+        session.execute(insert(Contract), [
+            {"contract_number": f"CONT-{i:07d}", "client_id": client_id, "created_by": user_id,
+             "project_name": f"{random.choice(REGIONS)} {random.choice(SITES)} {random.choice(WORKS)}",
+             "contract_amount": 1, "start_date": date(2024, 1, 1), "status": "active",
+             "contract_type": "construction"}
+            for i in range(start, min(start + 10_000, total))
+        ])
+    session.commit()
+
+
+def like_search(session, q):
+    # 단어마다 공사명 또는 계약번호에 포함되는지 (색인을 쓸 수 없는 전체 스캔)
+    conditions = [or_(Contract.project_name.like(f"%{word}%"), Contract.contract_number.ilike(f"%{word}%"))
+                  for word in q.split()]
+    return session.execute(select(Contract.id, Contract.project_name).where(*conditions).limit(LIMIT)).all()
+
+
+def timed(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+async def fts_timings(url):
+    engine = create_async_engine(url)
+    AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False)
+    timings = {}
+    async with AsyncSessionLocal() as db:
+        for q in QUERIES:
+            best = float("inf")
+            for _ in range(5):
+                start = time.perf_counter()
+                await search(db, q, limit=LIMIT)
+                best = min(best, time.perf_counter() - start)
+            timings[q] = best * 1000
+    await engine.dispose()
+    return timings
+
+
+def main(total=200_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/bench.db")
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+        seed(session, total)
+        start = time.perf_counter()
+        indexed = rebuild_index(session)
+        print(f"계약 {total:,}건, 색인 {indexed:,}건 생성 {time.perf_counter() - start:.1f}s")
+
+        fts = asyncio.run(fts_timings(f"sqlite+aiosqlite:///{tmp}/bench.db"))
+        print(f"{'query':<18} {'like(ms)':>10} {'fts(ms)':>10}")
+        for q in QUERIES:
+            like_ms = timed(lambda: like_search(session, q))
+            print(f"{q:<18} {like_ms:>10.2f} {fts[q]:>10.2f}")
+        session.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
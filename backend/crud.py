@@ -1,9 +1,15 @@
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy.orm import Session, joinedload, selectinload
+from typing import List, Optional, Sequence
 from datetime import datetime
 
 from . import models, schemas
 from .auth import get_password_hash
+from .app.core.fieldsets import select_columns
+from .app.core.pagination import paginate
+from .app.db.loading import loading_options, register_profiles
+from .app.db.versions import count_and_latest
+from .app.db.writes import commit_and_load, delete_by_id, update_by_id
+from .app.services.bulk import BulkRequest, BulkResult, apply_bulk
 
 # User CRUD
 def get_user(db: Session, user_id: int):
@@ -23,70 +29,81 @@ def create_user(db: Session, user: schemas.UserCreate):
         hashed_password=hashed_password
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
-    return db_user
+    return commit_and_load(db, db_user)
 
 # Project CRUD
-def get_project(db: Session, project_id: int):
-    return db.query(models.Project).filter(models.Project.id == project_id).first()
+# 목록은 관계를 쓰지 않고, 상세(ProjectDetail)는 소유자와 작업 목록을 함께 읽음
+register_profiles(
+    models.Project,
+    list=(),
+    detail=(joinedload(models.Project.owner), selectinload(models.Project.tasks)),
+)
 
-def get_projects(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(models.Project).offset(skip).limit(limit).all()
+def get_project(db: Session, project_id: int, profile: str = "detail"):
+    query = db.query(models.Project).options(*loading_options(models.Project, profile))
+    return query.filter(models.Project.id == project_id).first()
+
+def get_project_version(db: Session, project_id: int):
+    """프로젝트 상세(소유자·작업 목록 포함)의 버전 값, 프로젝트가 없으면 None"""
+    query = db.query(models.Project.updated_at, models.User.updated_at,
+                     *count_and_latest(models.Task, models.Task.project_id == models.Project.id))
+    return query.outerjoin(models.Project.owner).filter(models.Project.id == project_id).first()
+
+def get_projects_version(db: Session):
+    return db.query(*count_and_latest(models.Project)).one()
+
+def get_projects(db: Session, skip: int = 0, limit: int = 100, cursor: Optional[str] = None,
+                 fields: Optional[Sequence[str]] = None):
+    if fields:
+        # 요청한 열만 SELECT (엔티티 대신 Row 목록)
+        query = db.query(*select_columns(models.Project, fields))
+    else:
+        query = db.query(models.Project).options(*loading_options(models.Project, "list"))
+    return paginate(query, models.Project.created_at, models.Project.id,
+                    cursor=cursor, skip=skip, limit=limit)
 
 def create_project(db: Session, project: schemas.ProjectCreate, owner_id: int):
     db_project = models.Project(**project.dict(), owner_id=owner_id)
     db.add(db_project)
-    db.commit()
-    db.refresh(db_project)
-    return db_project
-
-def update_project(db: Session, project_id: int, project: schemas.ProjectUpdate):
-    db_project = get_project(db, project_id)
-    if db_project:
-        update_data = project.dict(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(db_project, key, value)
-        db.commit()
-        db.refresh(db_project)
-    return db_project
+    return commit_and_load(db, db_project)
+
+def update_project(db: Session, project_id: int, project: schemas.ProjectUpdate,
+                   updated_at: Optional[datetime] = None):
+    # updated_at이 주어지면 그 뒤로 수정되지 않은 경우에만 수정 (If-Match)
+    criteria = () if updated_at is None else (models.Project.updated_at == updated_at,)
+    return update_by_id(db, models.Project, project_id, project.dict(exclude_unset=True), *criteria)
 
 def delete_project(db: Session, project_id: int):
-    db_project = get_project(db, project_id)
-    if db_project:
-        db.delete(db_project)
-        db.commit()
-        return True
-    return False
+    return delete_by_id(db, models.Project, project_id)
 
 # Task CRUD
 def get_task(db: Session, task_id: int):
     return db.query(models.Task).filter(models.Task.id == task_id).first()
 
-def get_tasks(db: Session, project_id: int, skip: int = 0, limit: int = 100):
-    return db.query(models.Task).filter(models.Task.project_id == project_id).offset(skip).limit(limit).all()
+def get_task_version(db: Session, task_id: int):
+    return db.query(models.Task.updated_at).filter(models.Task.id == task_id).first()
+
+def get_tasks_version(db: Session, project_id: int):
+    return db.query(*count_and_latest(models.Task, models.Task.project_id == project_id)).one()
+
+def get_tasks(db: Session, project_id: int, skip: int = 0, limit: int = 100, cursor: Optional[str] = None,
+              fields: Optional[Sequence[str]] = None):
+    query = db.query(*select_columns(models.Task, fields)) if fields else db.query(models.Task)
+    query = query.filter(models.Task.project_id == project_id)
+    return paginate(query, models.Task.created_at, models.Task.id,
+                    cursor=cursor, skip=skip, limit=limit)
 
 def create_task(db: Session, task: schemas.TaskCreate):
     db_task = models.Task(**task.dict())
     db.add(db_task)
-    db.commit()
-    db.refresh(db_task)
-    return db_task
-
-def update_task(db: Session, task_id: int, task: schemas.TaskUpdate):
-    db_task = get_task(db, task_id)
-    if db_task:
-        update_data = task.dict(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(db_task, key, value)
-        db.commit()
-        db.refresh(db_task)
-    return db_task
+    return commit_and_load(db, db_task)
+
+def update_task(db: Session, task_id: int, task: schemas.TaskUpdate, updated_at: Optional[datetime] = None):
+    criteria = () if updated_at is None else (models.Task.updated_at == updated_at,)
+    return update_by_id(db, models.Task, task_id, task.dict(exclude_unset=True), *criteria)
 
 def delete_task(db: Session, task_id: int):
-    db_task = get_task(db, task_id)
-    if db_task:
-        db.delete(db_task)
-        db.commit()
-        return True
-    return False 
\ No newline at end of file
+    return delete_by_id(db, models.Task, task_id) 
+
+def bulk_tasks(db: Session, request: BulkRequest, chunk_size: int) -> BulkResult:
+    return apply_bulk(db, models.Task, schemas.TaskCreate, schemas.TaskUpdate, request, chunk_size)
\ No newline at end of file
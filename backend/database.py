@@ -1,13 +1,19 @@
-from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
+from .app.core.config import settings
+from .app.db.pool import instrument_engine
+from .app.db.sqlite import RoutingSession, create_sqlite_engine
+
 SQLALCHEMY_DATABASE_URL = "sqlite:///./construction_management.db"
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# 읽기용 엔진과 단일 writer 엔진 (WAL 등 SQLite 성능 프로필 적용)
+engine = create_sqlite_engine(SQLALCHEMY_DATABASE_URL)
+writer_engine = create_sqlite_engine(SQLALCHEMY_DATABASE_URL, writer=True) if settings.SQLITE_SINGLE_WRITER else None
+pool_metrics = instrument_engine(engine)
+writer_pool_metrics = instrument_engine(writer_engine) if writer_engine is not None else None
+SessionLocal = sessionmaker(class_=RoutingSession, writer_bind=writer_engine,
+                            autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 Base = declarative_base()
 
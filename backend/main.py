@@ -1,14 +1,41 @@
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Header, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
+from contextlib import asynccontextmanager
 
-from backend.database import SessionLocal, engine
+from backend.database import SessionLocal, engine, pool_metrics, writer_engine, writer_pool_metrics
 from backend import models, schemas, crud
-from backend.auth import get_current_user
+from backend.app.api import contracts, documents, exports, jobs, labor_costs, search, statistics, uploads
+from backend.app.core.config import settings
+from backend.app.services.bulk import BulkRequest, BulkResult
+from backend.app.services.jobs import start_job_runner, stop_job_runner
+from backend.app.db import database as app_database
+from backend.app.db.pool import pool_status
+from backend.auth import AuthenticatedUser, get_current_user, user_cache
+from backend.app.core.compression import CompressionMiddleware
+from backend.app.core.conditional import if_match_fails, is_not_modified, version_etag, version_headers
+from backend.app.core.fast_json import FastJSONResponse
+from backend.app.core.fieldsets import InvalidFieldsError, parse_fields, selectable_fields, sparse_response
+from backend.app.core.pagination import InvalidCursorError, NEXT_CURSOR_HEADER, next_cursor
 
-app = FastAPI(title="Construction Management API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 문서 생성 등 백그라운드 작업 디스패처 (외부 브로커 없이 프로세스 풀 사용)
+    if settings.JOB_RUNNER_ENABLED:
+        start_job_runner()
+    try:
+        yield
+    finally:
+        stop_job_runner()
+
+# FAST_JSON_RESPONSES가 꺼져 있으면 FastAPI 기본 응답(response_model의 dump_json 경로)을 그대로 사용
+app = FastAPI(
+    title="Construction Management API",
+    lifespan=lifespan,
+    **({"default_response_class": FastJSONResponse} if settings.FAST_JSON_RESPONSES else {}),
+)
 
 # CORS 설정
 app.add_middleware(
@@ -19,6 +46,41 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 응답 압축 (큰 JSON 목록·내보내기 스트림)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        encodings=settings.COMPRESSION_ENCODINGS,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+        zstd_level=settings.COMPRESSION_ZSTD_LEVEL,
+    )
+
+# 계약 관련 엔드포인트
+app.include_router(contracts.router, prefix="/api/contracts", tags=["contracts"])
+
+# 통계 관련 엔드포인트
+app.include_router(statistics.router, prefix="/api/statistics", tags=["statistics"])
+
+# 노무비 관련 엔드포인트
+app.include_router(labor_costs.router, prefix="/api/labor-costs", tags=["labor-costs"])
+
+# 장부 내보내기 엔드포인트
+app.include_router(exports.router, prefix="/api/exports", tags=["exports"])
+
+# 백그라운드 작업 엔드포인트
+app.include_router(jobs.router, prefix="/api/jobs", tags=["jobs"])
+
+# 이어받기 가능한 파일 업로드 엔드포인트
+app.include_router(uploads.router, prefix="/api/uploads", tags=["uploads"])
+
+# 문서 다운로드 엔드포인트
+app.include_router(documents.router, prefix="/api/documents", tags=["documents"])
+
+# 통합 검색 엔드포인트
+app.include_router(search.router, prefix="/api/search", tags=["search"])
+
 # 데이터베이스 의존성
 def get_db():
     db = SessionLocal()
@@ -30,42 +92,86 @@ def get_db():
 # 프로젝트 관련 엔드포인트
 @app.get("/api/projects", response_model=List[schemas.Project])
 def get_projects(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = Query(None, description="쉼표로 구분한 응답 필드 (예: id,name,status)"),
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: AuthenticatedUser = Depends(get_current_user)
 ):
-    projects = crud.get_projects(db, skip=skip, limit=limit)
+    try:
+        selected = parse_fields(fields, schemas.Project, models.Project)
+        if selected is None and settings.FAST_JSON_RESPONSES:
+            # 전체 필드도 열 단위로 읽어 검증 없이 직렬화
+            selected = selectable_fields(schemas.Project, models.Project)
+        # 목록 버전(행 수·최근 수정 시각)이 같으면 목록을 조회하지 않고 304
+        headers = version_headers(crud.get_projects_version(db), last_modified=False)
+        if is_not_modified(headers, if_none_match):
+            return Response(status_code=304, headers=headers)
+        projects = crud.get_projects(db, skip=skip, limit=limit, cursor=cursor, fields=selected)
+    except (InvalidCursorError, InvalidFieldsError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    cursor_value = next_cursor(projects, limit)
+    if cursor_value:
+        headers[NEXT_CURSOR_HEADER] = cursor_value
+    if selected:
+        return sparse_response(projects, schemas.Project, selected, headers,
+                               validate=not settings.FAST_JSON_RESPONSES)
+    response.headers.update(headers)
     return projects
 
 @app.post("/api/projects", response_model=schemas.Project)
 def create_project(
     project: schemas.ProjectCreate,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: AuthenticatedUser = Depends(get_current_user)
 ):
     return crud.create_project(db=db, project=project)
 
-@app.get("/api/projects/{project_id}", response_model=schemas.Project)
+@app.get("/api/projects/{project_id}", response_model=schemas.ProjectDetail)
 def get_project(
     project_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: AuthenticatedUser = Depends(get_current_user)
 ):
+    version = crud.get_project_version(db, project_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    # 작업 삭제는 최근 수정 시각을 바꾸지 않으므로 Last-Modified 없이 ETag(작업 수 포함)로만 재검증
+    headers = version_headers(version, last_modified=False)
+    if is_not_modified(headers, if_none_match):
+        return Response(status_code=304, headers=headers)
     project = crud.get_project(db, project_id=project_id)
     if project is None:
         raise HTTPException(status_code=404, detail="Project not found")
+    response.headers.update(headers)
     return project
 
 @app.put("/api/projects/{project_id}", response_model=schemas.Project)
 def update_project(
     project_id: int,
     project: schemas.ProjectUpdate,
+    if_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: AuthenticatedUser = Depends(get_current_user)
 ):
-    updated_project = crud.update_project(db, project_id=project_id, project=project)
+    updated_at = None
+    if if_match is not None:
+        version = crud.get_project_version(db, project_id)
+        if version is None:
+            raise HTTPException(status_code=404, detail="Project not found")
+        if if_match_fails(if_match, version_etag(*version)):
+            raise HTTPException(status_code=412, detail="Project has been modified")
+        updated_at = version[0]
+    updated_project = crud.update_project(db, project_id=project_id, project=project, updated_at=updated_at)
     if updated_project is None:
+        if updated_at is not None:
+            # 확인한 뒤 다른 요청이 먼저 수정(또는 삭제)한 경우
+            raise HTTPException(status_code=412, detail="Project has been modified")
         raise HTTPException(status_code=404, detail="Project not found")
     return updated_project
 
@@ -73,7 +179,7 @@ def update_project(
 def delete_project(
     project_id: int,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: AuthenticatedUser = Depends(get_current_user)
 ):
     success = crud.delete_project(db, project_id=project_id)
     if not success:
@@ -84,42 +190,97 @@ def delete_project(
 @app.get("/api/tasks", response_model=List[schemas.Task])
 def get_tasks(
     project_id: int,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = Query(None, description="쉼표로 구분한 응답 필드 (예: id,name,progress)"),
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: AuthenticatedUser = Depends(get_current_user)
 ):
-    tasks = crud.get_tasks(db, project_id=project_id, skip=skip, limit=limit)
+    try:
+        selected = parse_fields(fields, schemas.Task, models.Task)
+        if selected is None and settings.FAST_JSON_RESPONSES:
+            # 전체 필드도 열 단위로 읽어 검증 없이 직렬화
+            selected = selectable_fields(schemas.Task, models.Task)
+        # 목록 버전(행 수·최근 수정 시각)이 같으면 목록을 조회하지 않고 304
+        headers = version_headers(crud.get_tasks_version(db, project_id), last_modified=False)
+        if is_not_modified(headers, if_none_match):
+            return Response(status_code=304, headers=headers)
+        tasks = crud.get_tasks(db, project_id=project_id, skip=skip, limit=limit, cursor=cursor, fields=selected)
+    except (InvalidCursorError, InvalidFieldsError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    cursor_value = next_cursor(tasks, limit)
+    if cursor_value:
+        headers[NEXT_CURSOR_HEADER] = cursor_value
+    if selected:
+        return sparse_response(tasks, schemas.Task, selected, headers,
+                               validate=not settings.FAST_JSON_RESPONSES)
+    response.headers.update(headers)
     return tasks
 
 @app.post("/api/tasks", response_model=schemas.Task)
 def create_task(
     task: schemas.TaskCreate,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: AuthenticatedUser = Depends(get_current_user)
 ):
     return crud.create_task(db=db, task=task)
 
+@app.post("/api/tasks:batch", response_model=BulkResult)
+def batch_tasks(
+    request: BulkRequest,
+    chunk_size: Optional[int] = Query(None, ge=1),
+    db: Session = Depends(get_db),
+    current_user: AuthenticatedUser = Depends(get_current_user)
+):
+    if request.size > settings.BULK_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"Too many items (max {settings.BULK_MAX_ITEMS})")
+    return crud.bulk_tasks(db, request, chunk_size or settings.BULK_CHUNK_SIZE)
+
 @app.get("/api/tasks/{task_id}", response_model=schemas.Task)
 def get_task(
     task_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    if_modified_since: Optional[str] = Header(None),
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: AuthenticatedUser = Depends(get_current_user)
 ):
+    version = crud.get_task_version(db, task_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    headers = version_headers(version)
+    if is_not_modified(headers, if_none_match, if_modified_since):
+        return Response(status_code=304, headers=headers)
     task = crud.get_task(db, task_id=task_id)
     if task is None:
         raise HTTPException(status_code=404, detail="Task not found")
+    response.headers.update(headers)
     return task
 
 @app.put("/api/tasks/{task_id}", response_model=schemas.Task)
 def update_task(
     task_id: int,
     task: schemas.TaskUpdate,
+    if_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: AuthenticatedUser = Depends(get_current_user)
 ):
-    updated_task = crud.update_task(db, task_id=task_id, task=task)
+    updated_at = None
+    if if_match is not None:
+        version = crud.get_task_version(db, task_id)
+        if version is None:
+            raise HTTPException(status_code=404, detail="Task not found")
+        if if_match_fails(if_match, version_etag(*version)):
+            raise HTTPException(status_code=412, detail="Task has been modified")
+        updated_at = version[0]
+    updated_task = crud.update_task(db, task_id=task_id, task=task, updated_at=updated_at)
     if updated_task is None:
+        if updated_at is not None:
+            # 확인한 뒤 다른 요청이 먼저 수정(또는 삭제)한 경우
+            raise HTTPException(status_code=412, detail="Task has been modified")
         raise HTTPException(status_code=404, detail="Task not found")
     return updated_task
 
@@ -127,13 +288,31 @@ def update_task(
 def delete_task(
     task_id: int,
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user)
+    current_user: AuthenticatedUser = Depends(get_current_user)
 ):
     success = crud.delete_task(db, task_id=task_id)
     if not success:
         raise HTTPException(status_code=404, detail="Task not found")
     return {"message": "Task deleted successfully"}
 
+# 진단 엔드포인트
+@app.get("/api/diagnostics/user-cache")
+def get_user_cache_stats(current_user: AuthenticatedUser = Depends(get_current_user)):
+    return user_cache.stats()
+
+@app.get("/api/diagnostics/pool")
+def get_pool_stats(current_user: AuthenticatedUser = Depends(get_current_user)):
+    pools = {
+        "main": pool_status(engine, pool_metrics),
+        "contracts": pool_status(app_database.engine, app_database.pool_metrics),
+        "contracts_async": pool_status(app_database.async_engine, app_database.async_pool_metrics),
+    }
+    if writer_engine is not None:
+        pools["main_writer"] = pool_status(writer_engine, writer_pool_metrics)
+    if app_database.writer_engine is not None:
+        pools["contracts_writer"] = pool_status(app_database.writer_engine, app_database.writer_pool_metrics)
+    return pools
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
@@ -0,0 +1,42 @@
+"""add cursor pagination indexes
+
+Revision ID: 3f9a1c2b7e41
+Revises: d57d66baccb4
+Create Date: 2026-10-17 10:12:03.418272
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9a1c2b7e41'
+down_revision: Union[str, None] = 'd57d66baccb4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_table(name: str) -> bool:
+    # projects/tasks 테이블은 backend.database.init_db()로 생성되므로 없을 수도 있음
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_contract_created_at_id', 'contract', ['created_at', 'id'], unique=False)
+    if _has_table('projects'):
+        op.create_index('ix_projects_created_at_id', 'projects', ['created_at', 'id'], unique=False)
+    if _has_table('tasks'):
+        op.create_index('ix_tasks_project_id_created_at_id', 'tasks',
+                        ['project_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if _has_table('tasks'):
+        op.drop_index('ix_tasks_project_id_created_at_id', table_name='tasks')
+    if _has_table('projects'):
+        op.drop_index('ix_projects_created_at_id', table_name='projects')
+    op.drop_index('ix_contract_created_at_id', table_name='contract')
@@ -0,0 +1,30 @@
+"""add job lease columns
+
+Revision ID: 71c4da6ac128
+Revises: c8ad12b04c66
+Create Date: 2026-10-17 09:12:05.417230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '71c4da6ac128'
+down_revision: Union[str, None] = 'c8ad12b04c66'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('job', sa.Column('claimed_by', sa.String(length=100), nullable=True))
+    op.add_column('job', sa.Column('lease_expires_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('job', 'lease_expires_at')
+    op.drop_column('job', 'claimed_by')
@@ -0,0 +1,35 @@
+"""add financial aggregation indexes
+
+Revision ID: 8b2e4d6f1a93
+Revises: 3f9a1c2b7e41
+Create Date: 2026-10-17 14:03:51.207114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2e4d6f1a93'
+down_revision: Union[str, None] = '3f9a1c2b7e41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_revenue_contract_id_payment_date', 'revenue',
+                    ['contract_id', 'payment_date', 'payment_type', 'amount'], unique=False)
+    op.create_index('ix_expense_contract_id_expense_date', 'expense',
+                    ['contract_id', 'expense_date', 'category', 'amount'], unique=False)
+    op.create_index('ix_laborcost_contract_id_work_date', 'laborcost',
+                    ['contract_id', 'work_date', 'total_amount'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_laborcost_contract_id_work_date', table_name='laborcost')
+    op.drop_index('ix_expense_contract_id_expense_date', table_name='expense')
+    op.drop_index('ix_revenue_contract_id_payment_date', table_name='revenue')
@@ -0,0 +1,30 @@
+"""add document preview columns
+
+Revision ID: ae0860e173cc
+Revises: fcdc1bee0cf7
+Create Date: 2026-10-17 01:30:40.808024
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ae0860e173cc'
+down_revision: Union[str, None] = 'fcdc1bee0cf7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('document', sa.Column('preview_path', sa.String(length=500), nullable=True))
+    op.add_column('document', sa.Column('preview_status', sa.String(length=20), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('document', 'preview_status')
+    op.drop_column('document', 'preview_path')
@@ -0,0 +1,44 @@
+"""add contract monthly summary
+
+Revision ID: c41d7e9a2f58
+Revises: 8b2e4d6f1a93
+Create Date: 2026-10-17 15:42:10.318220
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41d7e9a2f58'
+down_revision: Union[str, None] = '8b2e4d6f1a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('contractmonthlysummary',
+    sa.Column('contract_id', sa.Uuid(), nullable=False),
+    sa.Column('month', sa.String(length=7), nullable=False),
+    sa.Column('revenue_total', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.Column('revenue_count', sa.Integer(), nullable=False),
+    sa.Column('expense_total', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.Column('expense_count', sa.Integer(), nullable=False),
+    sa.Column('labor_cost_total', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.Column('labor_cost_count', sa.Integer(), nullable=False),
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['contract_id'], ['contract.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('contract_id', 'month', name='uq_contractmonthlysummary_contract_id_month')
+    )
+    # 기존 데이터는 `python -m app.services.financial_rollup rebuild`로 백필
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('contractmonthlysummary')
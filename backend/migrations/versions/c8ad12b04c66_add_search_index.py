@@ -0,0 +1,56 @@
+"""add search index
+
+기존 데이터의 색인은 업그레이드 후 python -m app.services.search rebuild로 생성합니다.
+
+Revision ID: c8ad12b04c66
+Revises: ae0860e173cc
+Create Date: 2026-10-17 01:34:32.255671
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8ad12b04c66'
+down_revision: Union[str, None] = 'ae0860e173cc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('searchentry',
+    sa.Column('search_key', sa.BigInteger(), nullable=False),
+    sa.Column('entity', sa.String(length=20), nullable=False),
+    sa.Column('entity_id', sa.Uuid(), nullable=False),
+    sa.Column('label', sa.String(length=255), nullable=False),
+    sa.Column('detail', sa.String(length=255), nullable=True),
+    sa.Column('terms', sa.Text(), nullable=False),
+    sa.Column('extra_terms', sa.Text(), nullable=False),
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('search_key', name='uq_searchentry_search_key')
+    )
+    op.create_index('ix_searchentry_entity_entity_id', 'searchentry', ['entity', 'entity_id'], unique=False)
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        op.execute("CREATE VIRTUAL TABLE IF NOT EXISTS searchentry_fts "
+                   "USING fts5(entity, terms, extra_terms, tokenize='unicode61')")
+    elif dialect == 'postgresql':
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_searchentry_vector ON searchentry USING gin (("
+            "setweight(to_tsvector('simple', terms), 'A') || setweight(to_tsvector('simple', extra_terms), 'B')))"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'sqlite':
+        op.execute("DROP TABLE IF EXISTS searchentry_fts")
+    op.drop_index('ix_searchentry_entity_entity_id', table_name='searchentry')
+    op.drop_table('searchentry')
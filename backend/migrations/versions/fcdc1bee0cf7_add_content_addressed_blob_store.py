@@ -0,0 +1,41 @@
+"""add content addressed blob store
+
+Revision ID: fcdc1bee0cf7
+Revises: 15c88dab293f
+Create Date: 2026-10-17 01:27:43.599216
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fcdc1bee0cf7'
+down_revision: Union[str, None] = '15c88dab293f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('blob',
+    sa.Column('sha256', sa.String(length=64), nullable=False),
+    sa.Column('size', sa.BigInteger(), nullable=False),
+    sa.Column('ref_count', sa.Integer(), nullable=False),
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('sha256')
+    )
+    op.add_column('document', sa.Column('sha256', sa.String(length=64), nullable=True))
+    op.create_index(op.f('ix_document_sha256'), 'document', ['sha256'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_document_sha256'), table_name='document')
+    op.drop_column('document', 'sha256')
+    op.drop_table('blob')
@@ -74,4 +74,8 @@ class Task(TaskBase):
     updated_at: datetime
 
     class Config:
-        orm_mode = True 
\ No newline at end of file
+        orm_mode = True
+
+class ProjectDetail(Project):
+    owner: Optional[User] = None
+    tasks: List[Task] = []
@@ -0,0 +1,123 @@
+import os
+import sys
+from contextlib import contextmanager
+from datetime import date
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+# app.* (backend 기준) 과 backend.* (저장소 루트 기준) 임포트를 모두 허용
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (BACKEND_DIR, os.path.dirname(BACKEND_DIR)):
+    if path not in sys.path:
+        sys.path.append(path)
+
+from app.db.database import get_async_db  # noqa: E402
+from app.models.base import Base  # noqa: E402
+from app.models.client import Client  # noqa: E402
+from app.models.contract import Contract  # noqa: E402
+from app.models.user import User  # noqa: E402
+
+
+@pytest.fixture
+def db_url(tmp_path):
+    """스키마를 만든 테스트용 SQLite 파일 DB URL"""
+    url = f"sqlite:///{tmp_path / 'test.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+    return url
+
+
+@pytest.fixture
+def session_factory(db_url):
+    engine = create_engine(db_url)
+    yield sessionmaker(bind=engine, expire_on_commit=False)
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(session_factory):
+    with session_factory() as session:
+        yield session
+
+
+@pytest.fixture
+def seed(session_factory):
+    """발주처·사용자를 한 명씩 만들고 id를 반환합니다. {"client_id", "user_id"}"""
+    with session_factory() as session:
+        client = Client(company_name="테스트건설")
+        user = User(email="kim@example.com", password_hash="x", full_name="김철수", role="admin")
+        session.add_all([client, user])
+        session.commit()
+        return {"client_id": client.id, "user_id": user.id}
+
+
+@pytest.fixture
+def contract_id(session_factory, seed):
+    """seed의 발주처·사용자로 계약(CONT-001)을 만들고 id를 반환합니다."""
+    with session_factory() as session:
+        contract = Contract(contract_number="CONT-001", client_id=seed["client_id"], project_name="공사",
+                            contract_amount=1000000, start_date=date(2024, 1, 1), status="active",
+                            contract_type="construction", created_by=seed["user_id"])
+        session.add(contract)
+        session.commit()
+        return contract.id
+
+
+@pytest.fixture
+def async_engine(db_url):
+    return create_async_engine(db_url.replace("sqlite://", "sqlite+aiosqlite://", 1))
+
+
+@pytest.fixture
+def api(request, async_engine):
+    """
+    테스트 모듈의 ROUTERS({prefix: router})를 등록한 TestClient
+    get_async_db는 테스트 DB의 aiosqlite 세션으로 바꿉니다.
+    """
+    AsyncTestingSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with AsyncTestingSessionLocal() as db:
+            yield db
+
+    app = FastAPI()
+    for prefix, router in request.module.ROUTERS.items():
+        app.include_router(router, prefix=prefix)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+class QueryCounter:
+    """엔진에서 실행된 SQL 문 수 (N+1 검사용)"""
+
+    def __init__(self):
+        self.statements = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+
+@pytest.fixture
+def count_queries():
+    """with count_queries(engine) as counter: 블록 안에서 실행된 쿼리를 셉니다. (AsyncEngine 가능)"""
+    @contextmanager
+    def counting(engine):
+        engine = getattr(engine, "sync_engine", engine)
+        counter = QueryCounter()
+        event.listen(engine, "before_cursor_execute", counter._record)
+        try:
+            yield counter
+        finally:
+            event.remove(engine, "before_cursor_execute", counter._record)
+    return counting
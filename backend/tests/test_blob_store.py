@@ -0,0 +1,102 @@
+import asyncio
+import hashlib
+from datetime import datetime, timedelta
+from sqlalchemy import delete, event, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.blob import Blob
+from app.models.document import Document
+from app.services.blob_store import blob_path, collect_garbage, recount_references, store_blob
+
+
+def _store(db, upload_dir, content: bytes) -> Blob:
+    sha256 = hashlib.sha256(content).hexdigest()
+    path = blob_path(upload_dir, sha256)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    blob = Blob(sha256=sha256, size=len(content))
+    db.add(blob)
+    db.commit()
+    return blob
+
+
+def test_reference_counts_follow_documents_and_gc_removes_orphans(db_session, seed, contract_id, tmp_path):
+    db = db_session
+
+    license_blob = _store(db, tmp_path, b"business license")
+    unused_blob = _store(db, tmp_path, b"unused")
+    orphan = blob_path(tmp_path, "f" * 64)
+    orphan.parent.mkdir(parents=True)
+    orphan.write_bytes(b"orphan")
+
+    def document(name):
+        return Document(contract_id=contract_id, document_type="license", file_name=name,
+                        file_path=str(blob_path(tmp_path, license_blob.sha256)), file_size=16,
+                        mime_type="application/pdf", uploaded_by=seed["user_id"], sha256=license_blob.sha256)
+    first, second = document("사업자등록증.pdf"), document("사업자등록증(2).pdf")
+    db.add_all([first, second])
+    db.commit()
+    assert db.get(Blob, license_blob.id, populate_existing=True).ref_count == 2
+    db.delete(first)
+    db.commit()
+    assert db.get(Blob, license_blob.id, populate_existing=True).ref_count == 1
+
+    # ORM을 거치지 않은 삭제는 recount로 바로잡음
+    db.execute(delete(Document))
+    db.commit()
+    assert db.get(Blob, license_blob.id, populate_existing=True).ref_count == 1
+    assert recount_references(db) == 1
+
+    # 최근에 저장된 파일은 grace 기간 동안 남김
+    assert collect_garbage(db, tmp_path).blobs == 0
+    preview = collect_garbage(db, tmp_path, grace_seconds=-1, dry_run=True)
+    assert (preview.blobs, preview.files) == (2, 3)
+    assert orphan.exists()
+
+    report = collect_garbage(db, tmp_path, grace_seconds=-1)
+    assert (report.blobs, report.files, report.freed_bytes) == (2, 3, len(b"business license" b"unused" b"orphan"))
+    assert db.scalars(select(Blob)).all() == []
+    assert not orphan.exists() and not blob_path(tmp_path, unused_blob.sha256).exists()
+
+
+def test_storing_existing_blob_protects_it_from_gc(db_session, async_engine, tmp_path):
+    db = db_session
+    blob = _store(db, tmp_path, b"business license")
+    db.execute(update(Blob).values(updated_at=datetime.utcnow() - timedelta(days=1)))
+    db.commit()
+
+    # 같은 내용을 다시 받으면 (Document가 추가되기 전이라도) grace 기간이 다시 시작됨
+    source = tmp_path / "upload.tmp"
+    source.write_bytes(b"business license")
+
+    async def store_again():
+        async with AsyncSession(async_engine) as session:
+            await store_blob(session, source, blob.sha256, blob.size, tmp_path)
+            await session.commit()
+        await async_engine.dispose()
+    asyncio.run(store_again())
+
+    assert collect_garbage(db, tmp_path, grace_seconds=3600).blobs == 0
+    assert db.scalar(select(Blob.ref_count).where(Blob.sha256 == blob.sha256)) == 0
+    assert blob_path(tmp_path, blob.sha256).exists() and not source.exists()
+
+
+def test_gc_keeps_blob_stored_again_after_it_was_selected(db_session, tmp_path):
+    db = db_session
+    blob = _store(db, tmp_path, b"business license")
+    db.execute(update(Blob).values(updated_at=datetime.utcnow() - timedelta(days=1)))
+    db.commit()
+
+    # gc가 후보를 조회한 뒤 삭제하기 전에 업로드가 같은 Blob을 다시 저장한 상황
+    stored = []
+
+    def store_again(state):
+        if state.is_delete and not stored:
+            stored.append(True)
+            state.session.execute(update(Blob).values(updated_at=datetime.utcnow()))
+    event.listen(db, "do_orm_execute", store_again)
+
+    report = collect_garbage(db, tmp_path, grace_seconds=3600)
+    assert (report.blobs, report.files) == (0, 0)
+    assert db.scalar(select(Blob.sha256)) == blob.sha256
+    assert blob_path(tmp_path, blob.sha256).exists()
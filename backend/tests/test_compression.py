@@ -0,0 +1,106 @@
+import gzip
+import json
+
+import pytest
+from fastapi import FastAPI, Header, Response
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.compression import CompressionMiddleware, available_encodings, choose_encoding
+from app.core.conditional import etag_matches, if_match_fails
+
+ETAG = '"0123abcd"'
+
+ROWS = [{"id": i, "contract_number": f"C-{i:05d}", "status": "진행중"} for i in range(500)]
+
+
+@pytest.fixture
+def api(tmp_path):
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+    file_path = tmp_path / "notes.txt"
+    file_path.write_text("현장 메모\n" * 1000)
+
+    @app.get("/rows")
+    def rows():
+        return ROWS
+
+    @app.get("/small")
+    def small():
+        return {"ok": True}
+
+    @app.get("/export")
+    def export():
+        return StreamingResponse((f"{row['id']},{row['contract_number']}\n" for row in ROWS), media_type="text/csv")
+
+    @app.get("/versioned")
+    def versioned(if_none_match: str = Header(None)):
+        if etag_matches(if_none_match, ETAG):
+            return Response(status_code=304, headers={"ETag": ETAG})
+        return JSONResponse(ROWS, headers={"ETag": ETAG})
+
+    @app.put("/versioned")
+    def update_versioned(if_match: str = Header(None)):
+        return Response(status_code=412 if if_match_fails(if_match, ETAG) else 204)
+
+    @app.get("/file")
+    def file():
+        return FileResponse(file_path)
+
+    with TestClient(app) as client:
+        yield client
+
+
+def test_choose_encoding():
+    preferred = ("zstd", "br", "gzip")
+    assert choose_encoding("gzip, deflate, br, zstd", preferred) == "zstd"
+    assert choose_encoding("gzip;q=1.0, br;q=0.5", preferred) == "gzip"
+    assert choose_encoding("*;q=0.1, zstd;q=0", preferred) == "br"
+    assert choose_encoding("identity", preferred) is None
+    assert choose_encoding(None, preferred) is None
+
+
+def test_gzip_json_and_threshold(api):
+    response = api.get("/rows", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert response.json() == ROWS
+    assert int(response.headers["Content-Length"]) < len(json.dumps(ROWS, ensure_ascii=False).encode()) / 4
+
+    assert "Content-Encoding" not in api.get("/small", headers={"Accept-Encoding": "gzip"}).headers
+    assert "Content-Encoding" not in api.get("/rows", headers={"Accept-Encoding": "identity"}).headers
+
+
+def test_streaming_export_is_compressed_per_chunk(api):
+    with api.stream("GET", "/export", headers={"Accept-Encoding": "gzip"}) as response:
+        raw = b"".join(response.iter_raw())
+    assert response.headers["Content-Encoding"] == "gzip" and "Content-Length" not in response.headers
+    assert gzip.decompress(raw).decode().splitlines()[-1] == "499,C-00499"
+
+
+def test_range_capable_files_are_not_compressed(api):
+    response = api.get("/file", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Accept-Ranges"] == "bytes" and "Content-Encoding" not in response.headers
+
+
+@pytest.mark.parametrize("coding", ["br", "zstd"])
+def test_optional_encodings(api, coding):
+    if coding not in available_encodings():
+        pytest.skip(f"{coding} 패키지가 설치되지 않음")
+    response = api.get("/rows", headers={"Accept-Encoding": f"gzip;q=0.8, {coding}"})
+    assert response.headers["Content-Encoding"] == coding
+    assert response.json() == ROWS
+
+
+def test_compressed_response_gets_encoding_specific_etag(api):
+    identity = api.get("/versioned", headers={"Accept-Encoding": "identity"})
+    compressed = api.get("/versioned", headers={"Accept-Encoding": "gzip"})
+    assert identity.headers["ETag"] == ETAG
+    assert compressed.headers["ETag"] == '"0123abcd-gzip"'
+
+    # 접미사가 붙은 ETag로도 같은 버전으로 재검증·수정 가능
+    headers = {"Accept-Encoding": "gzip", "If-None-Match": compressed.headers["ETag"]}
+    assert api.get("/versioned", headers=headers).status_code == 304
+    assert api.put("/versioned", headers={"If-Match": compressed.headers["ETag"]}).status_code == 204
+    assert api.put("/versioned", headers={"If-Match": '"ffff-gzip"'}).status_code == 412
+    assert api.put("/versioned", headers={"If-Match": 'W/"0123abcd-gzip"'}).status_code == 412
@@ -0,0 +1,154 @@
+import uuid
+from datetime import date
+
+from app.api import contracts
+from app.core.config import settings
+from app.models import revenue
+
+
+ROUTERS = {"/api/contracts": contracts.router}
+
+
+def _payload(seed, number):
+    return {
+        "contract_number": f"CONT-{number:03d}",
+        "project_name": f"공사 {number}",
+        "contract_amount": "1000000.00",
+        "start_date": "2024-01-01",
+        "contract_type": "construction",
+        "client_id": str(seed["client_id"]),
+        "created_by": str(seed["user_id"]),
+    }
+
+
+def test_contract_crud(api, seed):
+    created = api.post("/api/contracts/", json=_payload(seed, 1))
+    assert created.status_code == 200
+    contract_id = created.json()["id"]
+
+    assert api.get(f"/api/contracts/{contract_id}").json()["project_name"] == "공사 1"
+
+    updated = api.put(f"/api/contracts/{contract_id}", json={**_payload(seed, 1), "status": "완료"})
+    assert updated.json()["status"] == "완료"
+
+    assert api.delete(f"/api/contracts/{contract_id}").status_code == 200
+    assert api.get(f"/api/contracts/{contract_id}").status_code == 404
+    assert api.get(f"/api/contracts/{uuid.uuid4()}").status_code == 404
+
+
+def test_contract_list_cursor(api, seed):
+    for number in range(5):
+        api.post("/api/contracts/", json=_payload(seed, number))
+
+    first = api.get("/api/contracts/", params={"limit": 3})
+    cursor = first.headers["X-Next-Cursor"]
+    second = api.get("/api/contracts/", params={"limit": 3, "cursor": cursor})
+
+    numbers = [c["contract_number"] for c in first.json() + second.json()]
+    assert sorted(numbers) == [f"CONT-{n:03d}" for n in range(5)]
+    assert "X-Next-Cursor" not in second.headers
+    assert api.get("/api/contracts/", params={"cursor": "broken"}).status_code == 400
+
+
+def test_contract_list_sparse_fields(api, seed):
+    for number in range(3):
+        api.post("/api/contracts/", json=_payload(seed, number))
+
+    page = api.get("/api/contracts/", params={"fields": "contract_number, status", "limit": 2})
+    assert page.status_code == 200
+    assert [sorted(c) for c in page.json()] == [["contract_number", "id", "status"]] * 2
+    rest = api.get("/api/contracts/", params={"fields": "contract_number", "cursor": page.headers["X-Next-Cursor"]})
+    assert [c["contract_number"] for c in page.json() + rest.json()] == ["CONT-000", "CONT-001", "CONT-002"]
+
+    assert api.get("/api/contracts/", params={"fields": "client"}).status_code == 400
+    assert api.get("/api/contracts/", params={"fields": "password_hash"}).status_code == 400
+
+
+def test_contract_list_fast_json_matches_validated(api, seed, monkeypatch):
+    for number in range(3):
+        api.post("/api/contracts/", json=_payload(seed, number))
+
+    urls = ["/api/contracts/?limit=2", "/api/contracts/?fields=contract_amount,start_date,client_id"]
+    validated = [api.get(url) for url in urls]
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", True)
+    fast = [api.get(url) for url in urls]
+
+    # 검증을 건너뛰어도 Decimal·날짜·UUID·중첩 발주처까지 같은 바이트
+    assert [r.content for r in fast] == [r.content for r in validated]
+    assert fast[0].headers["X-Next-Cursor"] == validated[0].headers["X-Next-Cursor"]
+    assert fast[0].json()[0]["client"]["company_name"] == "테스트건설"
+
+
+def test_contract_conditional_requests(api, seed):
+    contract_id = api.post("/api/contracts/", json=_payload(seed, 1)).json()["id"]
+    url = f"/api/contracts/{contract_id}"
+
+    first = api.get(url)
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"] == "private, no-cache" and "Last-Modified" not in first.headers
+    assert api.get(url, headers={"If-None-Match": etag}).status_code == 304
+    # 프로필이 달라도 같은 계약 버전
+    assert api.get(f"{url}?profile=financial").headers["ETag"] == etag
+
+    listed = api.get("/api/contracts/")
+    assert api.get("/api/contracts/", headers={"If-None-Match": listed.headers["ETag"]}).status_code == 304
+
+    # If-Match: 약한 ETag나 오래된 ETag는 412, 현재 ETag면 수정
+    changed = {**_payload(seed, 1), "status": "완료"}
+    assert api.put(url, json=changed, headers={"If-Match": f"W/{etag}"}).status_code == 412
+    assert api.put(url, json=changed, headers={"If-Match": etag}).status_code == 200
+    assert api.put(url, json=changed, headers={"If-Match": etag}).status_code == 412
+    assert api.get(url, headers={"If-None-Match": etag}).status_code == 200
+    assert api.get("/api/contracts/", headers={"If-None-Match": listed.headers["ETag"]}).status_code == 200
+    assert api.put(f"/api/contracts/{uuid.uuid4()}", json=changed, headers={"If-Match": "*"}).status_code == 404
+
+
+def test_child_delete_is_not_hidden_by_if_modified_since(api, seed, session_factory):
+    contract_id = api.post("/api/contracts/", json=_payload(seed, 1)).json()["id"]
+    url = f"/api/contracts/{contract_id}?profile=financial"
+    with session_factory() as session:
+        income = revenue.Revenue(contract_id=uuid.UUID(contract_id), amount=100, payment_date=date(2024, 1, 1),
+                                 payment_type="transfer")
+        session.add(income)
+        session.commit()
+    before = api.get(url)
+    assert len(before.json()["revenues"]) == 1
+
+    # 하위 행 삭제는 updated_at을 바꾸지 않으므로 날짜 기준 재검증은 304가 되면 안 됨
+    with session_factory() as session:
+        session.delete(session.get(revenue.Revenue, income.id))
+        session.commit()
+    after = api.get(url, headers={"If-Modified-Since": "Fri, 31 Dec 2100 00:00:00 GMT"})
+    assert after.status_code == 200 and after.json()["revenues"] == []
+    assert after.headers["ETag"] != before.headers["ETag"]
+    assert api.get(url, headers={"If-None-Match": before.headers["ETag"]}).status_code == 200
+
+
+def test_contract_bulk(api, seed):
+    existing = api.post("/api/contracts/", json=_payload(seed, 1)).json()["id"]
+    body = {
+        "create": [_payload(seed, 2), _payload(seed, 1), {"project_name": "누락"}, _payload(seed, 3)],
+        "update": [{"id": existing, "status": "완료"}, {"id": str(uuid.uuid4()), "status": "완료"}],
+        "delete": ["not-a-uuid"],
+    }
+    result = api.post("/api/contracts/bulk", params={"chunk_size": 2}, json=body).json()
+
+    assert [c["index"] for c in result["created"]] == [0, 3]
+    assert result["updated"] == 1
+    # 중복 계약번호(DB 오류), 필수값 누락(검증 오류), 없는 id, 잘못된 id
+    assert sorted((e["op"], e["index"]) for e in result["errors"]) == [
+        ("create", 1), ("create", 2), ("delete", 0), ("update", 1)
+    ]
+    assert api.get(f"/api/contracts/{existing}").json()["status"] == "완료"
+    assert len(api.get("/api/contracts/").json()) == 3
+
+
+def test_contract_with_children_is_not_deleted(api, seed, session_factory):
+    contract_id = api.post("/api/contracts/", json=_payload(seed, 1)).json()["id"]
+    with session_factory() as session:
+        session.add(revenue.Revenue(contract_id=uuid.UUID(contract_id), amount=100, payment_date=date(2024, 1, 1),
+                                    payment_type="transfer"))
+        session.commit()
+
+    assert api.delete(f"/api/contracts/{contract_id}").status_code == 400
+    assert api.get(f"/api/contracts/{contract_id}").status_code == 200
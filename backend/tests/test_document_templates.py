@@ -0,0 +1,79 @@
+import io
+import os
+import shutil
+import zipfile
+from datetime import date
+from decimal import Decimal
+import pytest
+from docx import Document as WordDocument
+
+from app.core.config import settings
+from app.models.labor_cost import LaborCost
+from app.models.worker import Worker
+from app.services.documents import generate_labor_statements
+from app.services.templates import TemplateError, load_template, render
+
+
+@pytest.fixture
+def template(tmp_path):
+    # Word처럼 자리표시자를 여러 run으로 나누고 서식을 섞어서 저장
+    document = WordDocument()
+    paragraph = document.add_paragraph("발주처: ")
+    paragraph.add_run("{{")
+    paragraph.add_run("client").bold = True
+    paragraph.add_run("_name}}")
+    table = document.add_table(rows=2, cols=2)
+    table.rows[0].cells[0].text = "{{items.name}}"
+    table.rows[0].cells[1].text = "{{items.amount}}"
+    table.rows[1].cells[0].text = "합계"
+    table.rows[1].cells[1].text = "{{total}}"
+    path = tmp_path / "template.docx"
+    document.save(path)
+    return path
+
+
+def test_render_fills_split_placeholders_and_repeats_rows(template):
+    content = render(template, {"client_name": "A&B 건설", "total": Decimal("3000.50"),
+                                "items": [{"name": "철근", "amount": 1000}, {"name": "<레미콘>", "amount": 2000.5}]})
+
+    document = WordDocument(io.BytesIO(content))
+    assert document.paragraphs[0].text == "발주처: A&B 건설"
+    assert [[cell.text for cell in row.cells] for row in document.tables[0].rows] == [
+        ["철근", "1,000"], ["<레미콘>", "2,000.5"], ["합계", "3,000.50"],
+    ]
+    with pytest.raises(TemplateError, match="total"):
+        render(template, {"client_name": "A", "items": []})
+
+
+def test_compiled_template_is_cached_by_path_and_mtime(template):
+    compiled = load_template(template)
+    assert load_template(str(template)) is compiled
+    assert compiled.fields == ["client_name", "items.name", "items.amount", "total"]
+
+    stat = os.stat(template)
+    os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert load_template(template) is not compiled
+
+
+def test_labor_statements_rendered_per_month(db_session, contract_id, tmp_path, monkeypatch):
+    monkeypatch.setattr(type(settings), "document_template_path", property(lambda self: tmp_path / "templates"))
+    shutil.copytree(settings.BASE_DIR / "app" / "templates" / "documents", tmp_path / "templates")
+    db = db_session
+    kim, lee = Worker(full_name="김목수", hourly_rate=20000), Worker(full_name="이미장", hourly_rate=15000)
+    db.add_all([kim, lee])
+    db.flush()
+    for worker, day, hours in [(kim, date(2024, 1, 2), 8), (lee, date(2024, 1, 3), 4), (kim, date(2024, 2, 1), 8)]:
+        db.add(LaborCost(contract_id=contract_id, worker_id=worker.id, work_date=day, hours_worked=hours,
+                         hourly_rate=worker.hourly_rate, total_amount=hours * worker.hourly_rate))
+    db.commit()
+
+    result = generate_labor_statements(db, {"contract_id": str(contract_id)}, tmp_path / "out")
+
+    assert result.name == "노무비명세서_CONT-001.zip"
+    with zipfile.ZipFile(result.path) as archive:
+        assert archive.namelist() == ["노무비명세서_2024-01.docx", "노무비명세서_2024-02.docx"]
+        january = WordDocument(io.BytesIO(archive.read("노무비명세서_2024-01.docx")))
+    rows = [[cell.text for cell in row.cells] for row in january.tables[0].rows]
+    assert [row[1] for row in rows[1:3]] == ["김목수", "이미장"]
+    assert rows[3][4] == "220,000.00"
+    assert "작업 2건, 작업자 2명" in [paragraph.text for paragraph in january.paragraphs]
@@ -0,0 +1,81 @@
+import hashlib
+import os
+import pytest
+
+from app.api import documents
+from app.models.document import Document
+
+CONTENT = os.urandom(200_000)
+
+
+ROUTERS = {"/api/documents": documents.router}
+
+
+@pytest.fixture
+def ids(session_factory, seed, contract_id, tmp_path):
+    path = tmp_path / "drawing.pdf"
+    path.write_bytes(CONTENT)
+    preview = tmp_path / "drawing.pdf.preview.jpg"
+    preview.write_bytes(b"jpeg")
+    with session_factory() as session:
+        document = Document(contract_id=contract_id, document_type="drawing", file_name="도면.pdf",
+                            file_path=str(path), file_size=len(CONTENT), mime_type="application/pdf",
+                            uploaded_by=seed["user_id"], sha256=hashlib.sha256(CONTENT).hexdigest(),
+                            preview_path=str(preview), preview_status="ready")
+        missing = Document(contract_id=contract_id, document_type="drawing", file_name="없음.pdf",
+                           file_path=str(tmp_path / "missing.pdf"), file_size=1, mime_type="application/pdf",
+                           uploaded_by=seed["user_id"], preview_status="pending")
+        session.add_all([document, missing])
+        session.commit()
+        return {"document": document.id, "missing": missing.id, "sha256": document.sha256, "contract": contract_id}
+
+
+def test_download_supports_range_and_conditional_requests(api, ids):
+    url = f"/api/documents/{ids['document']}/download"
+
+    full = api.get(url)
+    assert full.status_code == 200
+    assert full.content == CONTENT
+    assert full.headers["etag"] == f'"{ids["sha256"]}"'
+    assert full.headers["accept-ranges"] == "bytes"
+    assert full.headers["content-disposition"].startswith("inline")
+
+    partial = api.get(url, headers={"Range": "bytes=1000-1999"})
+    assert partial.status_code == 206
+    assert partial.content == CONTENT[1000:2000]
+    assert partial.headers["content-range"] == f"bytes 1000-1999/{len(CONTENT)}"
+    # 파일이 바뀌었으면(If-Range 불일치) 전체를 다시 보냄
+    assert api.get(url, headers={"Range": "bytes=0-9", "If-Range": '"stale"'}).status_code == 200
+    assert api.get(url, headers={"Range": f"bytes={len(CONTENT)}-"}).status_code == 416
+
+    cached = api.get(url, headers={"If-None-Match": f'"other", W/{full.headers["etag"]}'})
+    assert (cached.status_code, cached.content, cached.headers["etag"]) == (304, b"", full.headers["etag"])
+    assert api.get(url, headers={"If-None-Match": '"other"'}).status_code == 200
+
+    head = api.head(url)
+    assert (head.status_code, head.headers["content-length"], head.content) == (200, str(len(CONTENT)), b"")
+    assert api.get(url, params={"attachment": True}).headers["content-disposition"].startswith("attachment")
+
+
+def test_download_missing_document_or_file(api, ids):
+    assert api.get(f"/api/documents/{ids['missing']}/download").status_code == 404
+    assert api.get(f"/api/documents/{ids['sha256'][:8]}-0000-0000-0000-000000000000/download").status_code == 404
+
+
+def test_list_includes_preview_urls(api, ids):
+    listed = api.get("/api/documents/", params={"contract_id": str(ids["contract"]), "limit": 1})
+    assert listed.status_code == 200
+    assert listed.headers["X-Next-Cursor"]
+    first = listed.json()[0]
+    rest = api.get("/api/documents/", params={"cursor": listed.headers["X-Next-Cursor"]}).json()
+    by_name = {item["file_name"]: item for item in [first, *rest]}
+
+    ready = by_name["도면.pdf"]
+    assert ready["preview_url"] == f"/api/documents/{ids['document']}/preview"
+    assert ready["download_url"] == f"/api/documents/{ids['document']}/download"
+    assert (by_name["없음.pdf"]["preview_status"], by_name["없음.pdf"]["preview_url"]) == ("pending", None)
+
+    preview = api.get(ready["preview_url"])
+    assert (preview.status_code, preview.content, preview.headers["content-type"]) == (200, b"jpeg", "image/jpeg")
+    assert api.get(ready["preview_url"], headers={"If-None-Match": preview.headers["etag"]}).status_code == 304
+    assert api.get(f"/api/documents/{ids['missing']}/preview").status_code == 404
@@ -0,0 +1,49 @@
+import csv
+import io
+from datetime import date
+import pytest
+from openpyxl import load_workbook
+
+from app.api import exports
+from app.models.revenue import Revenue
+
+
+ROUTERS = {"/api/exports": exports.router}
+
+
+@pytest.fixture(autouse=True)
+def revenues(session_factory, contract_id):
+    with session_factory() as session:
+        session.add_all(
+            Revenue(contract_id=contract_id, amount=1000 * day, payment_date=date(2024, 1, day),
+                    payment_type="transfer", description="기성금")
+            for day in range(1, 26)
+        )
+        session.commit()
+
+
+def test_export_revenues_csv(api, monkeypatch):
+    monkeypatch.setattr(exports.settings, "EXPORT_BATCH_SIZE", 10)
+    response = api.get("/api/exports/revenues", params={"date_from": "2024-01-05"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="revenues.csv"' in response.headers["content-disposition"]
+
+    rows = list(csv.reader(io.StringIO(response.content.decode("utf-8-sig"))))
+    assert rows[0] == ["수입일", "계약번호", "금액", "수입유형", "상태", "비고"]
+    assert len(rows) == 1 + 21
+    assert rows[1] == ["2024-01-05", "CONT-001", "5000.00", "transfer", "pending", "기성금"]
+
+
+def test_export_contracts_xlsx(api):
+    response = api.get("/api/exports/contracts", params={"format": "xlsx"})
+    assert response.status_code == 200
+    sheet = load_workbook(io.BytesIO(response.content), read_only=True).active
+    rows = list(sheet.iter_rows(values_only=True))
+    assert rows[0][:3] == ("계약번호", "발주처", "공사명")
+    assert rows[1][:4] == ("CONT-001", "테스트건설", "공사", 1000000)
+
+
+def test_export_unknown_resource(api):
+    assert api.get("/api/exports/transactions").status_code == 404
+    assert api.get("/api/exports/revenues", params={"format": "pdf"}).status_code == 422
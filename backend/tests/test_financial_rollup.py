@@ -0,0 +1,87 @@
+import pytest
+from datetime import date
+from decimal import Decimal
+from sqlalchemy import insert, select
+
+from app.models.contract import Contract
+from app.models.expense import Expense
+from app.models.financial_summary import ContractMonthlySummary
+from app.models.labor_cost import LaborCost
+from app.models.revenue import Revenue
+from app.models.worker import Worker
+from app.services.financial_rollup import check_summaries, rebuild_summaries
+from app.services.statistics import contract_totals_stmt
+
+
+@pytest.fixture
+def worker(db_session):
+    worker = Worker(full_name="이영희", hourly_rate=20000)
+    db_session.add(worker)
+    db_session.flush()
+    return worker
+
+
+@pytest.fixture
+def contract(db_session, contract_id):
+    return db_session.get(Contract, contract_id)
+
+
+def _summary(db_session):
+    rows = db_session.scalars(select(ContractMonthlySummary).order_by(ContractMonthlySummary.month))
+    return {r.month: (r.revenue_total, r.revenue_count, r.expense_total, r.labor_cost_total) for r in rows}
+
+
+def test_events_maintain_summary(db_session, contract, worker):
+    revenue = Revenue(contract_id=contract.id, amount=300000, payment_date=date(2024, 1, 10), payment_type="transfer")
+    db_session.add_all([
+        revenue,
+        Revenue(contract_id=contract.id, amount=200000, payment_date=date(2024, 1, 20), payment_type="cash"),
+        Expense(contract_id=contract.id, category="material", amount=150000, expense_date=date(2024, 1, 20)),
+        LaborCost(contract_id=contract.id, worker_id=worker.id, work_date=date(2024, 2, 5),
+                  hours_worked=8, hourly_rate=20000, total_amount=160000),
+    ])
+    db_session.commit()
+    assert _summary(db_session) == {
+        "2024-01": (Decimal("500000.00"), 2, Decimal("150000.00"), Decimal("0.00")),
+        "2024-02": (Decimal("0.00"), 0, Decimal("0.00"), Decimal("160000.00")),
+    }
+
+    # 금액 변경 + 다른 달로 이동
+    revenue.amount = Decimal("350000")
+    revenue.payment_date = date(2024, 2, 1)
+    db_session.commit()
+    assert _summary(db_session)["2024-02"][:2] == (Decimal("350000.00"), 1)
+    assert _summary(db_session)["2024-01"][:2] == (Decimal("200000.00"), 1)
+
+    # 모든 건수가 0이 된 (계약, 월) 행은 삭제
+    for labor in db_session.scalars(select(LaborCost)):
+        db_session.delete(labor)
+    db_session.delete(revenue)
+    db_session.commit()
+    assert list(_summary(db_session)) == ["2024-01"]
+    assert check_summaries(db_session) == []
+
+
+def test_check_and_rebuild(db_session, contract):
+    db_session.add(Revenue(contract_id=contract.id, amount=100000, payment_date=date(2024, 3, 1),
+                           payment_type="cash"))
+    db_session.commit()
+    # ORM 이벤트를 거치지 않는 일괄 INSERT는 집계 테이블에 반영되지 않음
+    db_session.execute(insert(Expense), [
+        {"contract_id": contract.id, "category": "equipment", "amount": 40000, "expense_date": date(2024, 3, 2)},
+    ])
+    db_session.commit()
+
+    mismatches = check_summaries(db_session)
+    assert [(m.month, m.field, m.expected, m.actual) for m in mismatches] == [
+        ("2024-03", "expense_total", Decimal("40000.00"), Decimal("0.00")),
+        ("2024-03", "expense_count", Decimal(1), Decimal(0)),
+    ]
+
+    assert rebuild_summaries(db_session) == 1
+    assert check_summaries(db_session) == []
+
+    totals = db_session.execute(contract_totals_stmt(contract.id, month_from="2024-03")).mappings().one()
+    assert (totals["revenue"], totals["expense"], totals["profit"]) == (
+        Decimal("100000.00"), Decimal("40000.00"), Decimal("60000.00")
+    )
@@ -0,0 +1,114 @@
+import io
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from docx import Document as WordDocument
+
+from app.api import jobs as jobs_api
+from app.models.job import Job
+from app.services import jobs
+
+ROUTERS = {"/api/jobs": jobs_api.router}
+
+
+def _runner(session_factory, db_url, tmp_path, **kwargs):
+    return jobs.JobRunner(session_factory, db_url, tmp_path / "generated", workers=1, poll_interval=0.05,
+                          retry_delay=0, **kwargs)
+
+
+def _wait_for(session_factory, job_id, statuses=("succeeded", "failed"), timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with session_factory() as db:
+            job = db.get(Job, job_id)
+            if job.status in statuses:
+                return job
+        time.sleep(0.05)
+    raise AssertionError(f"작업이 {timeout}초 안에 끝나지 않았습니다.")
+
+
+def test_contract_document_job_in_worker_process(api, session_factory, db_url, contract_id, tmp_path, monkeypatch):
+    runner = _runner(session_factory, db_url, tmp_path)
+    monkeypatch.setattr(jobs, "job_runner", runner)
+    runner.start()
+    try:
+        created = api.post("/api/jobs/contract-documents", json={"contract_id": str(contract_id)})
+        assert created.status_code == 202
+        job_id = created.json()["id"]
+        assert created.json()["status"] in ("queued", "running")  # 디스패처가 바로 가져갈 수 있음
+
+        _wait_for(session_factory, uuid.UUID(job_id))
+        job = api.get(f"/api/jobs/{job_id}").json()
+        assert (job["status"], job["attempts"], job["result_name"]) == ("succeeded", 1, "계약서_CONT-001.docx")
+
+        download = api.get(f"/api/jobs/{job_id}/download")
+        assert download.status_code == 200
+        text = "\n".join(cell.text for table in WordDocument(io.BytesIO(download.content)).tables
+                         for row in table.rows for cell in row.cells)
+        assert "CONT-001" in text and "1,000,000원" in text
+    finally:
+        runner.stop()
+
+    assert api.post("/api/jobs/contract-documents",
+                    json={"contract_id": str(uuid.uuid4())}).status_code == 404
+
+
+def test_failed_job_is_retried_then_marked_failed(session_factory, db_url, tmp_path, monkeypatch):
+    calls = {"flaky": 0}
+
+    def flaky(db, params, output_dir):
+        calls["flaky"] += 1
+        if calls["flaky"] == 1:
+            raise RuntimeError("일시적 오류")
+        return jobs.GeneratedFile("/tmp/result.txt", "result.txt", "text/plain")
+
+    def broken(db, params, output_dir):
+        raise ValueError("항상 실패")
+
+    monkeypatch.setitem(jobs.JOB_HANDLERS, "flaky", flaky)
+    monkeypatch.setitem(jobs.JOB_HANDLERS, "broken", broken)
+    with session_factory() as db:
+        flaky_job, broken_job = Job(kind="flaky", max_attempts=3), Job(kind="broken", max_attempts=2)
+        db.add_all([flaky_job, broken_job])
+        db.commit()
+
+    runner = _runner(session_factory, db_url, tmp_path, executor_factory=lambda: ThreadPoolExecutor(1))
+    runner.start()
+    try:
+        done = _wait_for(session_factory, flaky_job.id)
+        assert (done.status, done.attempts, done.result_name) == ("succeeded", 2, "result.txt")
+        failed = _wait_for(session_factory, broken_job.id)
+        assert (failed.status, failed.attempts, failed.error) == ("failed", 2, "ValueError: 항상 실패")
+    finally:
+        runner.stop()
+
+
+def test_recover_requeues_only_expired_leases(session_factory, db_url, tmp_path):
+    now = datetime.utcnow()
+    with session_factory() as db:
+        live = Job(kind="contract_document", status="running", attempts=1, claimed_by="other",
+                   lease_expires_at=now + timedelta(minutes=1))
+        expired = Job(kind="contract_document", status="running", attempts=1, claimed_by="crashed",
+                      lease_expires_at=now - timedelta(seconds=1))
+        db.add_all([live, expired])
+        db.commit()
+
+    # 다른 프로세스가 실행 중인(임대가 유효한) 작업은 그대로 두고 만료된 작업만 대기 상태로
+    _runner(session_factory, db_url, tmp_path)._recover()
+    with session_factory() as db:
+        assert (db.get(Job, live.id).status, db.get(Job, live.id).claimed_by) == ("running", "other")
+        assert (db.get(Job, expired.id).status, db.get(Job, expired.id).claimed_by) == ("queued", None)
+
+
+def test_retry_endpoint_requeues_failed_job(api, session_factory):
+    with session_factory() as db:
+        job = Job(kind="contract_document", status="failed", attempts=3, error="오류")
+        db.add(job)
+        db.commit()
+
+    assert api.get(f"/api/jobs/{job.id}/download").status_code == 409
+    retried = api.post(f"/api/jobs/{job.id}/retry")
+    assert retried.status_code == 200
+    assert (retried.json()["status"], retried.json()["attempts"], retried.json()["error"]) == ("queued", 0, None)
+    assert api.post(f"/api/jobs/{job.id}/retry").status_code == 409
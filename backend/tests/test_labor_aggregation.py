@@ -0,0 +1,63 @@
+from datetime import date
+from decimal import Decimal
+import pytest
+
+from app.models.contract import Contract
+from app.models.labor_cost import LaborCost
+from app.models.worker import Worker
+from app.services.labor_aggregation import aggregate_labor
+
+
+@pytest.fixture
+def labor(db_session, contract_id):
+    kim = Worker(full_name="김목수", hourly_rate=Decimal("20000.50"))
+    lee = Worker(full_name="이미장", hourly_rate=15000)
+    db_session.add_all([kim, lee])
+    db_session.flush()
+    contract = db_session.get(Contract, contract_id)
+
+    def row(worker, day, hours, total):
+        return LaborCost(contract_id=contract.id, worker_id=worker.id, work_date=day, hours_worked=hours,
+                         hourly_rate=worker.hourly_rate, total_amount=total)
+
+    wrong = row(lee, date(2024, 1, 8), Decimal("4"), Decimal("61000"))  # 4 × 15000 = 60000
+    db_session.add_all([
+        row(kim, date(2024, 1, 1), Decimal("8"), Decimal("160004.00")),   # 월요일
+        row(kim, date(2024, 1, 7), Decimal("7.5"), Decimal("150003.75")),  # 같은 주 일요일
+        row(lee, date(2024, 1, 2), Decimal("8"), Decimal("120000")),
+        wrong,
+    ])
+    db_session.commit()
+    return {"kim": kim, "lee": lee, "contract": contract, "wrong": wrong}
+
+
+def test_weekly_totals_and_verification(db_session, labor):
+    result = aggregate_labor(db_session, "week")
+
+    assert (result.rows, result.hours, result.amount) == (4, Decimal("27.50"), Decimal("491007.75"))
+    assert [(w.full_name, w.days, w.hours, w.amount) for w in result.by_worker] == [
+        ("김목수", 2, Decimal("15.50"), Decimal("310007.75")),
+        ("이미장", 2, Decimal("12.00"), Decimal("181000.00")),
+    ]
+    assert [(c.contract_id, c.amount) for c in result.by_contract] == [
+        (labor["contract"].id, Decimal("491007.75"))
+    ]
+    assert [(p.period_start, p.days, p.amount) for p in result.by_period] == [
+        (date(2024, 1, 1), 3, Decimal("430007.75")),
+        (date(2024, 1, 8), 1, Decimal("61000.00")),
+    ]
+    assert result.mismatch_count == 1
+    mismatch = result.mismatches[0]
+    assert (mismatch.labor_cost_id, mismatch.stored, mismatch.expected) == (
+        labor["wrong"].id, Decimal("61000.00"), Decimal("60000.00")
+    )
+
+
+def test_monthly_totals_with_filters(db_session, labor):
+    result = aggregate_labor(db_session, "month", worker_id=labor["kim"].id, date_to=date(2024, 1, 6))
+    assert result.rows == 1
+    assert [(p.period_start, p.amount) for p in result.by_period] == [(date(2024, 1, 1), Decimal("160004.00"))]
+    assert result.mismatch_count == 0
+
+    empty = aggregate_labor(db_session, "week", date_from=date(2025, 1, 1))
+    assert (empty.rows, empty.amount, empty.by_worker) == (0, Decimal("0.00"), [])
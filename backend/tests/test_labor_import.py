@@ -0,0 +1,117 @@
+import io
+import json
+from datetime import date
+from decimal import Decimal
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from openpyxl import Workbook
+from sqlalchemy import func, select
+
+from app.api import labor_costs
+from app.db.database import get_db
+from app.models.labor_cost import LaborCost
+from app.models.worker import Worker
+from app.services.financial_rollup import check_summaries
+from app.services.labor_import import import_labor_costs, read_rows, resolve_columns, run_labor_import
+
+CSV = """작업일,작업자,계약번호,작업시간,시급
+2024-01-02,900101-1234567,CONT-001,8,
+2024-01-03,이미장,CONT-001,7.5,16000
+2024-01-04,없는사람,CONT-001,8,
+2024-02-01,이미장,CONT-001,8,
+,,,,
+2024-13-01,이미장,CONT-001,8,
+2024-02-02,이미장,CONT-999,8,
+"""
+
+
+@pytest.fixture(autouse=True)
+def workers(session_factory, contract_id):
+    with session_factory() as db:
+        db.add_all([
+            Worker(full_name="김목수", id_number="900101-1234567", hourly_rate=20000),
+            Worker(full_name="이미장", hourly_rate=15000),
+        ])
+        db.commit()
+
+
+def test_import_csv_in_chunks(session_factory):
+    db = session_factory()
+    rows = read_rows(io.BytesIO(CSV.encode("utf-8-sig")), "작업일지.csv")
+    columns = resolve_columns(next(rows))
+    progress = list(run_labor_import(db, rows, columns, chunk_size=2))
+
+    assert [(p.processed, p.inserted, p.done) for p in progress] == [(2, 2, False), (6, 3, True)]
+    final = progress[-1]
+    assert final.error_count == 3
+    assert [(e.row, e.detail.split(":")[0]) for e in final.errors] == [
+        (4, "작업자를 찾을 수 없습니다"),
+        (7, "작업일 형식이 올바르지 않습니다"),
+        (8, "계약을 찾을 수 없습니다"),
+    ]
+    amounts = db.scalars(select(LaborCost.total_amount).order_by(LaborCost.work_date)).all()
+    assert amounts == [Decimal("160000.00"), Decimal("120000.00"), Decimal("120000.00")]
+    # 일괄 INSERT에서도 계약·월별 집계 테이블이 함께 갱신됨
+    assert check_summaries(db) == []
+    db.close()
+
+
+def test_import_rejects_non_finite_and_oversized_numbers(session_factory):
+    db = session_factory()
+    csv = "작업일,작업자,계약번호,작업시간,시급\n2024-01-02,이미장,CONT-001,NaN,\n" \
+          "2024-01-03,이미장,CONT-001,8,Infinity\n2024-01-04,이미장,CONT-001,8,1e30\n" \
+          "2024-01-05,이미장,CONT-001,8,\n"
+    rows = read_rows(io.BytesIO(csv.encode()), "작업일지.csv")
+    final = list(run_labor_import(db, rows, resolve_columns(next(rows)), chunk_size=2))[-1]
+
+    # 숫자가 아니거나 컬럼 범위를 넘는 값은 해당 행 오류로만 기록되고 나머지 행은 계속 가져옴
+    assert (final.processed, final.inserted, final.done) == (4, 1, True)
+    assert [(e.row, e.detail.split(":")[0]) for e in final.errors] == [
+        (2, "작업시간/시급은 숫자여야 합니다."),
+        (3, "작업시간/시급은 숫자여야 합니다."),
+        (4, "시급은 99,999,999.99 이하여야 합니다"),
+    ]
+    db.close()
+
+
+def test_import_xlsx_endpoint_streams_progress(session_factory):
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(["work_date", "worker", "contract_number", "hours_worked"])
+    for day in range(1, 6):
+        sheet.append([date(2024, 3, day), "김목수", "CONT-001", 8])
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(labor_costs.router, prefix="/api/labor-costs")
+    app.dependency_overrides[get_db] = override_get_db
+    with TestClient(app) as client:
+        files = {"file": ("worklog.xlsx", buffer.getvalue())}
+        response = client.post("/api/labor-costs/import?chunk_size=2", files=files)
+        assert response.status_code == 200
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [(l["inserted"], l["done"]) for l in lines] == [(2, False), (4, False), (5, True)]
+
+        bad = client.post("/api/labor-costs/import", files={"file": ("worklog.csv", b"a,b\n1,2\n")})
+        assert bad.status_code == 400
+        assert "필수 컬럼" in bad.json()["detail"]
+
+    db = session_factory()
+    assert db.scalar(select(func.count()).select_from(LaborCost)) == 5
+    db.close()
+
+
+def test_import_labor_costs_returns_final_result(session_factory):
+    db = session_factory()
+    result = import_labor_costs(db, io.BytesIO(CSV.encode()), "log.csv", chunk_size=100)
+    assert (result.processed, result.inserted, result.error_count, result.done) == (6, 3, 3, True)
+    db.close()
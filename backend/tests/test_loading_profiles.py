@@ -0,0 +1,129 @@
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import sessionmaker
+
+from app.api import contracts
+from app.db.loading import UnknownLoadingProfile, loading_options
+from app.models.client import Client
+from app.models.contract import Contract
+from app.models.document import Document
+from app.models.expense import Expense
+from app.models.labor_cost import LaborCost
+from app.models.revenue import Revenue
+from app.models.user import User
+from app.models.worker import Worker
+from backend import crud, models, schemas
+from backend.database import Base as FlatBase
+
+
+ROUTERS = {"/api/contracts": contracts.router}
+
+
+def _add_contracts(session_factory, count, children):
+    """계약 count건과 계약마다 문서·노무비·수입·지출 children건씩 추가"""
+    with session_factory() as session:
+        client = Client(company_name="테스트건설")
+        user = User(email=f"user{datetime.now().timestamp()}@example.com", password_hash="x",
+                    full_name="김철수", role="admin")
+        worker = Worker(full_name="이영희", hourly_rate=Decimal("15000"))
+        session.add_all([client, user, worker])
+        session.flush()
+        ids = []
+        for i in range(count):
+            contract = Contract(contract_number=f"C-{client.id.hex[:8]}-{i}", client_id=client.id,
+                                project_name="공사", contract_amount=1, start_date=date(2024, 1, 1),
+                                status="active", contract_type="construction", created_by=user.id)
+            session.add(contract)
+            session.flush()
+            ids.append(contract.id)
+            for j in range(children):
+                day = date(2024, 1, 1) + timedelta(days=j)
+                session.add_all([
+                    Document(contract_id=contract.id, document_type="report", file_name=f"{j}.pdf",
+                             file_path=f"/tmp/{j}.pdf", file_size=1, mime_type="application/pdf",
+                             uploaded_by=user.id),
+                    LaborCost(contract_id=contract.id, worker_id=worker.id, work_date=day, hours_worked=8,
+                              hourly_rate=15000, total_amount=120000, payment_status="paid"),
+                    Revenue(contract_id=contract.id, amount=100, payment_date=day, payment_type="transfer",
+                            status="received"),
+                    Expense(contract_id=contract.id, category="material", amount=50, expense_date=day,
+                            payment_status="paid"),
+                ])
+        session.commit()
+    return ids
+
+
+def test_contract_endpoints_use_constant_queries(api, session_factory, async_engine, count_queries):
+    small = _add_contracts(session_factory, 1, 1)[0]
+    assert api.get("/api/contracts/").status_code == 200  # 첫 연결 초기화 쿼리 제외
+
+    def measure(url, headers=None):
+        with count_queries(async_engine) as counter:
+            response = api.get(url, headers=headers)
+        assert response.status_code == (304 if headers else 200), response.text
+        return counter.count, response
+
+    urls = {
+        "list": "/api/contracts/",
+        "detail": "/api/contracts/{id}",
+        "financial": "/api/contracts/{id}?profile=financial",
+    }
+    before = {name: measure(url.format(id=small))[0] for name, url in urls.items()}
+
+    large = _add_contracts(session_factory, 20, 5)[0]
+    after, revalidated = {}, {}
+    for name, url in urls.items():
+        after[name], response = measure(url.format(id=large))
+        revalidated[name], _ = measure(url.format(id=large), {"If-None-Match": response.headers["ETag"]})
+        body = response.json()
+        if name == "list":
+            assert len(body) == 21 and body[0]["client"]["company_name"] == "테스트건설"
+        elif name == "detail":
+            assert len(body["documents"]) == 5 and body["creator"]["full_name"] == "김철수"
+            assert "labor_costs" not in body
+        else:
+            assert [len(body[key]) for key in ("labor_costs", "revenues", "expenses")] == [5, 5, 5]
+            assert "documents" not in body
+
+    assert after == before
+    # 버전(ETag) 확인 한 번 + 목록·상세는 JOIN 한 번, 문서/내역 목록은 관계마다 SELECT ... IN 한 번
+    assert before == {"list": 2, "detail": 3, "financial": 5}
+    # ETag가 같으면 버전 확인만 하고 304
+    assert revalidated == {"list": 1, "detail": 1, "financial": 1}
+    assert api.get(f"/api/contracts/{large}?profile=unknown").status_code == 422
+
+
+def test_project_profiles_load_relationships_up_front(count_queries, tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'flat.db'}")
+    FlatBase.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    owner = models.User(email="owner@example.com", username="owner", hashed_password="x")
+    db.add(owner)
+    db.flush()
+    start = datetime(2024, 1, 1)
+    for i in range(3):
+        project = models.Project(name=f"프로젝트 {i}", description="", status="active", start_date=start,
+                                 end_date=start, owner_id=owner.id)
+        db.add(project)
+        db.flush()
+        db.add_all(models.Task(name=f"작업 {j}", description="", status="todo", progress=0, start_date=start,
+                               end_date=start, project_id=project.id) for j in range(i * 5))
+    db.commit()
+    project_id = project.id
+    db.expunge_all()
+
+    with count_queries(engine) as counter:
+        detail = schemas.ProjectDetail.model_validate(crud.get_project(db, project_id), from_attributes=True)
+    assert (counter.count, len(detail.tasks), detail.owner.username) == (2, 10, "owner")
+
+    # 목록 프로필은 관계를 읽지 않으며, 실수로 접근하면 쿼리 대신 오류
+    projects = crud.get_projects(db, limit=10)
+    with pytest.raises(InvalidRequestError):
+        projects[0].tasks
+    with pytest.raises(UnknownLoadingProfile):
+        loading_options(models.Project, "financial")
+    db.close()
+    engine.dispose()
@@ -0,0 +1,82 @@
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend import crud, models, schemas
+from backend.database import Base
+from backend.app.core.fieldsets import InvalidFieldsError, parse_fields, sparse_response
+from backend.app.core.pagination import InvalidCursorError, decode_cursor, encode_cursor, next_cursor
+
+engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture
+def db_session():
+    Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=engine)
+
+
+def _seed_projects(db_session, count):
+    base = datetime(2024, 1, 1)
+    for i in range(count):
+        # 같은 created_at 을 가진 행이 섞여 있어도 id로 순서가 결정되어야 함
+        db_session.add(models.Project(
+            name=f"프로젝트 {i}", description="", status="active",
+            start_date=base, end_date=base, created_at=base + timedelta(minutes=i // 3)
+        ))
+    db_session.commit()
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2024, 5, 1, 12, 30)
+    assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, "42")
+
+
+def test_invalid_cursor_raises():
+    with pytest.raises(InvalidCursorError):
+        decode_cursor("not-a-cursor")
+
+
+def test_cursor_pages_match_offset_pages(db_session):
+    _seed_projects(db_session, 25)
+    offset_ids = [p.id for p in crud.get_projects(db_session, skip=0, limit=25)]
+
+    cursor_ids = []
+    cursor = None
+    while True:
+        page = crud.get_projects(db_session, limit=10, cursor=cursor)
+        cursor_ids.extend(p.id for p in page)
+        cursor = next_cursor(page, 10)
+        if cursor is None:
+            break
+
+    assert cursor_ids == offset_ids
+    assert len(set(cursor_ids)) == 25
+
+
+def test_sparse_fields_narrow_select_and_response(db_session, count_queries):
+    _seed_projects(db_session, 5)
+    fields = parse_fields("name,status", schemas.Project, models.Project)
+    assert fields == ("name", "status", "id")
+
+    with count_queries(engine) as counter:
+        page = crud.get_projects(db_session, limit=3, fields=fields)
+    assert "description" not in counter.statements[0]
+    assert next_cursor(page, 3) == encode_cursor(page[-1].created_at, page[-1].id)
+
+    response = sparse_response(page, schemas.Project, fields)
+    assert response.body.decode() == (
+        '[{"name":"프로젝트 0","status":"active","id":1},{"name":"프로젝트 1","status":"active","id":2},'
+        '{"name":"프로젝트 2","status":"active","id":3}]'
+    )
+    with pytest.raises(InvalidFieldsError):
+        parse_fields("name,hashed_password", schemas.Project, models.Project)
+    assert parse_fields(" , ", schemas.Project, models.Project) is None
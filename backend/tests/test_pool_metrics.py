@@ -0,0 +1,28 @@
+from sqlalchemy import create_engine, text
+
+from app.db.pool import TimedQueuePool, instrument_engine, pool_status
+
+
+def test_pool_metrics_track_checkouts_and_churn(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=TimedQueuePool,
+                           pool_size=2, max_overflow=1)
+    metrics = instrument_engine(engine)
+
+    first, second, third = engine.connect(), engine.connect(), engine.connect()
+    status = pool_status(engine, metrics)
+    assert status["checked_out"] == 3
+    assert status["overflow"] == 1
+    assert status["connections_opened"] == 3
+
+    for conn in (first, second, third):
+        conn.execute(text("SELECT 1"))
+        conn.close()
+    status = pool_status(engine, metrics)
+    assert status["checked_out"] == 0
+    assert status["checkouts"] == 3
+    # 풀 크기를 넘는 오버플로 커넥션은 반환 시 닫힘
+    assert status["connections_closed"] == 1
+
+    engine.dispose()
+    engine.connect().close()
+    assert pool_status(engine, metrics)["checkouts"] == 4
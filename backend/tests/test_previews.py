@@ -0,0 +1,50 @@
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from app.models.document import Document
+from app.services.previews import generate_document_preview
+
+
+@pytest.fixture
+def make_document(db_session, seed, contract_id):
+    def make(path, mime_type):
+        documents = [
+            Document(contract_id=contract_id, document_type="photo", file_name=path.name, file_path=str(path),
+                     file_size=path.stat().st_size, mime_type=mime_type, uploaded_by=seed["user_id"],
+                     preview_status="pending")
+            for _ in range(2)  # 같은 파일을 가리키는 문서 두 개
+        ]
+        db_session.add_all(documents)
+        db_session.commit()
+        return documents
+
+    return db_session, make
+
+
+def test_image_preview_is_shared_by_documents_of_same_file(make_document, tmp_path):
+    db, make = make_document
+    source = tmp_path / "site.png"
+    Image.new("RGB", (1600, 800), "orange").save(source)
+    first, second = make(source, "image/png")
+
+    result = generate_document_preview(db, {"document_id": str(first.id)}, tmp_path / "out")
+
+    assert result.path == str(source) + ".preview.jpg"
+    with Image.open(result.path) as preview:
+        assert (preview.format, preview.size) == ("JPEG", (320, 160))
+    for document in (first, second):
+        db.refresh(document)
+        assert (document.preview_status, document.preview_path) == ("ready", result.path)
+
+
+def test_unreadable_file_marks_preview_failed(make_document, tmp_path):
+    db, make = make_document
+    source = tmp_path / "broken.jpg"
+    source.write_bytes(b"not an image")
+    document, _ = make(source, "image/jpeg")
+
+    with pytest.raises(Exception):
+        generate_document_preview(db, {"document_id": str(document.id)}, tmp_path / "out")
+    db.refresh(document)
+    assert document.preview_status == "failed"
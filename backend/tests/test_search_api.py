@@ -0,0 +1,115 @@
+from datetime import date
+import pytest
+from sqlalchemy import delete, func, select
+
+from app.api import contracts as contracts_api, search
+from app.api.contracts import ContractCreate, ContractUpdate
+from app.models.client import Client
+from app.models.contract import Contract
+from app.models.search import SearchEntry, index_terms
+from app.models.user import User
+from app.services.bulk import BulkRequest, apply_bulk
+from app.services.search import fts_query, rebuild_index
+
+
+ROUTERS = {"/api/search": search.router, "/api/contracts": contracts_api.router}
+
+
+@pytest.fixture
+def ids(session_factory):
+    with session_factory() as session:
+        client = Client(company_name="한빛건설", business_number="123-45-67890", representative_name="박영희")
+        user = User(email="kim@example.com", password_hash="x", full_name="김철수", role="admin")
+        session.add_all([client, user])
+        session.flush()
+        contracts = [
+            Contract(contract_number=f"CONT-{i:03d}", client_id=client.id, project_name=name, contract_amount=1,
+                     start_date=date(2024, 1, 1), status="active", contract_type="construction", created_by=user.id)
+            for i, name in enumerate(["서울 사옥 신축공사", "부산 물류창고 보수공사", "신축 아파트 전기공사"])
+        ]
+        session.add_all(contracts)
+        session.commit()
+        return {"client": client.id, "user": user.id, "contracts": [c.id for c in contracts]}
+
+
+def _labels(api, q, **params):
+    response = api.get("/api/search/", params={"q": q, **params})
+    assert response.status_code == 200
+    return [hit["label"] for hit in response.json()]
+
+
+def test_index_terms_and_query():
+    assert index_terms("신축공사 A") == "신축 축공 공사 a"
+    assert fts_query("신축 공사") == '"신축" AND "공사"'
+    assert fts_query("물류창고") == '"물류 류창 창고"'
+    assert fts_query("서") == '"서"*'
+    assert fts_query("-- !") == ""
+    assert fts_query("공사", ("contract",)) == 'entity : (contract) AND {terms extra_terms} : ("공사")'
+
+
+def test_search_matches_korean_words_numbers_and_ranks_label(api, ids):
+
+    # 두 글자 단어, 단어 중간 일치
+    assert set(_labels(api, "신축")) == {"서울 사옥 신축공사", "신축 아파트 전기공사"}
+    assert _labels(api, "물류창고") == ["부산 물류창고 보수공사"]
+    assert _labels(api, "신축 전기") == ["신축 아파트 전기공사"]
+    assert _labels(api, "축사") == []
+    # 사업자번호는 '-' 유무와 관계없이, 대표자 이름으로도 검색
+    assert _labels(api, "1234567890") == ["한빛건설"]
+    assert _labels(api, "45-678") == ["한빛건설"]
+    assert _labels(api, "박영희") == ["한빛건설"]
+    # 계약번호 (부가 정보)
+    assert _labels(api, "cont-001") == ["부산 물류창고 보수공사"]
+
+    hits = api.get("/api/search/", params={"q": "공사", "types": "contract"}).json()
+    assert len(hits) == 3 and all(hit["type"] == "contract" for hit in hits)
+    assert hits == sorted(hits, key=lambda hit: -hit["score"])
+    assert api.get("/api/search/", params={"q": "공사", "types": "vendor"}).status_code == 400
+
+
+def test_index_follows_orm_and_bulk_writes(api, session_factory, ids):
+    with session_factory() as session:
+        contract = session.get(Contract, ids["contracts"][0])
+        contract.project_name = "서울 사옥 리모델링"
+        session.commit()
+    assert _labels(api, "리모델링") == ["서울 사옥 리모델링"]
+    assert _labels(api, "사옥 신축") == []
+
+    with session_factory() as session:
+        session.execute(delete(Contract))
+        session.delete(session.get(Client, ids["client"]))
+        session.commit()
+        # Core DELETE는 이벤트를 거치지 않으므로 rebuild로 맞춤
+        assert rebuild_index(session) == 0
+    assert _labels(api, "공사") == _labels(api, "한빛") == []
+
+    with session_factory() as session:
+        client = Client(company_name="새건설")
+        session.add(client)
+        session.commit()
+        row = {"client_id": str(client.id), "project_name": "대전 교량 보강공사", "contract_amount": 1,
+               "start_date": "2024-01-01", "status": "active", "contract_type": "construction",
+               "created_by": str(ids["user"])}
+        result = apply_bulk(session, Contract, ContractCreate, ContractUpdate,
+                            BulkRequest(create=[{**row, "contract_number": "B-1"}]), 100)
+        assert _labels(api, "교량") == ["대전 교량 보강공사"]
+        contract_id = result.created[0].id
+        apply_bulk(session, Contract, ContractCreate, ContractUpdate,
+                   BulkRequest(update=[{"id": str(contract_id), "project_name": "대전 터널 보강공사"}]), 100)
+        assert _labels(api, "교량") == [] and _labels(api, "터널") == ["대전 터널 보강공사"]
+        apply_bulk(session, Contract, ContractCreate, ContractUpdate, BulkRequest(delete=[str(contract_id)]), 100)
+        assert _labels(api, "터널") == []
+        assert session.scalar(select(func.count()).select_from(SearchEntry)) == 1
+
+
+def test_index_follows_contract_put_and_delete(api, ids):
+    contract_id = ids["contracts"][0]
+    payload = {"contract_number": "CONT-000", "client_id": str(ids["client"]), "project_name": "서울 사옥 리모델링",
+               "contract_amount": "1", "start_date": "2024-01-01", "contract_type": "construction",
+               "created_by": str(ids["user"])}
+    assert api.put(f"/api/contracts/{contract_id}", json=payload).status_code == 200
+    assert _labels(api, "리모델링") == ["서울 사옥 리모델링"]
+    assert _labels(api, "사옥 신축") == []
+
+    assert api.delete(f"/api/contracts/{contract_id}").status_code == 200
+    assert _labels(api, "리모델링") == []
@@ -0,0 +1,98 @@
+from datetime import datetime
+import pytest
+from sqlalchemy import event, select, text
+from sqlalchemy.orm import sessionmaker
+
+from backend import crud, models
+from backend.database import Base
+from backend.app.db.sqlite import RoutingSession, create_sqlite_engine
+from backend.app.services.bulk import BulkRequest
+
+
+def test_pragmas_applied(tmp_path):
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+
+
+def test_writes_routed_to_writer(tmp_path):
+    url = f"sqlite:///{tmp_path / 'app.db'}"
+    engine, writer = create_sqlite_engine(url), create_sqlite_engine(url, writer=True)
+    Base.metadata.create_all(bind=writer)
+    SessionLocal = sessionmaker(class_=RoutingSession, writer_bind=writer, autoflush=False, bind=engine)
+
+    statements = {engine: [], writer: []}
+    for target in statements:
+        def record(conn, cursor, statement, *args, _target=target):
+            statements[_target].append(statement.split()[0])
+        event.listen(target, "before_cursor_execute", record)
+
+    db = SessionLocal()
+    now = datetime(2024, 1, 1)
+    db.add(models.Project(name="현장", description="", status="active", start_date=now, end_date=now))
+    db.commit()
+    assert db.query(models.Project).count() == 1
+    db.close()
+
+    # 드라이버 대신 SQLAlchemy가 트랜잭션마다 BEGIN을 실행
+    assert statements[writer] == ["BEGIN", "INSERT"]
+    assert statements[engine] == ["BEGIN", "SELECT"]
+
+
+def test_transaction_reads_its_own_writes(tmp_path):
+    url = f"sqlite:///{tmp_path / 'app.db'}"
+    engine, writer = create_sqlite_engine(url), create_sqlite_engine(url, writer=True)
+    Base.metadata.create_all(bind=writer)
+    SessionLocal = sessionmaker(class_=RoutingSession, writer_bind=writer, autoflush=False, bind=engine)
+
+    db = SessionLocal()
+    now = datetime(2024, 1, 1)
+    assert db.execute(text("SELECT count(*) FROM projects")).scalar() == 0
+    db.add(models.Project(name="현장", description="", status="active", start_date=now, end_date=now))
+    db.flush()
+    # flush 이후에는 같은 트랜잭션의 읽기도 writer에서 (커밋 전 쓰기가 보임)
+    assert db.execute(text("SELECT count(*) FROM projects")).scalar() == 1
+    db.execute(text("UPDATE projects SET status = 'done'"))
+    assert db.get_bind(clause=text("SELECT 1")) is writer
+    db.rollback()
+
+    # 롤백하면 쓰기가 모두 취소되고 다음 트랜잭션의 읽기는 다시 reader로
+    assert db.get_bind(clause=text("SELECT 1")) is engine
+    assert db.execute(text("SELECT count(*) FROM projects")).scalar() == 0
+    assert db.get_bind(clause=text("DELETE FROM projects")) is writer
+    db.close()
+
+
+def test_bulk_failure_rolls_back_committed_chunks(tmp_path):
+    url = f"sqlite:///{tmp_path / 'app.db'}"
+    engine, writer = create_sqlite_engine(url), create_sqlite_engine(url, writer=True)
+    Base.metadata.create_all(bind=writer)
+    SessionLocal = sessionmaker(class_=RoutingSession, writer_bind=writer, autoflush=False, bind=engine)
+
+    db = SessionLocal()
+    now = datetime(2024, 1, 1)
+    project = models.Project(name="현장", description="", status="active", start_date=now, end_date=now)
+    db.add(project)
+    db.flush()
+    db.add(models.Task(name="기존", description="", status="todo", progress=0, start_date=now, end_date=now,
+                       project_id=project.id))
+    db.commit()
+    task_id = db.scalar(select(models.Task.id))
+
+    @event.listens_for(writer, "before_cursor_execute")
+    def fail_on_delete(conn, cursor, statement, *args):
+        if statement.startswith("DELETE"):
+            raise RuntimeError("중간 실패")
+
+    row = {"description": "", "status": "todo", "progress": 0, "start_date": now.isoformat(),
+           "end_date": now.isoformat(), "project_id": project.id}
+    request = BulkRequest(create=[{**row, "name": "신규 1"}, {**row, "name": "신규 2"}], delete=[task_id])
+    # 청크마다 SAVEPOINT를 RELEASE 해도 바깥 트랜잭션이 끝나기 전에는 확정되지 않음
+    with pytest.raises(RuntimeError):
+        crud.bulk_tasks(db, request, chunk_size=1)
+    db.close()
+
+    with SessionLocal() as check:
+        assert check.scalars(select(models.Task.name)).all() == ["기존"]
@@ -0,0 +1,58 @@
+import uuid
+import pytest
+from datetime import date
+from decimal import Decimal
+
+from app.models.contract import Contract
+from app.models.expense import Expense
+from app.models.labor_cost import LaborCost
+from app.models.revenue import Revenue
+from app.models.worker import Worker
+from app.services.statistics import financial_summary_stmt, profit_loss_stmt
+
+
+@pytest.fixture
+def contract(db_session, contract_id):
+    worker = Worker(full_name="이영희", hourly_rate=20000)
+    db_session.add(worker)
+    db_session.flush()
+    db_session.add_all([
+        Revenue(contract_id=contract_id, amount=300000, payment_date=date(2024, 1, 10), payment_type="transfer"),
+        Revenue(contract_id=contract_id, amount=200000, payment_date=date(2024, 2, 10), payment_type="transfer"),
+        Revenue(contract_id=contract_id, amount=100000, payment_date=date(2024, 4, 1), payment_type="cash"),
+        Expense(contract_id=contract_id, category="material", amount=150000, expense_date=date(2024, 1, 20)),
+        LaborCost(contract_id=contract_id, worker_id=worker.id, work_date=date(2024, 1, 5), hours_worked=8,
+                  hourly_rate=20000, total_amount=160000),
+    ])
+    db_session.commit()
+    return db_session.get(Contract, contract_id)
+
+
+def test_quarterly_summary(db_session, contract):
+    rows = db_session.execute(financial_summary_stmt("quarter")).mappings().all()
+    summary = {(r["period"], r["kind"], r["category"]): (r["total"], r["count"]) for r in rows}
+
+    assert summary == {
+        ("2024-Q1", "expense", "material"): (Decimal("150000.00"), 1),
+        ("2024-Q1", "labor", "labor"): (Decimal("160000.00"), 1),
+        ("2024-Q1", "revenue", "transfer"): (Decimal("500000.00"), 2),
+        ("2024-Q2", "revenue", "cash"): (Decimal("100000.00"), 1),
+    }
+
+
+def test_monthly_summary_with_date_range(db_session, contract):
+    stmt = financial_summary_stmt("month", contract_id=contract.id, date_from=date(2024, 2, 1))
+    rows = db_session.execute(stmt).mappings().all()
+    assert [(r["period"], r["kind"], r["total"]) for r in rows] == [
+        ("2024-02", "revenue", Decimal("200000.00")),
+        ("2024-04", "revenue", Decimal("100000.00")),
+    ]
+
+
+def test_profit_loss(db_session, contract):
+    row = db_session.execute(profit_loss_stmt()).mappings().one()
+    assert row["contract_id"] == contract.id
+    assert (row["revenue"], row["expense"], row["labor_cost"], row["profit"]) == (
+        Decimal("600000.00"), Decimal("150000.00"), Decimal("160000.00"), Decimal("290000.00")
+    )
+    assert db_session.execute(profit_loss_stmt(contract_id=uuid.uuid4())).all() == []
@@ -0,0 +1,119 @@
+import hashlib
+import os
+import uuid
+import pytest
+from sqlalchemy import select
+
+from app.api import uploads
+from app.core.config import settings
+from app.models.blob import Blob
+from app.models.document import Document
+from app.models.job import Job
+from app.services import uploads as upload_service
+from app.services.blob_store import blob_path
+
+CONTENT = os.urandom(300_000)
+
+
+ROUTERS = {"/api/uploads": uploads.router}
+
+
+@pytest.fixture(autouse=True)
+def upload_settings(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path / "uploads"))
+    monkeypatch.setattr(settings, "UPLOAD_CHUNK_SIZE", 64 * 1024)
+
+
+@pytest.fixture
+def ids(seed, contract_id):
+    return {"contract_id": str(contract_id), "uploaded_by": str(seed["user_id"])}
+
+
+def _create(api, ids, **overrides):
+    body = {**ids, "document_type": "contract", "file_name": "도면.pdf", "total_size": len(CONTENT),
+            "sha256": hashlib.sha256(CONTENT).hexdigest(), **overrides}
+    return api.post("/api/uploads/", json=body)
+
+
+def test_resumable_upload_creates_document_on_completion(api, session_factory, ids):
+    created = _create(api, ids)
+    assert created.status_code == 201
+    upload_id = created.json()["id"]
+
+    first = api.patch(f"/api/uploads/{upload_id}", content=CONTENT[:100_000], headers={"Upload-Offset": "0"})
+    assert (first.json()["received_size"], first.json()["document_id"]) == (100_000, None)
+    with session_factory() as session:
+        assert session.scalars(select(Document)).all() == []
+
+    # 재시작 등으로 해시 상태가 사라져도 받은 부분을 다시 읽어 이어서 계산
+    upload_service._hashers.clear()
+    stale = api.patch(f"/api/uploads/{upload_id}", content=CONTENT[:10], headers={"Upload-Offset": "0"})
+    assert (stale.status_code, stale.headers["Upload-Offset"]) == (409, "100000")
+    assert api.get(f"/api/uploads/{upload_id}").headers["Upload-Offset"] == "100000"
+
+    done = api.patch(f"/api/uploads/{upload_id}", content=CONTENT[100_000:], headers={"Upload-Offset": "100000"})
+    assert done.status_code == 200
+    assert (done.json()["status"], done.json()["received_size"]) == ("completed", len(CONTENT))
+    with session_factory() as session:
+        document = session.get(Document, uuid.UUID(done.json()["document_id"]))
+        assert (document.file_name, document.file_size, document.mime_type) == ("도면.pdf", len(CONTENT),
+                                                                                "application/pdf")
+        with open(document.file_path, "rb") as f:
+            assert f.read() == CONTENT
+    assert api.patch(f"/api/uploads/{upload_id}", content=b"x", headers={"Upload-Offset": str(len(CONTENT))}
+                     ).status_code == 409
+
+
+def test_size_limit_and_checksum_are_enforced(api, session_factory, ids):
+    assert _create(api, ids, file_name="virus.exe").status_code == 400
+    assert _create(api, ids, total_size=settings.MAX_FILE_SIZE + 1).status_code == 413
+
+    upload_id = _create(api, ids, total_size=1000, sha256=None).json()["id"]
+
+    def body():
+        # Content-Length 없이 보내는 스트림도 쓰는 동안 크기를 검사
+        for _ in range(3):
+            yield b"a" * 600
+    too_large = api.patch(f"/api/uploads/{upload_id}", content=body(), headers={"Upload-Offset": "0"})
+    assert too_large.status_code == 413
+    # 넘치기 전까지 받은 부분은 저장되어 이어받을 수 있음
+    assert int(too_large.headers["Upload-Offset"]) in (0, 600)
+    assert api.get(f"/api/uploads/{upload_id}").headers["Upload-Offset"] == too_large.headers["Upload-Offset"]
+
+    upload_id = _create(api, ids, sha256="0" * 64).json()["id"]
+    mismatch = api.patch(f"/api/uploads/{upload_id}", content=CONTENT, headers={"Upload-Offset": "0"})
+    assert mismatch.status_code == 422
+    assert api.get(f"/api/uploads/{upload_id}").json()["status"] == "failed"
+    with session_factory() as session:
+        assert session.scalars(select(Document)).all() == []
+
+
+def test_reupload_of_stored_content_completes_without_body(api, session_factory, ids):
+    first = _create(api, ids)
+    api.patch(f"/api/uploads/{first.json()['id']}", content=CONTENT, headers={"Upload-Offset": "0"})
+
+    second = _create(api, ids, file_name="도면-사본.pdf")
+    assert second.status_code == 201
+    assert (second.json()["status"], second.headers["Upload-Offset"]) == ("completed", str(len(CONTENT)))
+
+    with session_factory() as session:
+        documents = session.scalars(select(Document)).all()
+        assert {document.file_name for document in documents} == {"도면.pdf", "도면-사본.pdf"}
+        assert len({document.file_path for document in documents}) == 1
+        blob = session.scalars(select(Blob)).one()
+        assert (blob.sha256, blob.size, blob.ref_count) == (hashlib.sha256(CONTENT).hexdigest(), len(CONTENT), 2)
+        assert documents[0].file_path == str(blob_path(settings.upload_path, blob.sha256))
+
+
+def test_completed_upload_schedules_preview(api, session_factory, ids):
+    pdf = _create(api, ids)
+    api.patch(f"/api/uploads/{pdf.json()['id']}", content=CONTENT, headers={"Upload-Offset": "0"})
+    hwp = _create(api, ids, file_name="계약서.hwp", total_size=3, sha256=None)
+    api.patch(f"/api/uploads/{hwp.json()['id']}", content=b"hwp", headers={"Upload-Offset": "0"})
+
+    with session_factory() as session:
+        documents = {document.file_name: document for document in session.scalars(select(Document))}
+        assert documents["도면.pdf"].preview_status == "pending"
+        assert documents["계약서.hwp"].preview_status == "unsupported"
+        job = session.scalars(select(Job)).one()
+        assert (job.kind, job.params) == ("document_preview", {"document_id": str(documents["도면.pdf"].id)})
@@ -0,0 +1,82 @@
+import dataclasses
+import pytest
+from datetime import timedelta
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend import crud, models
+from backend.auth import AuthenticatedUser, create_access_token, get_current_user, user_cache
+from backend.database import Base
+
+engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture
+def db_session():
+    Base.metadata.create_all(bind=engine)
+    user_cache.clear()
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=engine)
+
+
+def _create_user(db_session):
+    user = models.User(email="kim@example.com", username="kim", hashed_password="x")
+    db_session.add(user)
+    db_session.commit()
+    return crud.get_user_by_email(db_session, "kim@example.com")
+
+
+def test_repeated_token_hits_cache(db_session):
+    _create_user(db_session)
+    token = create_access_token({"sub": "kim@example.com"}, timedelta(minutes=5))
+
+    first = get_current_user(token=token, db=db_session)
+    second = get_current_user(token=token, db=db_session)
+
+    assert first is second
+    assert user_cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+
+def test_user_update_invalidates_cache(db_session):
+    user = _create_user(db_session)
+    token = create_access_token({"sub": "kim@example.com"}, timedelta(minutes=5))
+    get_current_user(token=token, db=db_session)
+
+    user.role = "ADMIN"
+    db_session.commit()
+
+    assert user_cache.stats()["size"] == 0
+    assert get_current_user(token=token, db=db_session).role == "ADMIN"
+
+
+def test_deleted_user_is_rejected(db_session):
+    user = _create_user(db_session)
+    token = create_access_token({"sub": "kim@example.com"}, timedelta(minutes=5))
+    get_current_user(token=token, db=db_session)
+
+    db_session.delete(user)
+    db_session.commit()
+
+    with pytest.raises(HTTPException):
+        get_current_user(token=token, db=db_session)
+
+
+def test_cached_user_is_detached_snapshot(db_session):
+    _create_user(db_session)
+    token = create_access_token({"sub": "kim@example.com"}, timedelta(minutes=5))
+    get_current_user(token=token, db=db_session)
+    db_session.close()
+
+    # 세션이 닫힌 뒤에도 다른 요청이 같은 캐시 항목을 그대로 사용
+    user = get_current_user(token=token, db=TestingSessionLocal())
+    assert isinstance(user, AuthenticatedUser)
+    assert (user.email, user.role, user.is_active) == ("kim@example.com", "USER", True)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        user.role = "ADMIN"
@@ -0,0 +1,101 @@
+import pytest
+from datetime import datetime
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend import crud, models, schemas
+from backend.database import Base
+
+engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+
+@pytest.fixture
+def db_session():
+    Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def statements():
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement.split()[0])
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(engine, "before_cursor_execute", record)
+
+
+def _project():
+    now = datetime(2024, 1, 1)
+    return schemas.ProjectCreate(name="현장", description="", status="active", start_date=now, end_date=now)
+
+
+def _task(project_id):
+    now = datetime(2024, 1, 1)
+    return schemas.TaskCreate(name="골조", description="", status="planned", progress=0.0,
+                              start_date=now, end_date=now, project_id=project_id)
+
+
+def test_create_is_single_insert(db_session, statements):
+    project = crud.create_project(db_session, _project(), owner_id=1)
+    task = crud.create_task(db_session, _task(project.id))
+
+    assert statements == ["INSERT", "INSERT"]
+    assert project.id and project.created_at and task.updated_at
+
+
+def test_update_does_not_refresh(db_session, statements):
+    project = crud.create_project(db_session, _project(), owner_id=1)
+    statements.clear()
+
+    updated = crud.update_project(db_session, project.id, schemas.ProjectUpdate(status="done"))
+
+    # 조회 없이 UPDATE ... RETURNING 한 문장만 실행
+    assert statements == ["UPDATE"]
+    assert updated.status == "done" and updated.updated_at > project.created_at
+
+
+def test_update_missing_row_returns_none(db_session, statements):
+    assert crud.update_task(db_session, 999, schemas.TaskUpdate(progress=50.0)) is None
+    assert statements == ["UPDATE"]
+
+
+def test_delete_without_loading(db_session, statements):
+    project = crud.create_project(db_session, _project(), owner_id=1)
+    task = crud.create_task(db_session, _task(project.id))
+    statements.clear()
+
+    assert crud.delete_project(db_session, project.id)
+    # 하위 태스크의 project_id는 NULL로 (db.delete()와 같은 의미)
+    assert statements == ["UPDATE", "DELETE"]
+    assert db_session.query(models.Task).filter(models.Task.id == task.id).one().project_id is None
+    assert not crud.delete_task(db_session, 999)
+
+
+def test_versions_track_children_and_guard_updates(db_session):
+    project = crud.create_project(db_session, _project(), owner_id=1)
+    task = crud.create_task(db_session, _task(project.id))
+    version = crud.get_project_version(db_session, project.id)
+    list_version = crud.get_tasks_version(db_session, project.id)
+
+    # 하위 작업 삭제는 최근 수정 시각을 바꾸지 않지만 행 수로 버전이 바뀜
+    crud.delete_task(db_session, task.id)
+    assert crud.get_project_version(db_session, project.id) != version
+    assert crud.get_tasks_version(db_session, project.id) != list_version
+    assert crud.get_project_version(db_session, 999) is None
+
+    # 읽은 시점 이후 수정된 행은 수정하지 않음 (If-Match)
+    stale = version[0]
+    assert crud.update_project(db_session, project.id, schemas.ProjectUpdate(status="done")) is not None
+    assert crud.update_project(db_session, project.id, schemas.ProjectUpdate(status="x"), updated_at=stale) is None
+    current = crud.get_project_version(db_session, project.id)[0]
+    assert crud.update_project(db_session, project.id, schemas.ProjectUpdate(status="y"), updated_at=current)